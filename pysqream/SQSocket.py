@@ -94,25 +94,26 @@ class Client:
         ''' Read a specific amount of bytes from a given socket '''
 
         data = bytearray(byte_num)
-        view = memoryview(data)
-        total = 0
+        self.receive_into(memoryview(data), timeout)
+
+        return data
+
+    def receive_into(self, view, timeout=None):
+        ''' Fill a given writable memoryview with bytes read from the socket '''
 
         if timeout:
             self.socket.settimeout(timeout)
 
         while view:
-            # Get whatever the socket gives and put it inside the bytearray
+            # Get whatever the socket gives and put it inside the buffer
             received = self.socket.s.recv_into(view)
             if received == 0:
                 log_and_raise(ConnectionRefusedError, f'SQreamd connection interrupted - 0 returned by socket')
             view = view[received:]
-            total += received
 
         if timeout:
             self.socket.settimeout(None)
 
-        return data
-
     def get_response(self, is_text_msg=True):
         ''' Get answer JSON string from SQream after sending a relevant message '''
         lock = Lock()
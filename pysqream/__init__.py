@@ -1,5 +1,5 @@
 from pysqream.globals import __version__
-from pysqream.pysqream import connect, enable_logs, stop_logs
+from pysqream.pysqream import connect, enable_logs, stop_logs, read_sql
 
 
-__all__ = ["connect", "enable_logs", "stop_logs", "__version__"]
+__all__ = ["connect", "enable_logs", "stop_logs", "read_sql", "__version__"]
@@ -5,7 +5,7 @@ and vice versa
 from __future__ import annotations
 
 from datetime import datetime, date
-from decimal import Decimal, getcontext
+from decimal import Context, Decimal, getcontext, localcontext
 from math import floor, ceil, pow
 
 import numpy as np
@@ -59,6 +59,28 @@ def sq_datetime_to_py_datetime(sqream_datetime, is_null=False, dt_convert_func=d
                                                                      # miliseconds while SQream returns 3.
 
 
+EPOCH_DAY = 719468  # date_to_int(date(1970, 1, 1))
+MS_PER_DAY = 24 * 60 * 60 * 1000
+
+
+def sq_dates_to_numpy(sqream_dates: np.ndarray) -> np.ndarray:
+    """Convert column of SQream dates to datetime64[D] at once
+
+    SQream date is a number of days in proleptic Gregorian calendar
+    (inverse of _get_date_int), so it differs from days since epoch by
+    a constant and the calendar math of sq_date_to_py_date is done by
+    numpy itself
+    """
+    return (sqream_dates.astype(np.int64) - EPOCH_DAY).astype('datetime64[D]')
+
+
+def sq_datetimes_to_numpy(sqream_datetimes: np.ndarray) -> np.ndarray:
+    """Convert column of SQream datetimes (date << 32 | milliseconds of
+    the day) to datetime64[ms] at once"""
+    values = sqream_datetimes.astype(np.int64)
+    return (((values >> 32) - EPOCH_DAY) * MS_PER_DAY + (values & 0xffffffff)).astype('datetime64[ms]')
+
+
 def _get_date_int(year: int, month: int, day: int) -> int:
     """Convert year, month and day to integer compatible with SQREAM"""
     month: int = (month + 9) % 12
@@ -108,6 +130,83 @@ def sq_numeric_to_decimal(bigint_as_bytes: bytes, scale: int, is_null=False) ->
     return Decimal(bigint) * (tenth ** scale)
 
 
+NUMERIC_CONTEXT = Context(prec=38)
+
+
+def _numeric_words(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """View column of SQream NUMERICs (little endian int128) as low
+    (unsigned) and high (signed) 64 bit words"""
+    words = np.frombuffer(data, dtype='<u8').reshape(-1, 2)
+    return words[:, 0], words[:, 1].view(np.int64)
+
+
+def sq_numerics_to_int64(data: bytes) -> np.ndarray | None:
+    """Values of NUMERIC column without scale applied as int64, None if
+    some of them do not fit int64"""
+    low, high = _numeric_words(data)
+    low = low.view(np.int64)
+    # Value fits int64 if high word is only a sign extension of low one
+    if not np.array_equal(high, low >> 63):
+        return None
+    return low
+
+
+def sq_numerics_to_ints(data: bytes) -> list[int]:
+    """Values of NUMERIC column without scale applied as python ints"""
+    fitting = sq_numerics_to_int64(data)
+    if fitting is not None:
+        return fitting.tolist()
+
+    low, high = _numeric_words(data)
+    return [(hi << 64) | lo for hi, lo in zip(high.tolist(), low.tolist())]
+
+
+def sq_numerics_to_float(data: bytes, scale: int) -> np.ndarray:
+    """Values of NUMERIC column as float64"""
+    low, high = _numeric_words(data)
+    low = low.view(np.int64)
+    # Signed low word, so values close to zero do not lose precision
+    return ((high + (low < 0)) * 2.0 ** 64 + low) / 10.0 ** scale
+
+
+def sq_numerics_to_decimals(data: bytes, scale: int) -> list[Decimal]:
+    """Vectorized sq_numeric_to_decimal for whole NUMERIC column, values
+    are assembled by numpy and scale is applied by the same factor"""
+    factor = tenth ** scale
+    with localcontext(NUMERIC_CONTEXT):
+        return [Decimal(value) * factor for value in sq_numerics_to_ints(data)]
+
+
+# Characters stripped from the end of VARCHAR values: what str.rstrip()
+# strips among ASCII characters, and NUL
+VARCHAR_PADDING = b' \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f\x00'
+
+
+def sq_varchars_to_str(data: bytes, size: int, encoding: str) -> list[str]:
+    """Values of fixed size VARCHAR column, decoded and stripped of
+    padding. Buffer is split by numpy, unless it holds NULs which numpy
+    would drop before decoding"""
+    if b'\x00' in data:
+        return [data[idx:idx + size].decode(encoding, "ignore").replace('\x00', '').rstrip()
+                for idx in range(0, len(data), size)]
+    return [val.decode(encoding, "ignore").rstrip() for val in np.frombuffer(data, dtype=f'S{size}').tolist()]
+
+
+def text_offsets(lengths: memoryview) -> np.ndarray:
+    """Offsets of TEXT values in data buffer, accumulated from lengths
+    column: value i is data[offsets[i]:offsets[i + 1]]. Always int64, data
+    of chunk may exceed 2 GiB"""
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(np.frombuffer(lengths, dtype=np.int32), out=offsets[1:])
+    return offsets
+
+
+def sq_texts_to_str(lengths: memoryview, data: bytes) -> list[str]:
+    """Values of TEXT column, sliced by offsets computed by numpy"""
+    offsets = text_offsets(lengths).tolist()
+    return [data[start:end].decode('utf8') for start, end in zip(offsets, offsets[1:])]
+
+
 def decimal_to_sq_numeric(dec: Decimal, scale: int) -> int:  # returns bigint
     if getcontext().prec < 38:
         getcontext().prec = 38
@@ -0,0 +1,167 @@
+"""Fetched chunk of statement result with lazily decoded columns and
+views of its rows, and raw chunk for custom decoding
+
+Used by .cursor.Cursor
+"""
+from __future__ import annotations
+
+import functools
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from pysqream.decode_plan import ColumnPlan
+
+
+class Chunk:
+    """Columns of one fetched chunk, kept as received from SQream
+
+    Column is decoded on first access (by index or by name) and raw data
+    of the column is released then, so columns which are not accessed
+    cost nothing. Chunk keeps decode plan and extractors of the statement
+    it belongs to, so it could be read after the cursor moved on. Chunk
+    and its rows could be shared between threads, column is decoded once.
+    """
+
+    __slots__ = ("num_rows", "plan", "names_map", "_extractors", "_raw_columns", "_columns", "_lock", "__weakref__")
+
+    def __init__(self,
+                 num_rows: int,
+                 plan: List[ColumnPlan],
+                 extractors: List[Callable],
+                 raw_columns: List[Dict[str, Any]],
+                 names_map: Dict[str, int]):
+        self.num_rows = num_rows
+        self.plan = plan
+        self.names_map = names_map
+        self._extractors = extractors
+        self._raw_columns = raw_columns
+        self._columns = [None] * len(plan)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def _index(self, key: Union[int, str]) -> int:
+        return self.names_map[key] if isinstance(key, str) else key
+
+    def column(self, key: Union[int, str]) -> List[Any]:
+        """Values of column by its index or name, decoded on first access"""
+        idx = self._index(key)
+        col = self._columns[idx]
+        if col is None:
+            with self._lock:
+                # Could be decoded by another thread meanwhile
+                col = self._columns[idx]
+                if col is None:
+                    col = self._columns[idx] = self._extractors[idx](self.plan[idx], self._raw_columns[idx])
+                    self._raw_columns[idx] = None
+        return col
+
+    __getitem__ = column
+
+    def is_decoded(self, key: Union[int, str]) -> bool:
+        return self._columns[self._index(key)] is not None
+
+    def row(self, idx: int) -> tuple:
+        """Values of one row, all columns are decoded"""
+        return tuple(self.column(col_idx)[idx] for col_idx in range(len(self.plan)))
+
+    def rows(self) -> List[tuple]:
+        """Values of all rows, all columns are decoded"""
+        return list(zip(*(self.column(col_idx) for col_idx in range(len(self.plan)))))
+
+
+@functools.total_ordering
+class Row:
+    """Row of Chunk, which behaves as tuple of its values
+
+    Keeps only reference to chunk and index of row in it, values are
+    taken from columns of chunk on access (column is decoded on the
+    first access to any of its rows). Besides index, value could be
+    accessed by column name: row['col_name'].
+    """
+
+    __slots__ = ("chunk", "idx")
+
+    def __init__(self, chunk: Chunk, idx: int):
+        self.chunk = chunk
+        self.idx = idx
+
+    def __len__(self) -> int:
+        return len(self.chunk.plan)
+
+    def __getitem__(self, key: Union[int, str, slice]) -> Any:
+        if isinstance(key, slice):
+            return tuple(self)[key]
+        if isinstance(key, str):
+            key = self.chunk.names_map[key]
+        elif key < 0:
+            key += len(self)
+        if not 0 <= key < len(self):
+            raise IndexError("Row index out of range")
+        return self.chunk.column(key)[self.idx]
+
+    def __iter__(self) -> Iterator[Any]:
+        for col_idx in range(len(self)):
+            yield self.chunk.column(col_idx)[self.idx]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (Row, tuple)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, (Row, tuple)):
+            return tuple(self) < tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return repr(tuple(self))
+
+
+class RawColumn:
+    """Buffers of one column of fetched chunk exactly as received from SQream
+
+    Attributes:
+        name: name of column
+        type_tup: SQream type of column, e.g. ['ftInt', 4, 0] or
+          ['ftArray', 'ftInt', 4, 0]
+        data: bytes of data of all rows
+        nulls: byte per row, 1 - null, None for not nullable column
+        lengths: int32 per row, lengths of TEXT values or of ARRAY data,
+          None for other columns
+    """
+
+    __slots__ = ("name", "type_tup", "data", "nulls", "lengths")
+
+    def __init__(self,
+                 name: str,
+                 type_tup: list,
+                 data: memoryview,
+                 nulls: Optional[memoryview] = None,
+                 lengths: Optional[memoryview] = None):
+        self.name = name
+        self.type_tup = type_tup
+        self.data = data
+        self.nulls = nulls
+        self.lengths = lengths
+
+    def __repr__(self) -> str:
+        return f"RawColumn({self.name!r}, {self.type_tup!r}, {self.data.nbytes} bytes)"
+
+
+class RawChunk:
+    """Amount of rows and raw columns of one fetch, see
+    Cursor.iter_raw_chunks()"""
+
+    __slots__ = ("num_rows", "columns")
+
+    def __init__(self, num_rows: int, columns: List[RawColumn]):
+        self.num_rows = num_rows
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return self.num_rows
@@ -0,0 +1,361 @@
+"""Columnar representation of fetched data
+
+Support functions and classes for building NumPy arrays and Arrow
+arrays straight from the buffers received from SQream, without going
+through python rows.
+
+Used by .cursor.Cursor
+"""
+from __future__ import annotations
+
+import codecs
+import functools
+import sys
+from typing import Iterable, Optional
+
+import numpy as np
+
+from pysqream.casting import VARCHAR_PADDING, sq_varchars_to_str, text_offsets
+from pysqream.globals import ARROW
+
+if ARROW:
+    import pyarrow as pa
+    from pysqream.globals import sqream_to_pa
+
+
+def null_mask(nulls: memoryview) -> np.ndarray:
+    """Convert null bytes column received from SQream to boolean mask"""
+    return np.frombuffer(nulls, dtype=np.uint8) == 1
+
+
+def set_nulls(col: list, nulls: Optional[memoryview]) -> list:
+    """Replace values of column extracted at once (regardless of null
+    bytes) by None where null bytes are set"""
+    if nulls is not None:
+        for idx in np.flatnonzero(null_mask(nulls)):
+            col[idx] = None
+    return col
+
+
+def intern_strings(values: list) -> list:
+    """Make equal strings of column (and of other chunks) the same objects"""
+    return [val if val is None else sys.intern(val) for val in values]
+
+
+def objects_to_numpy(values: Iterable, amount: int) -> np.ndarray:
+    """Wrap already extracted python values into numpy array of objects
+
+    np.fromiter is used instead of np.array to prevent numpy from
+    turning lists (ARRAY values) into another dimension
+    """
+    return np.fromiter(values, dtype=object, count=amount)
+
+
+class ColumnBuilder:
+    """Accumulate values (and null mask) of column across fetched chunks
+
+    The first appended portion is kept as is, so result that consists of
+    one chunk is built without copying of the data. Following portions
+    are copied into a storage which capacity grows geometrically, so
+    collecting N rows costs O(N) copies in total.
+    """
+
+    __slots__ = ("dtype", "nullable", "_values", "_mask", "_size", "_owned")
+
+    def __init__(self, dtype: np.dtype, nullable: bool):
+        self.dtype = np.dtype(dtype)
+        self.nullable = nullable
+        self._values = None
+        self._mask = None
+        self._size = 0
+        self._owned = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, values: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        """Add portion of values of column, mask is used only if nullable"""
+        if self._values is None:
+            self._values, self._mask, self._size = values, mask, len(values)
+            return
+
+        required = self._size + len(values)
+        if not self._owned or required > len(self._values):
+            self._grow(max(required, 2 * len(self._values)))
+
+        self._values[self._size:required] = values
+        if self.nullable:
+            self._mask[self._size:required] = mask
+        self._size = required
+
+    def _grow(self, capacity: int) -> None:
+        values = np.empty(capacity, dtype=self.dtype)
+        values[:self._size] = self._values[:self._size]
+        self._values = values
+        if self.nullable:
+            mask = np.zeros(capacity, dtype=np.bool_)
+            mask[:self._size] = self._mask[:self._size]
+            self._mask = mask
+        self._owned = True
+
+    def build(self) -> np.ndarray | np.ma.MaskedArray:
+        """Get collected column, nullable one is returned as masked array"""
+        if self._values is None:
+            values = np.empty(0, dtype=self.dtype)
+            mask = np.zeros(0, dtype=np.bool_)
+        else:
+            values = self._values[:self._size]
+            mask = self._mask[:self._size] if self.nullable else None
+
+        if not self.nullable:
+            return values
+        return np.ma.MaskedArray(values, mask=mask)
+
+
+class ArrayColumnBuilder:
+    """Accumulate ARRAY column across fetched chunks
+
+    Portions of arrays of the same length come as 2-D masked arrays (see
+    arrays_to_2d), while all of them have the same width the result is
+    2-D too. Otherwise result is built of python lists as by ColumnBuilder
+    """
+
+    __slots__ = ("nullable", "_parts", "_size")
+
+    def __init__(self, nullable: bool):
+        self.nullable = nullable
+        self._parts = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, values: np.ndarray, mask: Optional[np.ndarray] = None) -> None:
+        """Add portion of arrays, 2-D or of python lists"""
+        self._parts.append((values, mask))
+        self._size += len(values)
+
+    def build(self) -> np.ndarray | np.ma.MaskedArray:
+        """Get collected column, arrays of nulls are masked as a whole"""
+        widths = {values.shape[1] if values.ndim == 2 else None for values, _ in self._parts}
+        if len(widths) == 1 and None not in widths:
+            return np.ma.concatenate([values for values, _ in self._parts])
+
+        builder = ColumnBuilder(object, self.nullable)
+        for values, mask in self._parts:
+            if values.ndim == 2:
+                values = objects_to_numpy(values.tolist(), len(values))  # masked items turn into None
+                if mask is not None:
+                    values[mask] = None
+            builder.append(values, mask)
+        return builder.build()
+
+
+def _items_index(starts: np.ndarray, sizes: np.ndarray, offsets: np.ndarray, steps: np.ndarray,
+                 item_size: int) -> np.ndarray:
+    """Positions in buffer of items of all arrays: array i has sizes[i]
+    items of item_size bytes from starts[i]. Computed in `steps` (position
+    of every item in all arrays together, arange), which is overwritten"""
+    steps *= item_size
+    steps += np.repeat((starts - offsets[:-1] * item_size).astype(steps.dtype), sizes)
+    return steps
+
+
+def split_fixed_arrays(lengths: memoryview, data: memoryview, item_size: int,
+                       mask: Optional[np.ndarray] = None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split ARRAY column of type with fixed size into offsets of arrays,
+    null mask of items and bytes of items of all arrays together
+
+    Array of N items takes N null bytes, padding up to a multiple of 8 and
+    N values (see Cursor._extract_fixed_array). Sizes of arrays are found
+    as by utils.get_array_size, for all rows at once. Arrays of nulls
+    (by mask) are empty
+    """
+    buf_lens = np.frombuffer(lengths, dtype=np.int32).astype(np.int64)
+    blocks, rest = np.divmod(buf_lens, (item_size + 1) * 8)
+    sizes = blocks * 8 + np.where(rest > 0, (rest - 8) // item_size, 0)
+    if mask is not None:
+        sizes[mask] = 0
+
+    starts = np.cumsum(buf_lens) - buf_lens
+    values_starts = starts + (sizes + 7) // 8 * 8
+
+    offsets = np.zeros(len(sizes) + 1, dtype=np.int64)
+    np.cumsum(sizes, out=offsets[1:])
+    total = int(offsets[-1])
+
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if not total:
+        return offsets, np.zeros(0, dtype=np.bool_), np.zeros(0, dtype=np.uint8)
+
+    # Items are gathered by their positions (4 or 8 bytes per item, not per byte of buffer)
+    index_dtype = np.int32 if len(raw) < 2 ** 31 else np.int64
+    item_mask = raw[_items_index(starts, sizes, offsets, np.arange(total, dtype=index_dtype), 1)] != 0
+    item_rows = np.lib.stride_tricks.as_strided(raw, shape=(len(raw) - item_size + 1, item_size),
+                                                strides=(1, 1), writeable=False)
+    items = item_rows[_items_index(values_starts, sizes, offsets, np.arange(total, dtype=index_dtype), item_size)]
+    return offsets, item_mask, items.reshape(-1)
+
+
+def arrays_to_lists(offsets: np.ndarray, items: np.ndarray, item_mask: np.ndarray,
+                    mask: Optional[np.ndarray] = None) -> list:
+    """Split items into python lists of arrays, nulls are None"""
+    values = items.tolist()
+    for idx in np.flatnonzero(item_mask):
+        values[idx] = None
+    offsets = offsets.tolist()
+    col = [values[start:end] for start, end in zip(offsets, offsets[1:])]
+    if mask is not None:
+        for idx in np.flatnonzero(mask):
+            col[idx] = None
+    return col
+
+
+def arrays_to_2d(offsets: np.ndarray, items: np.ndarray, item_mask: np.ndarray,
+                 mask: Optional[np.ndarray] = None) -> Optional[np.ma.MaskedArray]:
+    """Arrange arrays as rows of 2-D masked array if all of them (except
+    nulls) have the same not zero length, otherwise None"""
+    sizes = np.diff(offsets)
+    valid = sizes if mask is None else sizes[~mask]
+    if not len(valid) or valid[0] == 0 or (valid != valid[0]).any():
+        return None
+
+    width = int(valid[0])
+    if mask is None or not mask.any():
+        return np.ma.MaskedArray(items.reshape(-1, width), mask=item_mask.reshape(-1, width))
+
+    values = np.zeros((len(sizes), width), dtype=items.dtype)
+    values_mask = np.ones((len(sizes), width), dtype=np.bool_)
+    values[~mask] = items.reshape(-1, width)
+    values_mask[~mask] = item_mask.reshape(-1, width)
+    return np.ma.MaskedArray(values, mask=values_mask)
+
+
+def arrow_type(type_tup: list) -> pa.DataType:
+    """Get Arrow type of column by its SQream type description"""
+    if type_tup[0] == 'ftArray':
+        # Type of array is shifted in type_tup: ['ftArray', 'ftInt', 4, 0]
+        return pa.list_(arrow_type(type_tup[1:]))
+    if type_tup[0] == 'ftNumeric':
+        return pa.decimal128(38, type_tup[2])
+    return sqream_to_pa[type_tup[0]]
+
+
+def validity_bitmap(mask: Optional[np.ndarray]) -> Optional[pa.Buffer]:
+    """Convert null mask to Arrow validity bitmap (set bit - not null)"""
+    if mask is None or not mask.any():
+        return None
+    return pa.py_buffer(np.packbits(~mask, bitorder='little'))
+
+
+def fixed_to_arrow(pa_type: pa.DataType, data: memoryview, amount: int,
+                   mask: Optional[np.ndarray] = None) -> pa.Array:
+    """Wrap buffer of data with fixed size as Arrow array without copying
+
+    Suitable for all types which layout in SQream is the same as in
+    Arrow: integers, floating point numbers and NUMERIC (decimal128)
+    """
+    return pa.Array.from_buffers(pa_type, amount, [validity_bitmap(mask), pa.py_buffer(data)])
+
+
+def strings_to_arrow(lengths: memoryview, data: bytes,
+                     mask: Optional[np.ndarray] = None) -> pa.StringArray | pa.LargeStringArray:
+    """Build Arrow string array from TEXT column using its lengths column
+
+    Offsets are accumulated lengths, the data buffer is used as is. Data
+    of 2 GiB and more does not fit int32 offsets of StringArray, so it
+    makes LargeStringArray
+    """
+    offsets = text_offsets(lengths)
+    if offsets[-1] >= 2 ** 31:
+        return pa.LargeStringArray.from_buffers(len(lengths), pa.py_buffer(offsets), pa.py_buffer(data),
+                                                validity_bitmap(mask))
+    return pa.StringArray.from_buffers(len(lengths), pa.py_buffer(offsets.astype(np.int32)),
+                                       pa.py_buffer(data), validity_bitmap(mask))
+
+
+@functools.lru_cache(maxsize=None)
+def ascii_compatible(encoding: str) -> bool:
+    """Check ASCII characters are encoded by the same single bytes"""
+    ascii_chars = bytes(range(128))
+    return codecs.decode(ascii_chars, encoding, "ignore") == ascii_chars.decode('ascii')
+
+
+def varchars_to_arrow(data: bytes, size: int, encoding: str, mask: Optional[np.ndarray] = None) -> pa.StringArray:
+    """Build Arrow string array from fixed size VARCHAR column
+
+    ASCII values are cut off their padding as rows of bytes matrix and
+    the remaining bytes make the data buffer, other values are decoded
+    one by one
+    """
+    if not data.isascii() or not ascii_compatible(encoding):
+        return pa.array(sq_varchars_to_str(data, size, encoding), type=pa.string(), mask=mask)
+
+    chars = np.frombuffer(data, dtype=np.uint8).reshape(-1, size)
+    padding = np.isin(chars, np.frombuffer(VARCHAR_PADDING, dtype=np.uint8))
+    # Value ends after its last character which is not padding
+    ends = np.where(padding.all(axis=1), 0, size - np.argmin(padding[:, ::-1], axis=1))
+    kept = (np.arange(size) < ends[:, None]) & (chars != 0)
+
+    offsets = np.zeros(len(chars) + 1, dtype=np.int32)
+    np.cumsum(kept.sum(axis=1), out=offsets[1:])
+    return pa.StringArray.from_buffers(len(chars), pa.py_buffer(offsets), pa.py_buffer(chars[kept]),
+                                       validity_bitmap(mask))
+
+
+def arrays_to_arrow(pa_type: pa.DataType, offsets: np.ndarray, items: pa.Array,
+                    mask: Optional[np.ndarray] = None) -> pa.ListArray:
+    """Build Arrow list array from offsets of arrays in their items"""
+    return pa.Array.from_buffers(pa_type, len(offsets) - 1,
+                                 [validity_bitmap(mask), pa.py_buffer(offsets.astype(np.int32))],
+                                 children=[items])
+
+
+def dictionary_to_pylist(array: pa.Array) -> list:
+    """Values of Arrow string array as python strings, which are decoded
+    once per distinct value and interned by intern_strings"""
+    encoded = array.dictionary_encode()
+    uniques = intern_strings(encoded.dictionary.to_pylist()) + [None]
+    indices = encoded.indices.fill_null(len(uniques) - 1).to_numpy()
+    return objects_to_numpy(uniques, len(uniques))[indices].tolist()
+
+
+def _pandas_nullable_dtypes(pd) -> dict:
+    """Pandas extension dtypes which keep nulls without casting to object"""
+    return {
+        pa.bool_(): pd.BooleanDtype(),
+        pa.uint8(): pd.UInt8Dtype(),
+        pa.int16(): pd.Int16Dtype(),
+        pa.int32(): pd.Int32Dtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.float32(): pd.Float32Dtype(),
+        pa.float64(): pd.Float64Dtype(),
+    }
+
+
+def arrow_to_pandas(table: pa.Table):
+    """Convert fetched Arrow table to pandas.DataFrame column by column
+
+    Nullable columns of BOOL and numeric types get pandas nullable dtypes
+    (boolean, Int64, ...), not nullable ones keep plain numpy dtypes. TEXT
+    and VARCHAR are string[pyarrow] (category if dictionary encoded), DATE
+    and DATETIME are datetime64[ms]
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel; import of pandas is heavy
+
+    nullable_dtypes = _pandas_nullable_dtypes(pd)
+    string_dtype = pd.StringDtype("pyarrow")
+    columns = {}
+
+    for field, col in zip(table.schema, table.columns):
+        if field.type == pa.date32():
+            col = col.cast(pa.timestamp('ms'))
+
+        if pa.types.is_string(field.type):
+            columns[field.name] = col.to_pandas(types_mapper={field.type: string_dtype}.get)
+        elif field.nullable and field.type in nullable_dtypes:
+            columns[field.name] = col.to_pandas(types_mapper={field.type: nullable_dtypes[field.type]}.get)
+        else:
+            columns[field.name] = col.to_pandas()
+
+    return pd.DataFrame(columns, copy=False)
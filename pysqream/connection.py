@@ -2,11 +2,12 @@ import logging
 
 from pysqream.column_buffer import ColumnBuffer
 from pysqream.SQSocket import SQSocket, Client
-from pysqream.globals import BUFFER_SIZE, FETCH_MANY_DEFAULT, CYTHON
+from pysqream.globals import BUFFER_SIZE, FETCH_MANY_DEFAULT, CYTHON, PREFETCH_DEPTH, PREFETCH_MAX_BYTES, \
+    DECODE_WORKERS, MAX_BUFFERED_BYTES, LAZY_ROWS, FETCH_CHUNK_ROWS, FETCH_CHUNK_BYTES, FETCH_MEMORY_BUDGET, \
+    DICTIONARY_ENCODE, ROW_FACTORY
 from pysqream.logger import *
 import json
 import time
-from queue import Queue, Empty
 from struct import unpack
 import socket
 from pysqream.utils import NotSupportedError, ProgrammingError, InternalError, IntegrityError, OperationalError, DataError, \
@@ -36,10 +37,27 @@ class Connection:
         self.cursors = {}
         # Temporary decision to provide seamless transition to array features
         self.allow_array = kwargs.pop("allow_array", True)
+        # Background fetch of next chunks of result by cursors, see pysqream.prefetch
+        self.prefetch_depth = kwargs.pop("prefetch_depth", PREFETCH_DEPTH)
+        self.prefetch_max_bytes = kwargs.pop("prefetch_max_bytes", PREFETCH_MAX_BYTES)
+        self.max_buffered_bytes = kwargs.pop("max_buffered_bytes", MAX_BUFFERED_BYTES)
+        # Rows are views of fetched chunks, which decode columns on access
+        self.lazy_rows = kwargs.pop("lazy_rows", LAZY_ROWS)
+        # Conversion of fetched columns by SQream type, see pysqream.converters
+        self.converters = kwargs.pop("converters", None) or {}
+        # TEXT / VARCHAR columns with few distinct values, decoded once per value
+        self.dictionary_encode = kwargs.pop("dictionary_encode", DICTIONARY_ENCODE)
+        # Rows as namedtuples, dicts or dataclasses instead of tuples
+        self.row_factory = kwargs.pop("row_factory", ROW_FACTORY)
+        # Threads decoding columns of fetched chunks concurrently
+        self.decode_workers = kwargs.pop("decode_workers", DECODE_WORKERS)
+        # Size of chunks SQream sends on fetch, see Cursor._chunk_size
+        self.fetch_chunk_rows = kwargs.pop("fetch_chunk_rows", FETCH_CHUNK_ROWS)
+        self.fetch_chunk_bytes = kwargs.pop("fetch_chunk_bytes", FETCH_CHUNK_BYTES)
+        self.fetch_memory_budget = kwargs.pop("fetch_memory_budget", FETCH_MEMORY_BUDGET)
 
         self._open_connection(clustered, use_ssl)
 
-        self.unpack_q = Queue()
         if CYTHON:
             # To allow hot swapping for testing
             date_to_int, datetime_to_long, sq_date_to_py_date, sq_datetime_to_py_datetime = pydate_to_int, pydt_to_long, date_to_py, dt_to_py
@@ -47,8 +65,6 @@ class Connection:
         if log is not False:
             raise NotSupportedError("Logs per Connection is not supported yet")
             # start_logging(None if log is True else log)
-        # Thread for unpacking fetched socket data
-        # thread.start_new_thread(self._parse_fetched_cols, (self.unpack_q,))
 
     def __del__(self):
         try:
@@ -175,7 +191,18 @@ class Connection:
             self.clustered,
             self.use_ssl,
             base_connection=False,
-            allow_array=self.allow_array
+            allow_array=self.allow_array,
+            prefetch_depth=self.prefetch_depth,
+            prefetch_max_bytes=self.prefetch_max_bytes,
+            max_buffered_bytes=self.max_buffered_bytes,
+            lazy_rows=self.lazy_rows,
+            converters=self.converters,
+            dictionary_encode=self.dictionary_encode,
+            row_factory=self.row_factory,
+            decode_workers=self.decode_workers,
+            fetch_chunk_rows=self.fetch_chunk_rows,
+            fetch_chunk_bytes=self.fetch_chunk_bytes,
+            fetch_memory_budget=self.fetch_memory_budget
         )  # self is the calling connection instance, so cursor can trace back to pysqream
         conn.connect_database(self.database, self.username, self.password, self.service)
 
@@ -0,0 +1,182 @@
+"""Conversion of fetched columns to values other than default ones
+
+Converter is chosen per SQream type in `Cursor.converters` (inherited
+from `converters` option of connection), either by name of built-in
+converter or as callable. Callable gets raw values of the whole column
+as numpy array and returns sequence of values:
+
+    ftDate     - int32 SQream day numbers
+    ftDateTime - int64 SQream datetimes (day number << 32 | milliseconds)
+    ftNumeric  - python ints, value without applying scale
+    ftBlob     - bytes of TEXT values
+    ftVarchar  - fixed size bytes (numpy `S` dtype), padded by spaces
+    ftArray    - lists, as returned by default
+
+Values of nulls are replaced by None after conversion, whatever converter
+returned for them.
+
+Used by .decode_plan and .cursor.Cursor
+"""
+from __future__ import annotations
+
+import functools
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from pysqream.casting import (EPOCH_DAY,
+                              sq_dates_to_numpy,
+                              sq_datetimes_to_numpy,
+                              sq_numerics_to_float,
+                              sq_numerics_to_int64,
+                              sq_numerics_to_ints,
+                              text_offsets)
+from pysqream.columnar import objects_to_numpy, set_nulls
+from pysqream.logger import log_and_raise
+from pysqream.utils import DataError, ProgrammingError
+
+
+def _raw(col_plan, raw_col_data: Dict[str, Any]) -> List[Any]:
+    return raw_values(col_plan, raw_col_data).tolist()
+
+
+def _date_epoch(col_plan, raw_col_data: Dict[str, Any]) -> List[int]:
+    """Days since 1970-01-01"""
+    return (raw_values(col_plan, raw_col_data).astype(np.int64) - EPOCH_DAY).tolist()
+
+
+def _date_datetime64(col_plan, raw_col_data: Dict[str, Any]) -> List[np.datetime64]:
+    return list(sq_dates_to_numpy(raw_values(col_plan, raw_col_data)))
+
+
+def _datetime_epoch(col_plan, raw_col_data: Dict[str, Any]) -> List[int]:
+    """Milliseconds since 1970-01-01"""
+    return sq_datetimes_to_numpy(raw_values(col_plan, raw_col_data)).astype(np.int64).tolist()
+
+
+def _datetime_datetime64(col_plan, raw_col_data: Dict[str, Any]) -> List[np.datetime64]:
+    return list(sq_datetimes_to_numpy(raw_values(col_plan, raw_col_data)))
+
+
+def _numeric_float(col_plan, raw_col_data: Dict[str, Any]) -> np.ndarray:
+    return sq_numerics_to_float(raw_col_data['data_column'], col_plan.scale)
+
+
+def _numeric_int64(col_plan, raw_col_data: Dict[str, Any]) -> np.ndarray:
+    """Values without scale applied as int64, for NUMERIC of precision up
+    to 18. Values which do not fit int64 are not truncated"""
+    values = sq_numerics_to_int64(raw_col_data['data_column'])
+    if values is None:
+        log_and_raise(DataError, f'Values of NUMERIC column {col_plan.name} do not fit int64 (precision over 18), '
+                                 f'use converter "raw" instead')
+    return values
+
+
+def _numeric_raw(_, raw_col_data: Dict[str, Any]) -> List[int]:
+    """Values without scale applied, taken from int64 when they fit it"""
+    return sq_numerics_to_ints(raw_col_data['data_column'])
+
+
+def _varchar_bytes(col_plan, raw_col_data: Dict[str, Any]) -> List[bytes]:
+    return [val.rstrip() for val in raw_values(col_plan, raw_col_data).tolist()]
+
+
+# Built-in converters by SQream type, None - default conversion
+BUILTIN_CONVERTERS = {
+    'ftDate': {
+        'date': None,
+        'raw': _raw,
+        'epoch': _date_epoch,
+        'datetime64': _date_datetime64,
+    },
+    'ftDateTime': {
+        'datetime': None,
+        'raw': _raw,
+        'epoch': _datetime_epoch,
+        'datetime64': _datetime_datetime64,
+    },
+    'ftNumeric': {
+        'decimal': None,
+        'raw': _numeric_raw,
+        'float': _numeric_float,
+        'int64': _numeric_int64,
+    },
+    'ftBlob': {
+        'str': None,
+        'bytes': _raw,
+    },
+    'ftVarchar': {
+        'str': None,
+        'bytes': _varchar_bytes,
+    },
+    'ftArray': {
+        'list': None,
+    },
+}
+
+
+# Converters which give numpy array with layout of SQream type, so numpy and
+# Arrow results of converted column are built as of that type
+CONVERTED_TYPES = {
+    _numeric_float: 'ftDouble',
+    _numeric_int64: 'ftLong',
+}
+
+
+def _apply_callable(func: Callable[[np.ndarray], Any], col_plan, raw_col_data: Dict[str, Any]) -> Any:
+    return func(raw_values(col_plan, raw_col_data))
+
+
+def resolve_converter(type_name: str,
+                      spec: Union[str, Callable, None]) -> Optional[Callable[[Any, Dict[str, Any]], Any]]:
+    """Get converter function(column plan, raw column data) by its name
+    or by callable(raw values), None - default conversion"""
+
+    if spec is None:
+        return None
+
+    if type_name not in BUILTIN_CONVERTERS:
+        log_and_raise(ProgrammingError, f'Converters are not supported for type {type_name}, '
+                                        f'supported types: {", ".join(BUILTIN_CONVERTERS)}')
+
+    if callable(spec):
+        return functools.partial(_apply_callable, spec)
+
+    if spec not in BUILTIN_CONVERTERS[type_name]:
+        log_and_raise(ProgrammingError, f'Unknown converter "{spec}" for type {type_name}, '
+                                        f'use callable or one of: {", ".join(BUILTIN_CONVERTERS[type_name])}')
+    return BUILTIN_CONVERTERS[type_name][spec]
+
+
+def raw_values(col_plan, raw_col_data: Dict[str, Any]) -> np.ndarray:
+    """Values of column as they are received from SQream, see module
+    docstring. Arrays are extracted by cursor to 'arrays' beforehand"""
+
+    if col_plan.kind == 'array':
+        return raw_col_data['arrays']
+
+    data = raw_col_data['data_column']
+
+    if col_plan.kind == 'nvarchar':
+        offsets = text_offsets(raw_col_data['true_nvarchar']).tolist()
+        return objects_to_numpy((bytes(data[start:end]) for start, end in zip(offsets, offsets[1:])),
+                                len(offsets) - 1)
+
+    if col_plan.type_name == 'ftVarchar':
+        return np.frombuffer(data, dtype=f'S{col_plan.size}')
+
+    if col_plan.type_name == 'ftNumeric':
+        return objects_to_numpy(sq_numerics_to_ints(data), len(data) // 16)
+
+    return np.frombuffer(data, dtype=np.int32 if col_plan.type_name == 'ftDate' else np.int64)
+
+
+def convert_column(col_plan, raw_col_data: Dict[str, Any]) -> List[Any]:
+    """Apply converter of column plan to its data and set nulls"""
+
+    col = col_plan.converter(col_plan, raw_col_data)
+    if isinstance(col, np.ndarray) and col_plan.converter in CONVERTED_TYPES:
+        col = col.tolist()
+    elif not isinstance(col, list):
+        col = list(col)
+    return set_nulls(col, raw_col_data['nullable'] if col_plan.nullable else None)
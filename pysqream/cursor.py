@@ -11,37 +11,69 @@ from __future__ import annotations
 import functools
 import json
 import logging
-import struct
+import mmap
+import warnings
+import weakref
 
-from typing import List, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Any, Union, Dict, Iterator, Optional, Callable
 
-from pysqream.casting import (lengths_to_pairs,
-                              sq_date_to_py_date,
-                              sq_datetime_to_py_datetime,
-                              sq_numeric_to_decimal,
+import numpy as np
+
+from pysqream.casting import (sq_dates_to_numpy,
+                              sq_numerics_to_decimals,
+                              sq_datetimes_to_numpy,
+                              sq_varchars_to_str,
+                              sq_texts_to_str,
                               arr_lengths_to_pairs)
+from pysqream.chunk import Chunk, RawChunk, RawColumn, Row
 from pysqream.column_buffer import ColumnBuffer
-from pysqream.globals import (BUFFER_SIZE,
+from pysqream.converters import convert_column
+from pysqream.decode_plan import ColumnPlan, DecodePlanCache
+from pysqream.columnar import (ArrayColumnBuilder,
+                               ColumnBuilder,
+                               null_mask,
+                               set_nulls,
+                               objects_to_numpy,
+                               arrow_to_pandas,
+                               fixed_to_arrow,
+                               strings_to_arrow,
+                               varchars_to_arrow,
+                               split_fixed_arrays,
+                               arrays_to_lists,
+                               arrays_to_2d,
+                               arrays_to_arrow,
+                               dictionary_to_pylist,
+                               intern_strings)
+from pysqream.globals import (ARROW,
+                              BUFFER_SIZE,
                               ROWS_PER_FLUSH,
                               DEFAULT_CHUNKSIZE,
                               FETCH_MANY_DEFAULT,
                               typecodes,
-                              type_to_letter,
+                              sqream_to_np,
                               BYTES_PER_FLUSH_LIMIT,
                               TEXT_ITEM_SIZE,
-                              CAN_SUPPORT_PARAMETERS)
+                              CAN_SUPPORT_PARAMETERS,
+                              DECODE_PLAN_CACHE_SIZE,
+                              TEMPORAL_CACHE_SIZE)
 from pysqream.logger import log_and_raise, logger, printdbg
 from pysqream.ping import _start_ping_loop, _end_ping_loop
+from pysqream.prefetch import Prefetcher
+from pysqream.receive_pool import ReceiveBufferPool
+from pysqream.temporal_cache import TemporalCache
+from pysqream.row_buffer import RowBuffer
+from pysqream.row_factory import compile_row_factory
+from pysqream.spill import SpillFile
 from pysqream.utils import (NotSupportedError,
                             ProgrammingError,
-                            get_array_size,
+                            DataError,
                             false_generator,
                             ArraysAreDisabled,
                             OperationalError)
 
-
-def _is_null(nullable):
-    return nullable == 1
+if ARROW:
+    import pyarrow as pa
 
 
 class Cursor:
@@ -74,7 +106,8 @@ class Cursor:
         self.rowcount = -1  # DB-API property
         self.more_to_fetch = False
         self.ping_loop = self.conn.ping_loop
-        self.parsed_rows = []
+        self.parsed_rows = RowBuffer()
+        self.parsed_numpy_cols = []
         self.row_size = 0
         self.rows_per_flush = 0
         self.lastrowid = None
@@ -83,6 +116,35 @@ class Cursor:
         self.rows_returned = None
         self.cols = []
         self.capacity = 0
+        self.prefetch_depth = self.conn.prefetch_depth  # 0 - fetch chunks only on demand
+        self.prefetch_max_bytes = self.conn.prefetch_max_bytes
+        # 0 - chunks are never spilled, see _hold_chunk() for chunks kept by lazy rows
+        self.max_buffered_bytes = self.conn.max_buffered_bytes
+        self.spill_file = None
+        self.held_bytes = 0  # bytes of received chunks kept in memory by lazy rows and iter_chunks()
+        self.chunk_held_bytes = 0  # of the last fetched chunk, counted once it is taken by _take_chunk()
+        self.prefetcher = None
+        # Chunks received ahead by prefetcher and the one being decoded
+        self.receive_pool = ReceiveBufferPool(self.prefetch_depth + 2)
+        self.lazy_rows = self.conn.lazy_rows  # rows are Row views of fetched chunk instead of tuples
+        self.decode_workers = self.conn.decode_workers  # 0 - columns are decoded one after another
+        self.decode_executor = None
+        self._decode_executor_workers = 0  # decode_workers the executor was created with
+        self.decode_plans = DecodePlanCache(DECODE_PLAN_CACHE_SIZE)
+        # Dates and datetimes of fetched rows, shared between chunks, see hit_rate of it
+        self.temporal_cache = TemporalCache(TEMPORAL_CACHE_SIZE)
+        self.fetch_chunk_rows = self.conn.fetch_chunk_rows
+        self.fetch_chunk_bytes = self.conn.fetch_chunk_bytes
+        self.fetch_memory_budget = self.conn.fetch_memory_budget
+        self.decode_plan = []
+        self.column_extractors = []
+        # Conversion of columns by SQream type instead of default, see pysqream.converters
+        self.converters = dict(self.conn.converters)
+        # TEXT / VARCHAR columns decoded once per distinct value: True - all of them, or names of columns
+        self.dictionary_encode = self.conn.dictionary_encode
+        # Rows as namedtuples, dicts or dataclasses instead of tuples, see pysqream.row_factory
+        self.row_factory = self.conn.row_factory
+        self.compiled_row_factory = None  # (row_factory, its function for columns of current statement)
 
     def get_statement_type(self):
         return self.statement_type
@@ -90,6 +152,39 @@ class Cursor:
     def get_statement_id(self):
         return self.stmt_id
 
+    def _chunk_size(self, statement: str) -> int:
+        """Amount of rows in chunks of statement result, sent on prepare
+
+        Chosen by fetch options of cursor, in priority:
+            fetch_chunk_rows - fixed amount of rows
+            fetch_chunk_bytes - as much rows as fit into given amount of bytes
+            fetch_memory_budget - adaptive, chunk being consumed and chunks
+                received ahead by prefetch fit into the budget together
+
+        Sizes in bytes are turned into rows by width of the statement result
+        row measured on its previous fetch (or estimated by its columns), so
+        they apply starting from the second execution of a statement.
+
+        Returns:
+            DEFAULT_CHUNKSIZE to let SQream choose the size
+        """
+
+        if self.fetch_chunk_rows > 0:
+            return self.fetch_chunk_rows
+
+        if self.fetch_chunk_bytes > 0:
+            chunk_bytes = self.fetch_chunk_bytes
+        elif self.fetch_memory_budget > 0:
+            chunk_bytes = self.fetch_memory_budget // (self.prefetch_depth + 1)
+        else:
+            return DEFAULT_CHUNKSIZE
+
+        row_width = self.decode_plans.row_width(statement)
+        if not row_width:
+            return DEFAULT_CHUNKSIZE
+
+        return max(1, int(chunk_bytes // row_width))
+
     def _execute_sqream_statement(self,
                                   statement: str,
                                   params: list[Any] | tuple[Any] | None = None,
@@ -114,7 +209,7 @@ class Cursor:
 
         self.stmt_id = json.loads(self.client.send_string('{"getStatementId" : "getStatementId"}'))["statementId"]
         stmt_json = json.dumps({"prepareStatement": statement,
-                                "chunkSize": DEFAULT_CHUNKSIZE,
+                                "chunkSize": self._chunk_size(statement),
                                 "canSupportParams": CAN_SUPPORT_PARAMETERS})
         res = self.client.send_string(stmt_json)
 
@@ -222,12 +317,22 @@ class Cursor:
             # data in `queryTypeOut` means it was a `SELECT` query
             self.statement_type = "SELECT"
             self.result_rows = []
-            self.parsed_rows = []
+            self.parsed_rows = RowBuffer()
+            self.parsed_numpy_cols = []
             self.data_columns = []
             self.unparsed_row_amount = self.parsed_row_amount = 0
 
             self._generate_columns_data_for_parameterized_statement()
 
+            # Resolve layout and extractors of columns once for all fetches of this statement
+            self.decode_plan = self.decode_plans.get(statement, columns_for_output, self.conn.varchar_enc,
+                                                     self.converters)
+            self.column_extractors = [
+                self._extract_converted if col.converter else getattr(self, f'_extract_{col.kind}')
+                for col in self.decode_plan
+            ]
+            self.compiled_row_factory = None
+
         else:
             self.statement_type = "DML"
             self.close_stmt()
@@ -348,7 +453,16 @@ class Cursor:
         self.client.validate_response(self.client.get_response(), '{"putted":"putted"}')
         self.ping_loop = _start_ping_loop(self.client, self.socket)
 
-    def _fetch(self):
+    def _receive_chunk(self):
+        """Request the next chunk of result from SQream. Used by _fetch()
+        directly or through Prefetcher in background thread
+
+        All buffers of chunk are received at once into contiguous buffer
+        from receive_pool
+
+        Returns:
+            Amount of rows and list of memoryviews with received buffers
+        """
 
         # JSON correspondence
         res = self.client.send_string('{"fetch" : "fetch"}')
@@ -356,40 +470,101 @@ class Cursor:
         fetch_meta = json.loads(res)
         num_rows_fetched, column_sizes = fetch_meta['rows'], fetch_meta['colSzs']
         if num_rows_fetched == 0:
-            self.close_stmt()
-            return num_rows_fetched
+            return num_rows_fetched, []
 
         # Get preceding header
         self.client.receive(10)
 
-        # Get data as memoryviews of bytearrays.
-        unsorted_data_columns = [memoryview(self.client.receive(size)) for idx, size in enumerate(column_sizes)]
+        # Get data as memoryviews of single buffer
+        chunk = self.receive_pool.acquire(sum(column_sizes))
+        self.client.receive_into(chunk)
+
+        buffers, offset = [], 0
+        for size in column_sizes:
+            buffers.append(chunk[offset:offset + size])
+            offset += size
+
+        return num_rows_fetched, buffers
+
+    def _hold_chunk(self, buffers: List[memoryview]) -> List[memoryview]:
+        """Buffers of chunk which is kept after it is decoded (by lazy rows
+        or by consumer of iter_chunks), spilled to disk if they do not fit
+        into `max_buffered_bytes` with the chunks kept already"""
+
+        nbytes = sum(buf.nbytes for buf in buffers if not isinstance(buf.obj, mmap.mmap))  # not spilled by prefetcher
+        if nbytes and self.held_bytes + nbytes > self.max_buffered_bytes:
+            if self.spill_file is None:
+                self.spill_file = SpillFile()
+            buffers, nbytes = self.spill_file.write(buffers).load(), 0
+        self.chunk_held_bytes = nbytes
+        return buffers
+
+    def _release_held_bytes(self, nbytes: int) -> None:
+        self.held_bytes -= nbytes
+
+    def _holds_chunks(self) -> bool:
+        """Whether fetched rows are Row views which keep their chunks"""
+        return self.lazy_rows and self._make_row() is None
+
+    def _fetch_rows(self) -> int:
+        """_fetch() for row fetch methods (fetchone, fetchmany, fetchall and
+        iteration), chunk is held if rows are lazy views of it"""
+
+        hold = self._holds_chunks()
+        if self.max_buffered_bytes and not self.prefetch_depth and not hold:
+            warnings.warn('max_buffered_bytes does not bound rows decoded into tuples (or by row_factory) by '
+                          'fetchone(), fetchmany(), fetchall() and iteration without prefetch_depth, only chunks '
+                          'kept by lazy_rows or iter_chunks() and prefetched chunks are spilled', stacklevel=3)
+        return self._fetch(hold=hold)
+
+    def _fetch(self, raw=False, hold=False):
+        """Receive the next chunk and sort its buffers into data_columns,
+        `raw` - keep data as received, without copying or casting it,
+        `hold` - chunk is kept after it is decoded, see _hold_chunk()"""
+
+        if self.receive_pool.max_buffers != self.prefetch_depth + 2:
+            # prefetch_depth was changed after cursor was created
+            self.receive_pool.resize(self.prefetch_depth + 2)
+
+        if self.prefetch_depth > 0:
+            if self.prefetcher is None:
+                self.prefetcher = Prefetcher(self._receive_chunk, self.prefetch_depth, self.prefetch_max_bytes,
+                                             self.max_buffered_bytes)
+                self.prefetcher.start()
+            num_rows_fetched, unsorted_data_columns = self.prefetcher.get()
+        else:
+            num_rows_fetched, unsorted_data_columns = self._receive_chunk()
 
-        # Sort by columns, taking a memoryview and casting to the proper type
+        if num_rows_fetched == 0:
+            self.close_stmt()
+            return num_rows_fetched
+
+        if hold and self.max_buffered_bytes:
+            unsorted_data_columns = self._hold_chunk(unsorted_data_columns)
+
+        # Measured width of rows sizes chunks of the next execution of statement
+        self.decode_plans.observe_row_width(
+            self.latest_stmt, sum(buf.nbytes for buf in unsorted_data_columns) / num_rows_fetched)
+
+        # Sort by columns according to decode plan, taking a memoryview and casting to the proper type
         self.data_columns = []
+        buffers = iter(unsorted_data_columns)
 
-        for type_tup, nullable, tvc in zip(self.col_type_tups, self.col_nul,
-                                           self.col_tvc):
+        for col_plan in self.decode_plan:
             column = {'nullable': False, 'true_nvarchar': False}
 
-            is_array = 'ftArray' in type_tup
+            if col_plan.nullable:
+                column['nullable'] = next(buffers)
+            if col_plan.lengths:
+                column[col_plan.lengths] = next(buffers).cast('i')
 
-            if nullable:
-                column['nullable'] = unsorted_data_columns.pop(0)
-            if is_array:
-                column['array_lengths'] = unsorted_data_columns\
-                    .pop(0).cast('i')
-            elif tvc:
-                column['true_nvarchar'] = unsorted_data_columns\
-                    .pop(0).cast('i')
+            column['data_column'] = next(buffers)
 
-            column['data_column'] = unsorted_data_columns.pop(0)
-
-            if type_tup[0] in ('ftVarchar', 'ftBlob', 'ftNumeric'):
-                column['data_column'] = column['data_column'].tobytes()
-            elif not is_array:
-                column['data_column'] = column['data_column'].cast(
-                    type_to_letter[type_tup[0]])
+            if not raw:
+                if col_plan.as_bytes:
+                    column['data_column'] = column['data_column'].tobytes()
+                elif col_plan.cast:
+                    column['data_column'] = column['data_column'].cast(col_plan.cast)
 
             self.data_columns.append(column)
 
@@ -400,41 +575,215 @@ class Cursor:
     def _parse_fetched_cols(self):
         """Used by _fetch_and_parse"""
 
-        self.extracted_cols = []
+        self.extracted_cols = self._map_columns(self._extract_column)
+        return self.extracted_cols
+
+    def _parse_fetched_cols_numpy(self):
+        """Used by _fetch_numpy. Same as _parse_fetched_cols, but
+        every column is a pair of numpy arrays: values and null mask (None
+        for not nullable column)"""
+
+        return self._map_columns(self._extract_numpy_column)
+
+    def _parse_fetched_cols_arrow(self):
+        """Used by _iter_record_batches. Same as _parse_fetched_cols, but
+        every column is an Arrow array"""
+
+        return self._map_columns(self._extract_arrow_column)
+
+    def _map_columns(self, extract):
+        """Apply extract(idx, raw_col_data) to every fetched column and
+        release the raw data buffers
+
+        Columns are extracted concurrently by thread pool if
+        `decode_workers` is set. It pays off for wide results and for
+        extractors based on numpy, which release the GIL
+        """
 
         if not self.data_columns:
-            return self.extracted_cols
+            return []
+
+        if self.decode_workers > 0 and len(self.data_columns) > 1:
+            extracted = list(self._get_decode_executor().map(extract, range(len(self.data_columns)),
+                                                             self.data_columns))
+        else:
+            extracted = [extract(idx, raw_col_data) for idx, raw_col_data in enumerate(self.data_columns)]
+
+        # Done with the raw data buffers
+        self.unparsed_row_amount = 0
+        self.data_columns = []
 
-        for idx, raw_col_data in enumerate(self.data_columns):
+        return extracted
+
+    def _get_decode_executor(self) -> ThreadPoolExecutor:
+        """Thread pool for decoding of columns, recreated if amount of
+        workers was changed"""
+
+        if self.decode_executor is not None and self._decode_executor_workers != self.decode_workers:
+            self._shutdown_decode_executor()
+
+        if self.decode_executor is None:
+            self.decode_executor = ThreadPoolExecutor(max_workers=self.decode_workers,
+                                                      thread_name_prefix="pysqream-decode")
+            self._decode_executor_workers = self.decode_workers
+        return self.decode_executor
+
+    def _shutdown_decode_executor(self) -> None:
+        if self.decode_executor is not None:
+            self.decode_executor.shutdown()
+            self.decode_executor = None
+
+    def _extract_numpy_column(self, idx, raw_col_data):
+        col_plan = self.decode_plan[idx]
+        mask = null_mask(raw_col_data['nullable']) if col_plan.nullable else None
+
+        if col_plan.converter and col_plan.np_dtype is not None:
+            # Converter gives numpy array (NUMERIC as float64 / int64)
+            values = col_plan.converter(col_plan, raw_col_data)
+        elif col_plan.np_dtype is not None:
+            # Fixed size data is wrapped without copying
+            values = np.frombuffer(raw_col_data['data_column'], dtype=col_plan.np_dtype)
+        elif col_plan.np_temporal is not None:
+            values = self._temporal_to_numpy(col_plan, raw_col_data)
+        elif col_plan.item_size and not col_plan.converter:
+            # Arrays of the same length make rows of 2-D array
+            offsets, item_mask, items = self._split_fixed_arrays(col_plan, raw_col_data, mask)
+            items = self._fixed_array_items(col_plan, items)
+            values = arrays_to_2d(offsets, items, item_mask, mask)
+            if values is None:
+                values = objects_to_numpy(arrays_to_lists(offsets, items, item_mask, mask), len(offsets) - 1)
+        else:
+            values = objects_to_numpy(self._extract_column(idx, raw_col_data), self.unparsed_row_amount)
 
-            # Extract data according to column type
-            if self.col_type_tups[idx][0] == "ftArray":
-                col = self._extract_array(idx, raw_col_data)
+        return values, mask
 
-            elif self.col_tvc[idx]:  # nvarchar
-                col = self._extract_nvarchar(idx, raw_col_data)
+    def _extract_arrow_column(self, idx, raw_col_data):
+        col_plan = self.decode_plan[idx]
+        mask = null_mask(raw_col_data['nullable']) if col_plan.nullable else None
 
-            elif self.col_type_tups[idx][0] == "ftVarchar":
-                col = self._extract_varchar(idx, raw_col_data)
+        if col_plan.kind == 'nvarchar' or col_plan.type_name == 'ftVarchar':
+            return self._extract_arrow_strings(col_plan, raw_col_data, mask)
 
-            elif self.col_type_tups[idx][0] == "ftDate":
-                col = self._extract_date(idx, raw_col_data)
+        if col_plan.type_name == 'ftBool':
+            # Arrow keeps booleans as bits, so it can not be wrapped
+            return pa.array(np.frombuffer(raw_col_data['data_column'], dtype=np.bool_), mask=mask)
 
-            elif self.col_type_tups[idx][0] == "ftDateTime":
-                col = self._extract_datetime(idx, raw_col_data)
+        if col_plan.converter and col_plan.np_dtype is not None:
+            return pa.array(col_plan.converter(col_plan, raw_col_data), mask=mask, type=col_plan.pa_type)
 
-            elif self.col_type_tups[idx][0] == "ftNumeric":
-                col = self._extract_numeric(idx, raw_col_data)
-            else:
-                col = self._extract_datatype(idx, raw_col_data)
+        if col_plan.np_dtype is not None or col_plan.type_name == 'ftNumeric':
+            return fixed_to_arrow(col_plan.pa_type, raw_col_data['data_column'], self.unparsed_row_amount, mask)
 
-            self.extracted_cols.append(col)
+        if col_plan.kind in ('date', 'datetime'):
+            return pa.array(self._temporal_to_numpy(col_plan, raw_col_data), mask=mask, type=col_plan.pa_type)
 
-        # Done with the raw data buffers
+        if col_plan.item_size:
+            offsets, item_mask, items = self._split_fixed_arrays(col_plan, raw_col_data, mask)
+            return arrays_to_arrow(col_plan.pa_type, offsets, self._fixed_array_items_arrow(col_plan, items, item_mask),
+                                   mask)
+
+        # Arrow keeps SQream types, so other converters are not applied
+        return pa.array(getattr(self, f'_extract_{col_plan.kind}')(col_plan, raw_col_data), type=col_plan.pa_type)
+
+    def _extract_arrow_strings(self, col_plan, raw_col_data, mask):
+        """TEXT / VARCHAR column as Arrow string array, dictionary encoded
+        if column is chosen by `dictionary_encode`"""
+
+        if col_plan.kind == 'nvarchar':
+            array = strings_to_arrow(raw_col_data['true_nvarchar'], raw_col_data['data_column'], mask)
+            if array.type != pa.string():
+                # Batches share schema of the result, its chunks should be smaller
+                log_and_raise(DataError, f'TEXT column {col_plan.name} takes 2 GiB or more in one chunk, which does '
+                                         f'not fit Arrow string array, set smaller fetch_chunk_rows or '
+                                         f'fetch_chunk_bytes')
+        else:
+            array = varchars_to_arrow(raw_col_data['data_column'], col_plan.size, col_plan.encoding, mask)
+        return array.dictionary_encode() if self._is_dictionary_encoded(col_plan) else array
+
+    def _is_dictionary_encoded(self, col_plan) -> bool:
+        if not self.dictionary_encode or not (col_plan.kind == 'nvarchar' or col_plan.type_name == 'ftVarchar'):
+            return False
+        return self.dictionary_encode is True or col_plan.name in self.dictionary_encode
+
+    @staticmethod
+    def _split_fixed_arrays(col_plan, raw_col_data, mask):
+        return split_fixed_arrays(raw_col_data['array_lengths'], raw_col_data['data_column'], col_plan.item_size, mask)
+
+    @staticmethod
+    def _fixed_array_items(col_plan, items):
+        """Items of ARRAY of type with fixed size converted by numpy from
+        their bytes, NUMERIC items are Decimals"""
+
+        item_type = col_plan.type_tup[1]
+        if item_type == 'ftNumeric':
+            return objects_to_numpy(sq_numerics_to_decimals(items, col_plan.scale), len(items) // 16)
+        if item_type == 'ftDate':
+            return sq_dates_to_numpy(items.view(np.int32))
+        if item_type == 'ftDateTime':
+            return sq_datetimes_to_numpy(items.view(np.int64))
+        return items.view(sqream_to_np[item_type])
+
+    def _fixed_array_items_arrow(self, col_plan, items, item_mask):
+        item_type = col_plan.pa_type.value_type
+        if col_plan.type_tup[1] in ('ftBool', 'ftDate', 'ftDateTime'):
+            return pa.array(self._fixed_array_items(col_plan, items), mask=item_mask, type=item_type)
+        # Layout of numbers (and NUMERIC as decimal128) is the same as in Arrow
+        return fixed_to_arrow(item_type, items, len(item_mask), item_mask)
+
+    @staticmethod
+    def _temporal_to_numpy(col_plan, raw_col_data):
+        """DATE / DATETIME column as numpy datetime64, values of nulls are
+        arbitrary"""
+
+        if col_plan.kind == 'date':
+            return sq_dates_to_numpy(np.frombuffer(raw_col_data['data_column'], dtype=np.int32))
+        return sq_datetimes_to_numpy(np.frombuffer(raw_col_data['data_column'], dtype=np.int64))
+
+    def _extract_column(self, idx, raw_col_data):
+        """Extract data of column to python values according to column type"""
+
+        return self.column_extractors[idx](self.decode_plan[idx], raw_col_data)
+
+    def _take_chunk(self) -> Chunk:
+        """Fetched columns as Chunk, which decodes them on access"""
+
+        chunk = Chunk(self.unparsed_row_amount, self.decode_plan, self.column_extractors,
+                      self.data_columns, self.col_names_map)
+        if self.chunk_held_bytes:
+            # Counted by max_buffered_bytes as long as chunk (or any of its rows) exists
+            self.held_bytes += self.chunk_held_bytes
+            weakref.finalize(chunk, self._release_held_bytes, self.chunk_held_bytes)
+            self.chunk_held_bytes = 0
         self.unparsed_row_amount = 0
         self.data_columns = []
+        return chunk
 
-        return self.extracted_cols
+    def _make_row(self) -> Optional[Callable]:
+        """Function building row of current statement from its values by
+        `row_factory`, made once per statement. None - rows are tuples"""
+
+        if self.row_factory is None:
+            return None
+
+        if self.compiled_row_factory is None or self.compiled_row_factory[0] != self.row_factory:
+            self.compiled_row_factory = (self.row_factory, compile_row_factory(self.row_factory, self.col_names))
+
+        return self.compiled_row_factory[1]
+
+    def _parse_fetched_rows(self) -> list:
+        """Rows of fetched chunk as tuples or made by `row_factory`, or as
+        Row views of Chunk if `lazy_rows` is set (and `row_factory` is not)"""
+
+        if self._holds_chunks():
+            chunk = self._take_chunk()
+            return [Row(chunk, idx) for idx in range(len(chunk))]
+
+        make_row = self._make_row()
+        cols = self._parse_fetched_cols()
+        rows = list(map(make_row, *cols)) if make_row and cols else list(zip(*cols))
+        # Extracted columns may be views of the received chunk, let it be reused
+        self.extracted_cols = []
+        return rows
 
     def _fetch_and_parse(self, requested_row_amount, data_as='rows'):
         """See if this amount of data is available or a fetch from sqream is required
@@ -443,9 +792,10 @@ class Cursor:
 
         if data_as == 'rows':
             while (requested_row_amount > len(self.parsed_rows) or requested_row_amount == -1) and self.more_to_fetch:
-                self.more_to_fetch = bool(self._fetch())  # _fetch() updates self.unparsed_row_amount
+                # _fetch() updates self.unparsed_row_amount
+                self.more_to_fetch = bool(self._fetch_rows())
 
-                self.parsed_rows.extend(zip(*self._parse_fetched_cols()))
+                self.parsed_rows.append(self._parse_fetched_rows())
 
     def execute(self,
                 statement: str,
@@ -552,6 +902,9 @@ class Cursor:
         if self.statement_type not in (None, 'SELECT'):
             log_and_raise(ProgrammingError ,'No open statement while attempting fetch operation')
 
+        if self.parsed_numpy_cols:
+            self._raise_partially_fetched()
+
         if self.more_to_fetch is False:
             # All data from server for this select statement was fetched
             if len(self.parsed_rows) == 0:
@@ -562,8 +915,7 @@ class Cursor:
 
         # Get relevant part of parsed rows and reduce storage and counter
         if data_as == 'rows':
-            res = self.parsed_rows[0:size if size != -1 else None]
-            del self.parsed_rows[:size if size != -1 else None]
+            res = self.parsed_rows.take(size)
 
         if logger.isEnabledFor(logging.INFO):
             logger.info(f'Fetched {size} rows')
@@ -586,6 +938,264 @@ class Cursor:
 
         return self.fetchmany(-1, data_as)
 
+    def _fetch_numpy(self, size: int) -> Dict[str, np.ndarray]:
+        """Collect `size` rows (-1 - all available data) as numpy arrays.
+        Used by fetchmany_numpy() and fetch_numpy()"""
+
+        if self.statement_type not in (None, 'SELECT'):
+            log_and_raise(ProgrammingError, 'No open statement while attempting fetch operation')
+
+        if self.statement_type is None:
+            return {}
+
+        if self.parsed_rows or any(values is None for values, _ in self.parsed_numpy_cols):
+            # Rows left by fetch_into() lack columns it skipped
+            self._raise_partially_fetched()
+
+        builders = [
+            ArrayColumnBuilder(col_plan.nullable) if col_plan.item_size and not col_plan.converter else
+            ColumnBuilder(col_plan.np_dtype or col_plan.np_temporal or object, col_plan.nullable)
+            for col_plan in self.decode_plan
+        ]
+        fetched = 0
+
+        while size == -1 or fetched < size:
+            if not self.parsed_numpy_cols:
+                if not self.more_to_fetch:
+                    break
+                self.more_to_fetch = bool(self._fetch())  # _fetch() updates self.unparsed_row_amount
+                if not self.more_to_fetch:
+                    break
+                self.parsed_numpy_cols = self._parse_fetched_cols_numpy()
+
+            available = len(self.parsed_numpy_cols[0][0])
+            amount = available if size == -1 else min(available, size - fetched)
+
+            for builder, (values, mask) in zip(builders, self.parsed_numpy_cols):
+                builder.append(values[:amount], None if mask is None else mask[:amount])
+
+            if amount < available:
+                self.parsed_numpy_cols = [(values[amount:], None if mask is None else mask[amount:])
+                                          for values, mask in self.parsed_numpy_cols]
+            else:
+                self.parsed_numpy_cols = []
+            fetched += amount
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'Fetched {fetched} rows as numpy arrays')
+
+        return {name: builder.build() for name, builder in zip(self.col_names, builders)}
+
+    def _raise_partially_fetched(self):
+        log_and_raise(ProgrammingError, 'Rows of this statement were already fetched partially by '
+                                        'another fetch method, can not continue with this one')
+
+    def arrow_schema(self) -> pa.Schema:
+        """Arrow schema of result of executed statement"""
+
+        return pa.schema([pa.field(col_plan.name,
+                                   pa.dictionary(pa.int32(), pa.string()) if self._is_dictionary_encoded(col_plan)
+                                   else col_plan.pa_type,
+                                   col_plan.nullable)
+                          for col_plan in self.decode_plan])
+
+    def _iter_record_batches(self, schema) -> Iterator[pa.RecordBatch]:
+        """Generator of record batches, one per chunk fetched from SQream"""
+
+        while self.more_to_fetch:
+            self.more_to_fetch = bool(self._fetch())  # _fetch() updates self.unparsed_row_amount
+            if not self.more_to_fetch:
+                break
+
+            batch = pa.RecordBatch.from_arrays(self._parse_fetched_cols_arrow(), schema=schema)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f'Fetched {batch.num_rows} rows as Arrow record batch')
+            yield batch
+
+    def fetch_record_batches(self) -> Iterator[pa.RecordBatch]:
+        """Fetch result as stream of Arrow record batches
+
+        Every chunk of data received from SQream turns into one
+        pyarrow.RecordBatch. Buffers of numeric columns (except BOOL) are
+        wrapped without copying, TEXT columns are built from their
+        lengths and data buffers.
+        """
+
+        if not ARROW:
+            log_and_raise(NotSupportedError, "Arrow fetch requires pyarrow, to install: pip3 install pyarrow")
+
+        if self.statement_type != 'SELECT':
+            log_and_raise(ProgrammingError, 'No open statement while attempting fetch operation')
+
+        if self.parsed_rows or self.parsed_numpy_cols:
+            self._raise_partially_fetched()
+
+        return self._iter_record_batches(self.arrow_schema())
+
+    def fetch_arrow_table(self) -> pa.Table:
+        """Fetch all result rows as pyarrow.Table, see fetch_record_batches()"""
+
+        batches = self.fetch_record_batches()
+        return pa.Table.from_batches(batches, schema=self.arrow_schema())
+
+    def fetch_df(self):
+        """Fetch all result rows as pandas.DataFrame
+
+        DataFrame is built column by column from fetched data (see
+        fetch_arrow_table()). Nullable numeric and BOOL columns get pandas
+        nullable dtypes (Int64, boolean, ...), TEXT and VARCHAR columns are
+        string[pyarrow], DATE and DATETIME are datetime64[ms]
+        """
+
+        return arrow_to_pandas(self.fetch_arrow_table())
+
+    def __arrow_c_stream__(self, requested_schema=None):
+        """Export result as Arrow C stream (Arrow PyCapsule Interface)
+
+        Allows libraries such as Polars or DuckDB consume the result of
+        executed statement directly, e.g. `polars.DataFrame(cursor)`
+        """
+
+        reader = pa.RecordBatchReader.from_batches(self.arrow_schema(), self.fetch_record_batches())
+        return reader.__arrow_c_stream__(requested_schema)
+
+    def fetchmany_numpy(self, size=None) -> Dict[str, np.ndarray]:
+        """Fetch an amount of result rows as columns
+
+        Returns:
+            A dictionary of column name and numpy array with column data.
+            Columns with fixed size data (BOOL, TINYINT, SMALLINT, INT,
+            BIGINT, REAL, DOUBLE) are built directly from received
+            buffers, others are arrays of python objects. Nullable
+            columns are returned as numpy.ma.MaskedArray where mask
+            marks nulls.
+        """
+
+        return self._fetch_numpy(size or self.arraysize)
+
+    def fetch_numpy(self) -> Dict[str, np.ndarray]:
+        """Fetch all result rows as columns, see fetchmany_numpy()"""
+
+        return self._fetch_numpy(-1)
+
+    def fetch_into(self, buffers: Union[list, dict], masks: Union[list, dict, None] = None) -> int:
+        """Fetch rows into preallocated buffers of columns
+
+        Fixed size data of every fetched chunk is copied straight into
+        the buffers, so nothing but them is allocated per row (DATE and
+        DATETIME are converted to datetime64 on the way).
+
+        Args:
+            buffers: numpy arrays (or writable objects supporting buffer
+              protocol) per column, as list in order of columns or as
+              dictionary by column name, None - column is skipped.
+              Columns of BOOL, TINYINT, SMALLINT, INT, BIGINT, REAL, DOUBLE
+              (dtype could be any dtype they are safely cast to), DATE
+              (datetime64[D]), DATETIME (datetime64[ms]) and NUMERIC with
+              'float' or 'int64' converter are supported
+            masks: boolean arrays (or writable buffers of bytes) per column
+              in the same way, set where value is null. Required for
+              columns which contain nulls
+
+        Returns:
+            Amount of rows written to the beginning of buffers, less than
+            their length only when result is exhausted. Rows which did not
+            fit are returned by the next call. If no column was skipped,
+            they could be fetched by fetchmany_numpy() / fetch_numpy()
+            instead, otherwise only fetch_into() could continue (values of
+            skipped columns are not decoded), other fetch methods raise
+            ProgrammingError
+        """
+
+        if self.statement_type not in (None, 'SELECT'):
+            log_and_raise(ProgrammingError, 'No open statement while attempting fetch operation')
+
+        if self.statement_type is None:
+            return 0
+
+        if self.parsed_rows:
+            self._raise_partially_fetched()
+
+        targets = self._into_targets(buffers, 'buffers')
+        mask_targets = self._into_targets(masks, 'masks') if masks is not None else [None] * len(targets)
+        used = [idx for idx, target in enumerate(targets) if target is not None]
+        if not used:
+            log_and_raise(ProgrammingError, 'No buffers are given to fetch_into()')
+        capacity = min(len(targets[idx]) for idx in used)
+        written = 0
+
+        def extract(idx, raw_col_data):
+            return self._extract_numpy_column(idx, raw_col_data) if targets[idx] is not None else (None, None)
+
+        while written < capacity:
+            if not self.parsed_numpy_cols:
+                if not self.more_to_fetch:
+                    break
+                self.more_to_fetch = bool(self._fetch())  # _fetch() updates self.unparsed_row_amount
+                if not self.more_to_fetch:
+                    break
+                self.parsed_numpy_cols = self._map_columns(extract)
+
+            available = len(self.parsed_numpy_cols[used[0]][0])
+            amount = min(available, capacity - written)
+
+            for idx in used:
+                values, mask = self.parsed_numpy_cols[idx]
+                if values is None:
+                    self._raise_partially_fetched()
+                np.copyto(targets[idx][written:written + amount], values[:amount], casting='safe')
+                if mask_targets[idx] is not None:
+                    mask_targets[idx][written:written + amount] = False if mask is None else mask[:amount]
+                elif mask is not None and mask[:amount].any():
+                    log_and_raise(DataError, f'Column {self.col_names[idx]} contains nulls, but no mask is given '
+                                             f'to fetch_into()')
+
+            if amount < available:
+                self.parsed_numpy_cols = [(None if values is None else values[amount:],
+                                           None if mask is None else mask[amount:])
+                                          for values, mask in self.parsed_numpy_cols]
+            else:
+                self.parsed_numpy_cols = []
+            written += amount
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'Fetched {written} rows into buffers')
+
+        return written
+
+    def _into_targets(self, buffers: Union[list, dict], kind: str) -> List[Union[np.ndarray, None]]:
+        """Arrange buffers (or masks) given to fetch_into() by columns and
+        wrap them as numpy arrays"""
+
+        if isinstance(buffers, dict):
+            unknown = set(buffers) - set(self.col_names)
+            if unknown:
+                log_and_raise(ProgrammingError, f'Unknown columns in {kind} of fetch_into(): {", ".join(unknown)}')
+            buffers = [buffers.get(name) for name in self.col_names]
+
+        if len(buffers) != len(self.decode_plan):
+            log_and_raise(ProgrammingError, f'Expected {kind} of {len(self.decode_plan)} columns, got {len(buffers)}')
+
+        targets = []
+        for col_plan, buf in zip(self.decode_plan, buffers):
+            dtype = np.dtype(np.bool_) if kind == 'masks' else col_plan.np_dtype or col_plan.np_temporal
+            if buf is None:
+                targets.append(None)
+                continue
+            if dtype is None:
+                log_and_raise(NotSupportedError, f'Column {col_plan.name} of type {col_plan.type_name} could not '
+                                                 f'be fetched into buffer')
+
+            target = buf if isinstance(buf, np.ndarray) else np.frombuffer(buf, dtype=dtype)
+            if target.ndim != 1 or not target.flags.writeable:
+                log_and_raise(ProgrammingError, f'Buffer of column {col_plan.name} should be writable '
+                                                f'one-dimensional array')
+            if not np.can_cast(dtype, target.dtype, 'safe'):
+                log_and_raise(ProgrammingError, f'Values of column {col_plan.name} ({dtype}) could not be stored '
+                                                f'in buffer of {target.dtype}')
+            targets.append(target)
+        return targets
+
     # DB-API Do nothing (for now) methods
     # -----------------------------------
 
@@ -669,6 +1279,13 @@ class Cursor:
               but it is not object
             OperationalError: If server responds with "error" key in JSON
         """
+        # Nothing could be sent to SQream while chunks are received in background
+        self._stop_prefetch()
+        if self.spill_file is not None:
+            # Chunks kept by lazy rows stay mapped
+            self.spill_file.close()
+            self.spill_file = None
+
         if self.open_statement:
             raw = self.client.send_string(
                 '{"closeStatement": "closeStatement"}')
@@ -695,83 +1312,73 @@ class Cursor:
             if logger.isEnabledFor(logging.INFO):
                 logger.info(f'Done executing statement {self.stmt_id} over connection {self.conn.connection_id}')
 
-    def _extract_nvarchar(self, idx, raw_col_data):
-        if self.col_nul[idx]:
-            col = [None if (_is_null(n)) else raw_col_data['data_column'][start:end].decode('utf8') for (start, end), n
-                   in
-                   zip(lengths_to_pairs(raw_col_data['true_nvarchar']), raw_col_data['nullable'])]
-        else:
-            col = [
-                raw_col_data['data_column'][start:end].decode('utf8')
-                for (start, end) in lengths_to_pairs(raw_col_data['true_nvarchar'])
-            ]
-        return col
-
-    def _extract_varchar(self, idx, raw_col_data):
-        varchar_size = self.col_type_tups[idx][1]
-        if self.col_nul[idx]:
-            col = []
-            offset = 0
-            for idx in raw_col_data['nullable']:
-                if _is_null(idx):
-                    col.append(None)
-                    offset = offset + varchar_size
-                else:
-                    col.append(raw_col_data['data_column'][offset:offset + varchar_size].decode(self.conn.varchar_enc,
-                                                                                                "ignore").replace(
-                        '\x00', '').rstrip())
-                    offset = offset + varchar_size
-        else:
-            col = [
-                raw_col_data['data_column'][idx:idx + varchar_size].decode(
-                    self.conn.varchar_enc, "ignore").replace('\x00', '').rstrip()
-                for idx in range(0, len(raw_col_data['data_column']), varchar_size)
-            ]
-        return col
-
-    def _extract_date(self, idx, raw_col_data):
-        if self.col_nul[idx]:
-            col = [sq_date_to_py_date(d, is_null=_is_null(n)) for d, n in
-                   zip(raw_col_data['data_column'], raw_col_data['nullable'])]
-        else:
-            col = [sq_date_to_py_date(d) for d in raw_col_data['data_column']]
-        return col
-
-    def _extract_datetime(self, idx, raw_col_data):
-        if self.col_nul[idx]:
-            col = [sq_datetime_to_py_datetime(d, is_null=_is_null(n)) for d, n in
-                   zip(raw_col_data['data_column'], raw_col_data['nullable'])]
-        else:
-            col = [sq_datetime_to_py_datetime(d) for d in raw_col_data['data_column']]
-        return col
-
-    def _extract_numeric(self, idx, raw_col_data):
-        scale = self.col_type_tups[idx][2]
-        if self.col_nul[idx]:
-            col = [
-                sq_numeric_to_decimal(raw_col_data['data_column'][idx:idx + 16], scale, is_null=_is_null(n))
-                for idx, n in zip(range(0, len(raw_col_data['data_column']), 16), raw_col_data['nullable'])
-            ]
-        else:
-            col = [
-                sq_numeric_to_decimal(raw_col_data['data_column'][idx:idx + 16], scale)
-                for idx in range(0, len(raw_col_data['data_column']), 16)
-            ]
-        return col
-
-    def _extract_datatype(self, idx, raw_col_data):
-        if self.col_nul[idx]:
-            col = [None if _is_null(n) else d for d, n in zip(raw_col_data['data_column'], raw_col_data['nullable'])]
-        else:
-            col = raw_col_data['data_column']
-        return col
+    def _stop_prefetch(self) -> None:
+        if self.prefetcher is not None:
+            self.prefetcher.halt()
+            self.prefetcher = None
+
+    def _extract_converted(self, col_plan, raw_col_data):
+        """Extract column by converter chosen for its type in `converters`"""
+
+        if col_plan.kind == 'array':
+            # Converters of arrays get them extracted as lists
+            arrays = self._extract_array(col_plan, raw_col_data)
+            raw_col_data = dict(raw_col_data, arrays=objects_to_numpy(arrays, len(arrays)))
+        return convert_column(col_plan, raw_col_data)
+
+    def _extract_nvarchar(self, col_plan, raw_col_data):
+        nulls = raw_col_data['nullable'] if col_plan.nullable else None
+        if ARROW:
+            # Data buffer is wrapped by Arrow as is and decoded in bulk
+            mask = null_mask(nulls) if nulls is not None else None
+            array = strings_to_arrow(raw_col_data['true_nvarchar'], raw_col_data['data_column'], mask)
+            return dictionary_to_pylist(array) if self._is_dictionary_encoded(col_plan) else array.to_pylist()
+        col = set_nulls(sq_texts_to_str(raw_col_data['true_nvarchar'], raw_col_data['data_column']), nulls)
+        return intern_strings(col) if self._is_dictionary_encoded(col_plan) else col
+
+    def _extract_varchar(self, col_plan, raw_col_data):
+        nulls = raw_col_data['nullable'] if col_plan.nullable else None
+        if self._is_dictionary_encoded(col_plan):
+            if ARROW:
+                mask = null_mask(nulls) if nulls is not None else None
+                return dictionary_to_pylist(varchars_to_arrow(raw_col_data['data_column'], col_plan.size,
+                                                              col_plan.encoding, mask))
+            return intern_strings(set_nulls(sq_varchars_to_str(raw_col_data['data_column'], col_plan.size,
+                                                               col_plan.encoding), nulls))
+
+        # Whole column is split by numpy, values of nulls are replaced after
+        col = sq_varchars_to_str(raw_col_data['data_column'], col_plan.size, col_plan.encoding)
+        return set_nulls(col, nulls)
+
+    def _extract_date(self, col_plan, raw_col_data):
+        # Distinct values are converted by numpy once and reused, see pysqream.temporal_cache
+        mask = null_mask(raw_col_data['nullable']) if col_plan.nullable else None
+        return self.temporal_cache.convert('ftDate', np.frombuffer(raw_col_data['data_column'], dtype=np.int32), mask)
+
+    def _extract_datetime(self, col_plan, raw_col_data):
+        mask = null_mask(raw_col_data['nullable']) if col_plan.nullable else None
+        return self.temporal_cache.convert('ftDateTime', np.frombuffer(raw_col_data['data_column'], dtype=np.int64),
+                                           mask)
+
+    def _extract_numeric(self, col_plan, raw_col_data):
+        # Whole column is assembled from 64 bit words by numpy
+        col = sq_numerics_to_decimals(raw_col_data['data_column'], col_plan.scale)
+        return set_nulls(col, raw_col_data['nullable'] if col_plan.nullable else None)
+
+    def _extract_datatype(self, col_plan, raw_col_data):
+        if not col_plan.nullable:
+            # Memoryview cast to the type already gives python values
+            return raw_col_data['data_column']
+        # Whole column is turned into python values by numpy, values of nulls are replaced after
+        col = np.frombuffer(raw_col_data['data_column'], dtype=col_plan.np_dtype).tolist()
+        return set_nulls(col, raw_col_data['nullable'])
 
     def _extract_array(
-            self, idx: int, raw_col_data: memoryview) -> List[List[Any]]:
+            self, col_plan: ColumnPlan, raw_col_data: memoryview) -> List[List[Any]]:
         """Extract array data from buffer
 
         Args:
-            idx: integer index of extracting column in response
+            col_plan: decode plan of extracting column
             raw_col_data: memoryview (bytes represenation) of data of
               column
 
@@ -781,7 +1388,7 @@ class Cursor:
 
             [[1, 5, 7], None, [31, 2, None, 6]]
         """
-        sub_type_tup = self.col_type_tups[idx]
+        sub_type_tup = col_plan.type_tup
         typecode = typecodes.get(sub_type_tup[1])
 
         if typecode == "STRING":
@@ -793,10 +1400,10 @@ class Cursor:
                 f'Array of "{sub_type_tup[1]}" is not supported',
             )
 
-        return self._extract_fixed_array(idx, raw_col_data)
+        return self._extract_fixed_array(col_plan, raw_col_data)
 
     def _extract_fixed_array(
-            self, idx: int, raw_col_data: memoryview) -> List[List[Any]]:
+            self, col_plan: ColumnPlan, raw_col_data: memoryview) -> List[List[Any]]:
         """Extract array with data of fixed size
 
         Extract array from binary data of an Array with types of fixed
@@ -817,7 +1424,7 @@ class Cursor:
         values itself
 
         Args:
-            idx: integer index of extracting column in response
+            col_plan: decode plan of extracting column
             raw_col_data: memoryview (bytes represenation) of data of
               column
 
@@ -827,38 +1434,18 @@ class Cursor:
 
             [[1, 5, 7], None, [31, 2, None, 6]]
         """
-        buffer = raw_col_data['data_column']
-        nulls_buffer = raw_col_data['nullable'] or false_generator()
-
-        # Calculate size based on data_format
-        data_size = struct.calcsize(type_to_letter[self.col_type_tups[idx][1]])
-        trasform = self._get_trasform_func(idx)
-
-        def _get_array(data: memoryview, nulls: memoryview, arr_size: int):
-            """Construct one single array from data of type with fixed size"""
-            # Do not use direct data.cast(data_format) to skip nulls
-            # and process all data (including Numeric) by the same pattern
-            return [
-                trasform(data[i * data_size:(i + 1) * data_size], nulls[i])
-                for i in range(arr_size)
-            ]
-
-        col = []
-        start = 0
-        for buf_len, null in zip(raw_col_data['array_lengths'], nulls_buffer):
-            if null:
-                col.append(None)
-            else:
-                array_size = get_array_size(data_size, buf_len)
-                padding = (8 - array_size % 8) % 8
-
-                # Slices of memoryview do not copy underlying data
-                data = buffer[start + array_size + padding:start + buf_len]
-                nulls = buffer[start:start + array_size]
-
-                col.append(_get_array(data, nulls, array_size))
-            start += buf_len
-        return col
+        # Rows are split and items are converted for the whole column at
+        # once, see columnar.split_fixed_arrays
+        mask = null_mask(raw_col_data['nullable']) if col_plan.nullable else None
+        offsets, item_mask, items = self._split_fixed_arrays(col_plan, raw_col_data, mask)
+        item_type = col_plan.type_tup[1]
+        if item_type in ('ftDate', 'ftDateTime'):
+            items = self.temporal_cache.convert(item_type, items.view(np.int32 if item_type == 'ftDate' else np.int64),
+                                                item_mask)
+            items = objects_to_numpy(items, len(items))
+        else:
+            items = self._fixed_array_items(col_plan, items)
+        return arrays_to_lists(offsets, items, item_mask, mask)
 
     def _extract_unfixed_array(
             self, raw_col_data: memoryview) -> List[List[Union[str, None]]]:
@@ -896,7 +1483,6 @@ class Cursor:
         thus string is empty, and considering Nulls -> it is a null
 
         Args:
-            idx: integer index of extracting column in response
             raw_col_data: memoryview (bytes represenation) of data of
               column
 
@@ -947,50 +1533,15 @@ class Cursor:
             start += buf_len
         return col
 
-    def _get_trasform_func(self, idx: int) -> callable:
-        """Provide function for casting bytes data to real data
-
-        Args:
-            idx: integer index of extracting column in response
-
-        Returns:
-            A function that cast simple portion of data to appropriate
-            value.
-        """
-        type_tup = self.col_type_tups[idx]
-
-        # Array's type_tup differs from others by adding extra string
-        # at the beginning
-        offset = 1 if type_tup[0] == 'ftArray' else 0
-        data_format = type_to_letter[type_tup[offset]]
-        wrappers = {
-            'ftDate': sq_date_to_py_date,
-            'ftDateTime': sq_datetime_to_py_datetime
-        }
-
-        if type_tup[offset] == 'ftNumeric':
-            scale = type_tup[offset + 2]
-
-            def cast(data):
-                return sq_numeric_to_decimal(data, scale)
-        elif type_tup[offset] in wrappers:
-            def cast(data):
-                return wrappers[type_tup[offset]](data.cast(data_format)[0])
-        else:
-            def cast(data):
-                return data.cast(data_format)[0]
-
-        def trasform(mem: memoryview, is_null: bool = False):
-            return None if is_null else cast(mem)
-
-        return trasform
-
     def close(self):
         self.close_stmt()
         self.conn.cur_closed = True
         self.conn.close_connection()
         self.closed = True
         self.buffer.close()
+        self._shutdown_decode_executor()
+        self.receive_pool.clear()
+        self.temporal_cache.clear()
 
     def __enter__(self):
         return self
@@ -998,6 +1549,109 @@ class Cursor:
     def __exit__(self, exc_type, exc_value, exc_traceback):
         self.close()
 
+    def iter_chunks(self) -> Iterator[Chunk]:
+        """Iterate over chunks of result as they are fetched from SQream
+
+        Columns of chunk are decoded only when they are accessed, so
+        reading few columns of wide result does not pay for decoding of
+        the others. Closing the iteration before its end closes the
+        statement.
+        """
+
+        if self.statement_type not in (None, 'SELECT'):
+            log_and_raise(ProgrammingError, 'No open statement while attempting fetch operation')
+
+        if self.parsed_rows or self.parsed_numpy_cols:
+            self._raise_partially_fetched()
+
+        try:
+            while self.more_to_fetch:
+                self.more_to_fetch = bool(self._fetch(hold=True))  # _fetch() closes statement after the last chunk
+                if not self.more_to_fetch:
+                    break
+
+                yield self._take_chunk()
+        except GeneratorExit:
+            self.more_to_fetch = False
+            self.close_stmt()
+            raise
+
+    def iter_raw_chunks(self) -> Iterator[RawChunk]:
+        """Iterate over chunks of result exactly as they are received
+
+        Every fetch from SQream yields RawChunk: amount of rows and for
+        every column memoryviews of its data, null bytes and lengths with
+        its type (see RawColumn), nothing is decoded or copied. Views stay
+        valid as long as they are referenced, received buffers are not
+        reused until then. Closing the iteration before its end closes
+        the statement.
+        """
+
+        if self.statement_type not in (None, 'SELECT'):
+            log_and_raise(ProgrammingError, 'No open statement while attempting fetch operation')
+
+        if self.parsed_rows or self.parsed_numpy_cols:
+            self._raise_partially_fetched()
+
+        try:
+            while self.more_to_fetch:
+                self.more_to_fetch = bool(self._fetch(raw=True))  # _fetch() closes statement after the last chunk
+                if not self.more_to_fetch:
+                    break
+
+                columns = [
+                    RawColumn(col_plan.name, col_plan.type_tup, column['data_column'], column['nullable'] or None,
+                              column[col_plan.lengths] if col_plan.lengths else None)
+                    for col_plan, column in zip(self.decode_plan, self.data_columns)
+                ]
+                chunk = RawChunk(self.unparsed_row_amount, columns)
+                self.unparsed_row_amount = 0
+                self.data_columns = []
+                yield chunk
+        except GeneratorExit:
+            self.more_to_fetch = False
+            self.close_stmt()
+            raise
+
     def __iter__(self):
-        for item in self.fetchall():
-            yield item
+        """Iterate over result rows fetching one chunk from SQream at a time
+
+        Rows are yielded as soon as the chunk they belong to is parsed, and
+        the chunk is released before the next one is fetched, so memory
+        usage does not depend on the size of the result. Closing the
+        iteration before its end closes the statement.
+        """
+
+        if self.statement_type not in (None, 'SELECT'):
+            log_and_raise(ProgrammingError, 'No open statement while attempting fetch operation')
+
+        if self.parsed_numpy_cols:
+            self._raise_partially_fetched()
+
+        try:
+            # Rows left by previous fetchone() / fetchmany() calls
+            rows, self.parsed_rows = self.parsed_rows, RowBuffer()
+            yield from rows
+            del rows
+
+            while self.more_to_fetch:
+                # _fetch() closes statement after the last chunk
+                self.more_to_fetch = bool(self._fetch_rows())
+                if not self.more_to_fetch:
+                    break
+
+                make_row = self._make_row()
+                if self.lazy_rows and make_row is None:
+                    chunk = self._take_chunk()
+                    yield from (Row(chunk, idx) for idx in range(len(chunk)))
+                    del chunk
+                    continue
+
+                cols = self._parse_fetched_cols()
+                self.extracted_cols = []
+                yield from map(make_row, *cols) if make_row else zip(*cols)
+                del cols
+        except GeneratorExit:
+            self.more_to_fetch = False
+            self.close_stmt()
+            raise
@@ -0,0 +1,134 @@
+"""Decode plan of statement result
+
+Everything needed to sort received buffers into columns and to decode
+them is resolved once, when types of the statement result (queryTypeOut)
+are received, and then reused for every fetched chunk and for following
+executions of the same statement. Width of result rows measured on fetch
+is kept with the plan to choose chunk size of the following executions.
+
+Used by .cursor.Cursor
+"""
+from __future__ import annotations
+
+import struct
+from collections import OrderedDict
+from typing import List, Optional
+
+from pysqream.columnar import arrow_type
+from pysqream.converters import CONVERTED_TYPES, resolve_converter
+from pysqream.globals import (ARROW,
+                              TEXT_ITEM_SIZE,
+                              sqream_to_np,
+                              sqream_to_np_temporal,
+                              type_to_letter,
+                              typecodes)
+
+# Suffix of Cursor._extract_* method by SQream type, for other types
+# values are taken from buffer as is (_extract_datatype)
+_EXTRACTOR_KINDS = {
+    'ftVarchar': 'varchar',
+    'ftDate': 'date',
+    'ftDateTime': 'datetime',
+    'ftNumeric': 'numeric',
+}
+
+
+class ColumnPlan:
+    """Layout of buffers and decoding of one result column"""
+
+    __slots__ = ("name", "type_tup", "type_name", "nullable", "lengths", "as_bytes", "cast",
+                 "size", "scale", "encoding", "kind", "converter", "np_dtype", "np_temporal", "pa_type",
+                 "item_size")
+
+    def __init__(self, col: dict, varchar_enc: str, converters: Optional[dict] = None):
+        type_tup = col["type"]
+        is_array = type_tup[0] == 'ftArray'
+        tvc = col["isTrueVarChar"]
+
+        self.name = col.get("name", "")
+        self.type_tup = type_tup
+        self.type_name = type_tup[0]
+        self.nullable = col["nullable"]
+        # Key of extra buffer with lengths: of ARRAY data of each row or of each TEXT value
+        self.lengths = 'array_lengths' if is_array else 'true_nvarchar' if tvc else None
+        # Data which could not be cast to memoryview of single values is copied to bytes
+        self.as_bytes = self.type_name in ('ftVarchar', 'ftBlob', 'ftNumeric')
+        self.cast = None if is_array or self.as_bytes else type_to_letter[self.type_name]
+        # For array type_tup is shifted: ['ftArray', 'ftInt', 4, 0]
+        self.size, self.scale = type_tup[1 + is_array], type_tup[2 + is_array]
+        self.encoding = varchar_enc
+        self.kind = 'array' if is_array else 'nvarchar' if tvc else _EXTRACTOR_KINDS.get(self.type_name, 'datatype')
+        # Replaces default conversion of the kind, see pysqream.converters
+        self.converter = resolve_converter(self.type_name, (converters or {}).get(self.type_name))
+        # Type of numpy array given by converter (NUMERIC as float64 / int64)
+        converted_type = CONVERTED_TYPES.get(self.converter)
+        self.np_dtype = sqream_to_np.get(converted_type or self.type_name)
+        # DATE / DATETIME as datetime64 in numpy results, unless they are converted
+        self.np_temporal = None if self.converter else sqream_to_np_temporal.get(self.type_name)
+        self.pa_type = arrow_type([converted_type] if converted_type else type_tup) if ARROW else None
+        # Bytes of one item of ARRAY of type with fixed size (not TEXT)
+        self.item_size = None
+        if is_array and typecodes.get(type_tup[1]) in ('NUMBER', 'DATETIME'):
+            self.item_size = struct.calcsize(type_to_letter[type_tup[1]])
+
+
+def build_decode_plan(columns: List[dict], varchar_enc: str, converters: Optional[dict] = None) -> List[ColumnPlan]:
+    """Build plan by columns description received on `queryTypeOut`"""
+    return [ColumnPlan(col, varchar_enc, converters) for col in columns]
+
+
+def estimate_row_width(plan: List[ColumnPlan]) -> int:
+    """Bytes taken by one row of result in fetched chunk, TEXT values and
+    ARRAY data are assumed to take TEXT_ITEM_SIZE bytes"""
+    return sum((col.size or TEXT_ITEM_SIZE) + col.nullable + (4 if col.lengths else 0) for col in plan)
+
+
+class DecodePlanCache:
+    """Decode plans of recently executed statements
+
+    Plan is reused only if the statement has the same result columns as
+    when plan was built, because table could be recreated between
+    executions, and if varchar encoding and converters were not changed.
+
+    Entries are [columns, (varchar encoding, converters), plan, measured row width]
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._plans = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self,
+            statement: str,
+            columns: List[dict],
+            varchar_enc: str,
+            converters: Optional[dict] = None) -> List[ColumnPlan]:
+        """Get cached plan of statement or build a new one"""
+        options = (varchar_enc, dict(converters or {}))
+        cached = self._plans.get(statement)
+        if cached is not None and cached[0] == columns and cached[1] == options:
+            self._plans.move_to_end(statement)
+            return cached[2]
+
+        plan = build_decode_plan(columns, varchar_enc, converters)
+        self._plans[statement] = [columns, options, plan, None]
+        self._plans.move_to_end(statement)
+        if len(self._plans) > self.size:
+            self._plans.popitem(last=False)
+        return plan
+
+    def row_width(self, statement: str) -> float | None:
+        """Bytes per row of statement result: measured on previous fetch or
+        estimated by its plan, None if statement was not executed yet"""
+        cached = self._plans.get(statement)
+        if cached is None:
+            return None
+        return cached[3] or estimate_row_width(cached[2])
+
+    def observe_row_width(self, statement: str, width: float) -> None:
+        """Keep bytes per row measured on fetch of statement result"""
+        cached = self._plans.get(statement)
+        if cached is not None:
+            cached[3] = width
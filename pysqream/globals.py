@@ -19,6 +19,18 @@ BYTES_PER_FLUSH_LIMIT = 200 * 1024 * 1024
 TEXT_ITEM_SIZE = 100
 DEFAULT_CHUNKSIZE = 0  # Dummy variable for some jsons
 FETCH_MANY_DEFAULT = 1  # default parameter for fetchmany()
+PREFETCH_DEPTH = 0  # chunks received in background ahead of consumer, 0 - disabled
+PREFETCH_MAX_BYTES = 256 * 1024 * 1024  # stop prefetching while received chunks take more
+MAX_BUFFERED_BYTES = 0  # spill prefetched chunks to disk when they take more, 0 - disabled
+LAZY_ROWS = False  # return rows as views of fetched chunks, decoding columns on access
+DICTIONARY_ENCODE = False  # decode TEXT / VARCHAR once per distinct value: True - all columns or names of columns
+ROW_FACTORY = None  # rows are tuples, see pysqream.row_factory for namedtuples, dicts and dataclasses
+DECODE_WORKERS = 0  # threads decoding columns of fetched chunk concurrently, 0 - disabled
+DECODE_PLAN_CACHE_SIZE = 32  # decode plans of recently executed statements kept by cursor
+TEMPORAL_CACHE_SIZE = 100000  # distinct dates / datetimes kept by cursor, see pysqream.temporal_cache
+FETCH_CHUNK_ROWS = 0  # rows in chunk of fetched result, 0 - chosen by SQream
+FETCH_CHUNK_BYTES = 0  # bytes in chunk of fetched result, 0 - chosen by SQream
+FETCH_MEMORY_BUDGET = 0  # bytes for all chunks held by cursor at once, 0 - chosen by SQream
 VARCHAR_ENCODING = 'ascii'
 CAN_SUPPORT_PARAMETERS = True
 
@@ -36,6 +48,12 @@ else:
 
 # TODO: replace strings ftBool, ... with enum
 
+# SQream types decoded to numpy datetime64 in columnar results
+sqream_to_np_temporal = {
+    'ftDate':     np.dtype('datetime64[D]'),
+    'ftDateTime': np.dtype('datetime64[ms]'),
+}
+
 try:
     import pyarrow as pa
     from pyarrow import csv
@@ -52,8 +70,8 @@ else:
         'ftLong':     pa.int64(),
         'ftFloat':    pa.float32(),
         'ftDouble':   pa.float64(),
-        'ftDate':     pa.timestamp('ns'),
-        'ftDateTime': pa.timestamp('ns'),
+        'ftDate':     pa.date32(),
+        'ftDateTime': pa.timestamp('ms'),  # SQream keeps milliseconds
         'ftVarchar':  pa.string(),
         'ftBlob':     pa.utf8(),
         'ftNumeric':  pa.decimal128(38, 11),
@@ -76,6 +94,17 @@ type_to_letter = {
     'ftNumeric': '4i'
 }
 
+# NumPy dtypes of columns with fixed size, which buffers could be used as is
+sqream_to_np = {
+    'ftBool': np.bool_,
+    'ftUByte': np.uint8,
+    'ftShort': np.int16,
+    'ftInt': np.int32,
+    'ftLong': np.int64,
+    'ftFloat': np.float32,
+    'ftDouble': np.float64,
+}
+
 typecodes = {
     'ftBool': 'NUMBER',
     'ftUByte': 'NUMBER',
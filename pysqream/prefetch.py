@@ -0,0 +1,109 @@
+"""Background fetch of statement result
+
+While the application consumes rows of the current chunk, Prefetcher
+already requests the next chunks from SQream and receives their columns.
+
+Used by .cursor.Cursor
+"""
+import threading
+from collections import deque
+
+from pysqream.spill import SpillFile, SpilledChunk
+
+
+class Prefetcher(threading.Thread):
+    """Receive chunks of statement result in background thread
+
+    Keeps up to `depth` received chunks ahead of the consumer and does not
+    request a new one while received chunks take `max_bytes` or more (the
+    bound is soft - it can be exceeded by one chunk because size of chunk
+    is unknown before it is requested).
+
+    If `max_buffered_bytes` is set, chunks which do not fit into it with
+    the ones already kept in memory are spilled to a temporary file and
+    are mapped back to memory when taken by get(). Spilled chunks are not
+    counted by `max_bytes`.
+
+    Chunks are (amount of rows, list of column buffers) as returned by
+    `receive_chunk`, the chunk with 0 rows ends the result.
+    """
+
+    def __init__(self, receive_chunk, depth, max_bytes, max_buffered_bytes=0):
+        super(Prefetcher, self).__init__(daemon=True)
+        self.receive_chunk = receive_chunk
+        self.depth = depth
+        self.max_bytes = max_bytes
+        self.max_buffered_bytes = max_buffered_bytes
+        self.spill_file = None
+        # (amount of rows, column buffers or SpilledChunk, bytes kept in memory)
+        self.chunks = deque()
+        self.buffered_bytes = 0
+        self.error = None
+        self.halted = False
+        self.finished = False
+        self.cond = threading.Condition()
+
+    def _is_full(self):
+        return self.chunks and (len(self.chunks) >= self.depth or self.buffered_bytes >= self.max_bytes)
+
+    def run(self):
+        try:
+            while True:
+                with self.cond:
+                    while not self.halted and self._is_full():
+                        self.cond.wait()
+                    if self.halted:
+                        return
+
+                num_rows, columns = self.receive_chunk()
+                nbytes = sum(col.nbytes for col in columns)
+
+                # Consumer only decreases buffered_bytes, so it is safe to check it without lock
+                if self.max_buffered_bytes and self.buffered_bytes + nbytes > self.max_buffered_bytes:
+                    if self.spill_file is None:
+                        self.spill_file = SpillFile()
+                    columns, nbytes = self.spill_file.write(columns), 0
+
+                with self.cond:
+                    self.chunks.append((num_rows, columns, nbytes))
+                    self.buffered_bytes += nbytes
+                    self.cond.notify_all()
+
+                if num_rows == 0:
+                    return
+        except Exception as e:  # pylint: disable=broad-except; reraised by consumer at get()
+            self.error = e
+        finally:
+            with self.cond:
+                self.finished = True
+                self.cond.notify_all()
+
+    def get(self):
+        """Take the next received chunk, wait for it if needed"""
+        with self.cond:
+            while not self.chunks and not self.finished:
+                self.cond.wait()
+
+            if self.chunks:
+                num_rows, columns, nbytes = self.chunks.popleft()
+                self.buffered_bytes -= nbytes
+                self.cond.notify_all()
+                if isinstance(columns, SpilledChunk):
+                    columns = columns.load()
+                return num_rows, columns
+
+        if self.error is not None:
+            raise self.error
+        return 0, []
+
+    def halt(self):
+        """Stop requesting chunks and wait for the one being received"""
+        with self.cond:
+            self.halted = True
+            self.cond.notify_all()
+        self.join()
+        self.chunks.clear()
+        self.buffered_bytes = 0
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
@@ -4,6 +4,11 @@ from datetime import datetime, date, time as t
 
 from pysqream.logger import log_and_raise, start_logging, stop_logging
 from pysqream.connection import Connection
+from pysqream.columnar import arrow_to_pandas
+from pysqream.globals import ARROW
+
+if ARROW:
+    import pyarrow as pa
 
 
 def enable_logs(log_path=None):
@@ -28,13 +33,51 @@ def connect(host, port, database, username, password, clustered=False,
         reconnect_attempts=reconnect_attempts,
         reconnect_interval=reconnect_interval,
         # Temporary desision to provide seamless transition to array features
-        allow_array=kwargs.pop("allow_array", True)
+        allow_array=kwargs.pop("allow_array", True),
+        **kwargs
     )
     conn.connect_database(database, username, password, service)
 
     return conn
 
 
+def read_sql(conn, sql, chunksize=None):
+    """Execute statement on a new cursor and read result as pandas.DataFrame
+
+    :param conn: Connection to execute statement with
+    :param sql: str statement to execute
+    :param chunksize: int - if passed, return iterator of DataFrames with
+        up to `chunksize` rows each instead of one DataFrame. Statement is
+        executed on its first iteration
+    """
+    if chunksize is not None and (not isinstance(chunksize, int) or chunksize <= 0):
+        log_and_raise(Exception, f'chunksize should be a positive integer, got : {chunksize}')
+
+    if chunksize is not None:
+        return _read_sql_chunks(conn, sql, chunksize)
+
+    with conn.cursor() as cur:
+        cur.execute(sql)
+        return cur.fetch_df()
+
+
+def _read_sql_chunks(conn, sql, chunksize):
+    """Generator of DataFrames with `chunksize` rows, used by read_sql().
+    Cursor is opened on the first iteration and closed when generator is
+    exhausted or closed"""
+    with conn.cursor() as cur:
+        cur.execute(sql)
+        pending = cur.arrow_schema().empty_table()
+        for batch in cur.fetch_record_batches():
+            pending = pa.concat_tables([pending, pa.Table.from_batches([batch])])
+            while pending.num_rows >= chunksize:
+                yield arrow_to_pandas(pending.slice(0, chunksize))
+                pending = pending.slice(chunksize)
+
+        if pending.num_rows:
+            yield arrow_to_pandas(pending)
+
+
 ## DBapi compatibility
 #  -------------------
 ''' To fully comply to Python's DB-API 2.0 database standard. Ignore when using internally '''
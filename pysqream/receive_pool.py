@@ -0,0 +1,72 @@
+"""Pool of buffers for receiving chunks of statement result
+
+All columns of a fetched chunk are received into one contiguous buffer,
+which is taken from the pool and is reused for one of the next chunks
+once nothing references its data anymore.
+
+Used by .cursor.Cursor
+"""
+from threading import Lock
+
+
+def _is_referenced(buf: bytearray) -> bool:
+    """Whether memoryviews (or numpy arrays wrapping them) of buffer
+    still exist. bytearray refuses to be resized while its data is
+    exported, shrinking by one byte and restoring it does not reallocate"""
+
+    try:
+        last = buf.pop()
+    except BufferError:
+        return True
+    buf.append(last)
+    return False
+
+
+class ReceiveBufferPool:
+    """Keeps up to `max_buffers` bytearrays for receiving chunks
+
+    Buffer is not returned to pool explicitly - it becomes free when
+    all memoryviews of it are released: raw column buffers are dropped
+    after chunk is decoded, while numpy and Arrow arrays built without
+    copying keep the buffer busy as long as they exist. If all pooled
+    buffers are busy, a new one is allocated, and it is not pooled when
+    the pool is already full.
+
+    Thread safe, buffers are taken by Prefetcher in background thread.
+    """
+
+    def __init__(self, max_buffers: int):
+        self.max_buffers = max_buffers
+        self.buffers = []
+        self.lock = Lock()
+
+    def acquire(self, size: int) -> memoryview:
+        """Get memoryview of `size` bytes of a free buffer"""
+
+        with self.lock:
+            free = [idx for idx, buf in enumerate(self.buffers) if not _is_referenced(buf)]
+            fitting = [idx for idx in free if len(self.buffers[idx]) >= size]
+
+            if fitting:
+                buf = self.buffers[min(fitting, key=lambda idx: len(self.buffers[idx]))]
+            else:
+                buf = bytearray(size)
+                if free:
+                    # Free buffer which is too small is replaced by bigger one
+                    self.buffers[free[0]] = buf
+                elif len(self.buffers) < self.max_buffers:
+                    self.buffers.append(buf)
+
+            # Exported under the lock, so the buffer could not be taken twice
+            return memoryview(buf)[:size]
+
+    def resize(self, max_buffers: int) -> None:
+        """Change limit of pooled buffers, extra ones are dropped from pool
+        (but stay valid while their data is referenced)"""
+        with self.lock:
+            self.max_buffers = max_buffers
+            del self.buffers[max_buffers:]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.buffers = []
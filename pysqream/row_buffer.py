@@ -0,0 +1,71 @@
+"""Buffer of parsed rows waiting to be returned by fetch methods
+
+Used by .cursor.Cursor
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterator, List
+
+
+class RowBuffer:
+    """Rows of parsed chunks kept as they were parsed
+
+    Instead of one list that is sliced and shrunk on every fetch (which
+    costs O(n) per call), chunks are kept in a deque and the position in
+    the first chunk is tracked by an offset. Thus cost of take() is
+    proportional to the amount of returned rows.
+    """
+
+    __slots__ = ("_chunks", "_offset", "_size")
+
+    def __init__(self):
+        self._chunks = deque()
+        self._offset = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, rows: List[Any]) -> None:
+        """Add rows of the next parsed chunk"""
+        if rows:
+            self._chunks.append(rows)
+            self._size += len(rows)
+
+    def take(self, size: int) -> List[Any]:
+        """Remove and return up to `size` rows, -1 - all rows"""
+        if size == -1 or size > self._size:
+            size = self._size
+
+        res = []
+        while len(res) < size:
+            chunk = self._chunks[0]
+            end = self._offset + size - len(res)
+            if self._offset == 0 and end >= len(chunk) and not res:
+                # Whole chunk is returned, no need to copy it
+                res = chunk
+            else:
+                res.extend(chunk[self._offset:end])
+
+            if end >= len(chunk):
+                self._chunks.popleft()
+                self._offset = 0
+            else:
+                self._offset = end
+
+        self._size -= size
+        return res
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._offset = 0
+        self._size = 0
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over rows removing them from the buffer"""
+        while self._chunks:
+            chunk = self._chunks.popleft()
+            offset, self._offset = self._offset, 0
+            self._size -= len(chunk) - offset
+            yield from chunk[offset:] if offset else chunk
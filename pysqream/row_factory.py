@@ -0,0 +1,85 @@
+"""Rows of fetched result other than tuples
+
+Row factory is chosen by `Cursor.row_factory` (inherited from
+`row_factory` option of connection):
+
+    None          - tuples (default)
+    'namedtuple'  - namedtuples with fields named by columns, invalid or
+                    duplicated names are renamed to _<index>
+    'dict'        - dicts by column name
+    dataclass     - instances of given dataclass, its fields are filled by
+                    columns of the same name
+    callable      - result of callable(*values of row)
+
+Factory is built once per statement from names of its columns and is
+called with decoded columns (map(factory, *columns)), so rows are not
+built as tuples and converted afterwards. Column names come from server,
+so they are only used as data (keys, keyword arguments), never as code.
+
+Used by .cursor.Cursor
+"""
+from __future__ import annotations
+
+import dataclasses
+from collections import namedtuple
+from typing import Any, Callable, List, Union
+
+from pysqream.logger import log_and_raise
+from pysqream.utils import ProgrammingError
+
+ROW_FACTORIES = ('namedtuple', 'dict')
+
+
+def _dict_factory(col_names: List[str]) -> Callable[..., dict]:
+    names = tuple(col_names)
+
+    def make_dict(*values):
+        return dict(zip(names, values))
+    return make_dict
+
+
+def _dataclass_factory(cls: type, col_names: List[str]) -> Callable[..., Any]:
+    fields = [field for field in dataclasses.fields(cls) if field.init]
+    names = {field.name for field in fields}
+
+    unknown = [name for name in col_names if name not in names]
+    if unknown:
+        log_and_raise(ProgrammingError, f'Columns {", ".join(unknown)} are not fields of {cls.__name__}')
+    if len(set(col_names)) != len(col_names):
+        log_and_raise(ProgrammingError, f'Columns of result have duplicated names, cannot fill {cls.__name__}')
+    missing = [field.name for field in fields if field.name not in col_names
+               and field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING]
+    if missing:
+        log_and_raise(ProgrammingError, f'Fields {", ".join(missing)} of {cls.__name__} are not in result')
+
+    if col_names == [field.name for field in fields]:
+        return cls
+
+    names = tuple(col_names)
+
+    def make_instance(*values):
+        return cls(**dict(zip(names, values)))
+    return make_instance
+
+
+def compile_row_factory(spec: Union[str, Callable, None], col_names: List[str]) -> Callable[..., Any] | None:
+    """Get function(*values of row) -> row for columns of statement,
+    None - rows are tuples"""
+
+    if spec is None or not col_names:
+        return None
+
+    if dataclasses.is_dataclass(spec) and isinstance(spec, type):
+        return _dataclass_factory(spec, col_names)
+
+    if callable(spec):
+        return spec
+
+    if spec == 'namedtuple':
+        return namedtuple('Row', col_names, rename=True)
+
+    if spec == 'dict':
+        return _dict_factory(col_names)
+
+    log_and_raise(ProgrammingError, f'Unknown row factory "{spec}", '
+                                    f'use dataclass, callable or one of: {", ".join(ROW_FACTORIES)}')
@@ -0,0 +1,71 @@
+"""Spill of received chunks to disk
+
+Chunks received ahead of the consumer (or kept by lazy rows) which do not
+fit into memory budget of cursor are written to a temporary file and
+mapped back to memory only when the consumer gets to them.
+
+Used by .prefetch.Prefetcher and .cursor.Cursor
+"""
+from __future__ import annotations
+
+import mmap
+import tempfile
+from typing import List
+
+
+class SpilledChunk:
+    """Buffers of one chunk kept in SpillFile"""
+
+    __slots__ = ("spill_file", "offset", "sizes")
+
+    def __init__(self, spill_file: SpillFile, offset: int, sizes: List[int]):
+        self.spill_file = spill_file
+        self.offset = offset
+        self.sizes = sizes
+
+    def load(self) -> List[memoryview]:
+        """Map buffers of chunk back to memory
+
+        Mapping is copy-on-write, so buffers are writable as received
+        ones, and pages are read from disk only when data is accessed
+        """
+        total = sum(self.sizes)
+        if total == 0:
+            return [memoryview(bytearray()) for _ in self.sizes]
+
+        view = memoryview(mmap.mmap(self.spill_file.fileno(), total, access=mmap.ACCESS_COPY, offset=self.offset))
+        buffers, offset = [], 0
+        for size in self.sizes:
+            buffers.append(view[offset:offset + size])
+            offset += size
+        return buffers
+
+
+class SpillFile:
+    """Temporary file, which is removed when closed. Chunks are appended
+    to it at offsets aligned for mmap"""
+
+    def __init__(self):
+        self.file = tempfile.TemporaryFile(prefix="pysqream-spill-")
+        self.size = 0
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def write(self, buffers: List[memoryview]) -> SpilledChunk:
+        """Write buffers of chunk to the end of file"""
+        offset = -self.size % mmap.ALLOCATIONGRANULARITY + self.size
+        if offset > self.size:
+            self.file.write(bytes(offset - self.size))
+
+        for buf in buffers:
+            self.file.write(buf)
+        self.file.flush()
+
+        sizes = [buf.nbytes for buf in buffers]
+        self.size = offset + sum(sizes)
+        return SpilledChunk(self, offset, sizes)
+
+    def close(self) -> None:
+        """Remove file, already mapped chunks stay available"""
+        self.file.close()
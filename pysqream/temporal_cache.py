@@ -0,0 +1,126 @@
+"""Memoized conversion of DATE and DATETIME columns to python values
+
+Fact tables repeat the same few thousand dates millions of times, so
+columns are converted through lookup tables kept by cursor between
+fetched chunks (and statements): every distinct value is converted by
+numpy once, repeated values are taken from the table and share the same
+date / datetime object.
+
+    DATE     - dense table of dates by day number over the min/max range
+               of converted columns, up to `max_size` days
+    DATETIME - LRU of up to `max_size` distinct datetimes, used only if
+               values of column repeat (checked on a sample)
+
+Misses count values converted by numpy (distinct values added to the
+tables, or all values of column which does not fit them), hits count
+values taken from the tables.
+
+Used by .cursor.Cursor
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+
+from pysqream.casting import sq_dates_to_numpy, sq_datetimes_to_numpy
+from pysqream.columnar import objects_to_numpy
+
+# Values of DATETIME column checked for repeats before it is converted through LRU
+SAMPLE_SIZE = 1000
+
+
+class TemporalCache:
+    """Lookup tables of dates and datetimes, see module docstring"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._first_day = 0
+        self._dates = None
+        self._datetimes = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of converted values found in tables"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._dates = None
+            self._datetimes.clear()
+
+    def convert(self, type_name: str, values: np.ndarray, mask: Optional[np.ndarray] = None) -> List:
+        """Convert SQream DATE (int32 day numbers) or DATETIME (int64) values
+        to python dates / datetimes, None where mask is set"""
+
+        if mask is not None and mask.any():
+            valid = self.convert(type_name, values[~mask])
+            col = np.full(len(values), None, dtype=object)
+            col[~mask] = objects_to_numpy(valid, len(valid))
+            return col.tolist()
+
+        with self._lock:
+            if not len(values):
+                return []
+            if type_name == 'ftDate':
+                return self._convert_dates(values)
+            return self._convert_datetimes(values)
+
+    def _convert_dates(self, days: np.ndarray) -> List:
+        first, last = int(days.min()), int(days.max())
+        if self._dates is not None:
+            table_first, table_last = self._first_day, self._first_day + len(self._dates) - 1
+            if table_first <= first and last <= table_last:
+                self.hits += len(days)
+                return self._dates[days - table_first].tolist()
+
+        if self._dates is not None and max(last, table_last) - min(first, table_first) < self.max_size:
+            # Extend the table, keeping its objects
+            new_first, new_last = min(first, table_first), max(last, table_last)
+        elif last - first < self.max_size:
+            new_first, new_last = first, last
+        else:
+            self.misses += len(days)
+            return sq_dates_to_numpy(days).tolist()
+
+        table = objects_to_numpy(sq_dates_to_numpy(np.arange(new_first, new_last + 1, dtype=np.int32)).tolist(),
+                                 new_last - new_first + 1)
+        new_days = days
+        if self._dates is not None and new_first <= table_first and table_last <= new_last:
+            table[table_first - new_first:table_last - new_first + 1] = self._dates
+            new_days = days[(days < table_first) | (days > table_last)]
+
+        self._first_day, self._dates = new_first, table
+        misses = int(np.count_nonzero(np.bincount(new_days - new_first))) if len(new_days) else 0
+        self.hits += len(days) - misses
+        self.misses += misses
+        return table[days - new_first].tolist()
+
+    def _convert_datetimes(self, values: np.ndarray) -> List:
+        sample = values[::max(1, len(values) // SAMPLE_SIZE)]
+        if not self.max_size or len(np.unique(sample)) > len(sample) // 2:
+            self.misses += len(values)
+            return sq_datetimes_to_numpy(values).tolist()
+
+        uniques, inverse = np.unique(values, return_inverse=True)
+        keys = uniques.tolist()
+        found = np.fromiter((key in self._datetimes for key in keys), dtype=np.bool_, count=len(keys))
+
+        missing = np.flatnonzero(~found)
+        converted = sq_datetimes_to_numpy(uniques[missing]).tolist()
+        self._datetimes.update(zip(uniques[missing].tolist(), converted))
+        for key in uniques[found].tolist():
+            self._datetimes.move_to_end(key)
+        table = objects_to_numpy((self._datetimes[key] for key in keys), len(keys))
+        while len(self._datetimes) > self.max_size:
+            self._datetimes.popitem(last=False)
+
+        self.hits += len(values) - len(missing)
+        self.misses += len(missing)
+        return table[inverse.reshape(-1)].tolist()
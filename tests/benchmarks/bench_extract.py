@@ -0,0 +1,53 @@
+"""Benchmark of decoding fetched chunk into rows, per column type
+
+Every type of the Cursor._extract_* family is fetched as one column by
+fetchall(), not nullable and nullable (every 10th value is null). Rows/s
+do not include receiving of the chunk. Run from the root of repository:
+
+    python -m tests.benchmarks.bench_extract
+"""
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+ROWS = 10 ** 6
+TYPES = {
+    "BOOL": (["ftBool", 1, 0], lambda i: i % 3 == 0),
+    "TINYINT": (["ftUByte", 1, 0], lambda i: i % 256),
+    "SMALLINT": (["ftShort", 2, 0], lambda i: i % 30000),
+    "INT": (["ftInt", 4, 0], lambda i: i),
+    "BIGINT": (["ftLong", 8, 0], lambda i: i * 1000),
+    "REAL": (["ftFloat", 4, 0], lambda i: i / 4),
+    "DOUBLE": (["ftDouble", 8, 0], lambda i: i / 3),
+    "NUMERIC": (["ftNumeric", 16, 2], lambda i: Decimal(i) / 100),
+    "DATE": (["ftDate", 4, 0], lambda i: date(2000 + i % 50, 1 + i % 12, 1 + i % 28)),
+    "DATETIME": (["ftDateTime", 8, 0], lambda i: datetime(2000 + i % 50, 1 + i % 12, 1 + i % 28, i % 24)),
+    "VARCHAR": (["ftVarchar", 10, 0], lambda i: f"v{i % 1000}"),
+    "TEXT": (["ftBlob", 0, 0], lambda i: f"text value {i}"),
+    "ARRAY INT": (["ftArray", "ftInt", 4, 0], lambda i: [i, i + 1, i + 2]),
+}
+
+
+def bench_type(type_tup: list, value, nullable: bool) -> float:
+    """Get rows per second of fetchall() of one column of given type"""
+    col = column("c", type_tup, nullable=nullable, tvc=type_tup[0] == "ftBlob")
+    rows = [(None if nullable and i % 10 == 0 else value(i),) for i in range(ROWS)]
+    cur = mock_cursor([col], [rows])
+    cur._fetch()  # pylint: disable=protected-access; receive chunk before timing
+
+    start = time.perf_counter()
+    assert len(cur.fetchall()) == ROWS
+    return ROWS / (time.perf_counter() - start)
+
+
+def main():
+    print(f"{'type':<10} {'not nullable':>14} {'nullable':>14}  rows/s")
+    for name, (type_tup, value) in TYPES.items():
+        print(f"{name:<10} {bench_type(type_tup, value, False):>14,.0f} {bench_type(type_tup, value, True):>14,.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark of fetchone() and fetchmany() loops over one big chunk
+
+Cost of fetchone() and of fetchmany() with default arraysize should not
+depend on the size of the chunk, so rows/s have to stay about the same
+for all sizes. Run from the root of repository:
+
+    python -m tests.benchmarks.bench_fetchone
+"""
+import time
+
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [column("i", ["ftLong", 8, 0]), column("d", ["ftDouble", 8, 0], nullable=True)]
+SIZES = (10 ** 4, 10 ** 5, 10 ** 6)
+
+
+def bench_fetchone(rows: int) -> float:
+    """Get rows per second of fetchone() loop over chunk of given size"""
+    cur = mock_cursor(COLUMNS, [[(i, i / 2) for i in range(rows)]])
+
+    start = time.perf_counter()
+    while cur.fetchone() is not None:
+        pass
+    return rows / (time.perf_counter() - start)
+
+
+def bench_fetchmany(rows: int) -> float:
+    """Get rows per second of fetchmany() loop with default arraysize over
+    chunk of given size"""
+    cur = mock_cursor(COLUMNS, [[(i, i / 2) for i in range(rows)]])
+
+    start = time.perf_counter()
+    while cur.fetchmany():
+        pass
+    return rows / (time.perf_counter() - start)
+
+
+def main():
+    for rows in SIZES:
+        print(f"fetchone() over chunk of {rows:>9} rows: {bench_fetchone(rows):>12,.0f} rows/s")
+    for rows in SIZES:
+        print(f"fetchmany() over chunk of {rows:>9} rows: {bench_fetchmany(rows):>12,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
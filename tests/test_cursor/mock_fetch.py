@@ -0,0 +1,184 @@
+"""Mocks for testing fetch of data without connection to SQream server
+
+ClientMock answers the statement flow of Cursor.execute() and serves
+prepared chunks on `fetch` exactly as they are sent by SQream: for each
+column optional null bytes, optional lengths (TEXT, ARRAY) and the data
+itself.
+"""
+import json
+import struct
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional
+
+from pysqream.casting import date_to_int, datetime_to_long, decimal_to_sq_numeric
+from pysqream.cursor import Cursor
+from pysqream.globals import type_to_letter
+
+
+def column(name: str, type_tup: list, nullable: bool = False, tvc: bool = False) -> dict:
+    """Describe column as SQream does in response on `queryTypeOut`"""
+    return {"name": name, "type": type_tup, "nullable": nullable, "isTrueVarChar": tvc}
+
+
+def _pack_value(type_tup: list, value: Any) -> bytes:
+    """Pack single not null value of column with fixed size"""
+    type_name = type_tup[0]
+    if type_name == 'ftVarchar':
+        return value.encode('ascii').ljust(type_tup[1], b' ')
+    if type_name == 'ftNumeric':
+        return decimal_to_sq_numeric(Decimal(value), type_tup[2]).to_bytes(16, 'little', signed=True)
+    if type_name == 'ftDate':
+        value = date_to_int(value)
+    elif type_name == 'ftDateTime':
+        value = datetime_to_long(value)
+    return struct.pack(type_to_letter[type_name], value)
+
+
+def _placeholder(type_tup: list) -> Any:
+    """Value packed instead of null"""
+    return {
+        'ftVarchar': '', 'ftNumeric': 0, 'ftDate': date(1900, 1, 1),
+        'ftDateTime': datetime(1900, 1, 1), 'ftBool': False,
+    }.get(type_tup[0], 0)
+
+
+def _pack_array(type_tup: list, value: list) -> bytes:
+    """Pack single not null array, layout is described in
+    Cursor._extract_fixed_array and Cursor._extract_unfixed_array"""
+    item_type = type_tup[1:]
+    nulls = bytes(val is None for val in value)
+    nulls += bytes(-len(nulls) % 8)
+
+    if item_type[0] != 'ftBlob':
+        return nulls + b''.join(_pack_value(item_type, _placeholder(item_type) if val is None else val)
+                                for val in value)
+
+    if not value:
+        return b''
+    data, ends = b'', []
+    for val in value:
+        data += bytes(-len(data) % 8) + (val or '').encode('utf8')
+        ends.append(len(data))
+    data += bytes(-len(data) % 8)
+    return (struct.pack('q', len(value)) + nulls + struct.pack(f'{len(ends)}i', *ends) + bytes(len(ends) % 2 * 4)
+            + data)
+
+
+def encode_column(col: dict, values: List[Any]) -> List[bytes]:
+    """Encode values of one column into buffers sent by SQream"""
+    buffers = []
+    if col["nullable"]:
+        buffers.append(bytes(1 if val is None else 0 for val in values))
+
+    if col["type"][0] == 'ftArray':
+        packed = [b'' if val is None else _pack_array(col["type"], val) for val in values]
+        buffers.append(struct.pack(f'{len(packed)}i', *map(len, packed)))
+        buffers.append(b''.join(packed))
+    elif col["isTrueVarChar"]:
+        encoded = [b'' if val is None else val.encode('utf8') for val in values]
+        buffers.append(struct.pack(f'{len(encoded)}i', *map(len, encoded)))
+        buffers.append(b''.join(encoded))
+    else:
+        buffers.append(b''.join(
+            _pack_value(col["type"], _placeholder(col["type"]) if val is None else val)
+            for val in values
+        ))
+    return buffers
+
+
+def encode_chunk(columns: List[dict], rows: List[tuple]) -> tuple:
+    """Encode rows into (amount of rows, list of column buffers)"""
+    buffers = []
+    for idx, col in enumerate(columns):
+        buffers.extend(encode_column(col, [row[idx] for row in rows]))
+    return len(rows), buffers
+
+
+class ClientMock:
+    """Mock of pysqream.SQSocket.Client which serves prepared chunks"""
+
+    def __init__(self, columns: List[dict], chunks: List[List[tuple]]):
+        self.columns = columns
+        self.chunks = [encode_chunk(columns, rows) for rows in chunks]
+        self.pending = bytearray()
+        self.sent = []
+
+    def send_string(self, json_cmd: str, get_response: bool = True, *_, **__) -> Optional[str]:
+        self.sent.append(json_cmd)
+        command = next(iter(json.loads(json_cmd)))
+        if command == "getStatementId":
+            return json.dumps({"statementId": 1})
+        if command == "prepareStatement":
+            return json.dumps({"statementPrepared": True})
+        if command == "execute":
+            return json.dumps({"executed": True})
+        if command == "queryTypeIn":
+            return json.dumps({"queryType": []})
+        if command == "queryTypeOut":
+            return json.dumps({"queryTypeNamed": self.columns})
+        if command == "fetch":
+            if not self.chunks:
+                return json.dumps({"colSzs": [], "rows": 0})
+            rows, buffers = self.chunks.pop(0)
+            # Header followed by all buffers of chunk
+            self.pending = bytearray(10) + b''.join(buffers)
+            return json.dumps({"colSzs": [len(buf) for buf in buffers], "rows": rows})
+        if command == "closeStatement":
+            return json.dumps({"statementClosed": True})
+        return json.dumps({command: command})
+
+    def validate_response(self, response: str, expected: str) -> None:
+        assert expected in response
+
+    def receive(self, byte_num: int) -> bytearray:
+        data = bytearray(byte_num)
+        self.receive_into(memoryview(data))
+        return data
+
+    def receive_into(self, view: memoryview) -> None:
+        assert len(view) <= len(self.pending)
+        view[:] = self.pending[:len(view)]
+        del self.pending[:len(view)]
+
+
+class ConnectionMock:
+    """Mock of pysqream.connection.Connection to prevent real connection"""
+    # pylint: disable=too-few-public-methods; they are not need for Mocks
+    socket = None
+    ping_loop = None
+    connection_id = None
+    version = 'Mock1'
+    prefetch_depth = 0
+    prefetch_max_bytes = 0
+    max_buffered_bytes = 0
+    lazy_rows = False
+    converters = {}
+    dictionary_encode = False
+    row_factory = None
+    decode_workers = 0
+    fetch_chunk_rows = 0
+    fetch_chunk_bytes = 0
+    fetch_memory_budget = 0
+    varchar_enc = 'ascii'
+    allow_array = True
+    cur_closed = False
+
+    def __init__(self, client: ClientMock):
+        self.client = client
+
+    def _verify_cur_open(self):
+        pass
+
+    def close_connection(self):
+        pass
+
+    def cursor(self) -> Cursor:
+        return Cursor(self, [])
+
+
+def mock_cursor(columns: List[dict], chunks: List[List[tuple]]) -> Cursor:
+    """Cursor with executed SELECT which result consists of chunks"""
+    cur = Cursor(ConnectionMock(ClientMock(columns, chunks)), [])
+    cur.execute("SELECT * FROM mock")
+    return cur
@@ -0,0 +1,99 @@
+"""Test vectorized extraction of ARRAY columns"""
+import tracemalloc
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from pysqream.columnar import split_fixed_arrays
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+INTS = column("i", ["ftArray", "ftInt", 4, 0], nullable=True)
+ROWS = [([1, 5, None, 10],), (None,), ([],), ([356, 2, 10, 3, 4, 5, 6, 7, 8, 9],)]
+
+FIXED = [
+    (["ftBool", 1, 0], [True, None, False]),
+    (["ftUByte", 1, 0], [1, 255, None, 0]),
+    (["ftShort", 2, 0], [-3] * 9),
+    (["ftLong", 8, 0], [None, 2 ** 40]),
+    (["ftFloat", 4, 0], [0.5, None]),
+    (["ftDouble", 8, 0], [1.25, -2.5, None] * 3),
+    (["ftNumeric", 16, 3], [Decimal("1.500"), None, Decimal("-99999.001")]),
+    (["ftDate", 4, 0], [date(2020, 1, 1), None, date(1955, 11, 5)]),
+    (["ftDateTime", 8, 0], [datetime(2020, 1, 1, 10, 30), None]),
+]
+
+
+def array_rows(values: list) -> list:
+    """Utility to make rows of array column of different lengths"""
+    return [(values,), (None,), (values[:1],), (values[::-1],)]
+
+
+@pytest.mark.parametrize("type_tup, values", FIXED)
+def test_rows_of_fixed_arrays(type_tup, values):
+    """Test arrays of every type with fixed size are extracted as lists"""
+    rows = array_rows(values)
+    cur = mock_cursor([column("a", ["ftArray"] + type_tup, nullable=True)], [rows])
+
+    assert cur.fetchall() == rows
+
+
+@pytest.mark.parametrize("type_tup, values", FIXED)
+def test_arrow_list_array(type_tup, values):
+    """Test Arrow result of arrays equals rows"""
+    rows = array_rows(values)
+    cur = mock_cursor([column("a", ["ftArray"] + type_tup, nullable=True)], [rows])
+
+    array = cur.fetch_arrow_table().column("a")
+    assert pa.types.is_list(array.type)
+    assert array.to_pylist() == [val for val, in rows]
+
+
+def test_text_arrays():
+    """Test arrays of TEXT keep going through lists"""
+    rows = [(["ABC", "ABCDEF", None],), (None,), ([],), (["", "x" * 9],)]
+    columns = [column("t", ["ftArray", "ftBlob", 0, 0], nullable=True)]
+
+    assert mock_cursor(columns, [rows]).fetchall() == rows
+    assert mock_cursor(columns, [rows]).fetch_arrow_table().column("t").to_pylist() == [val for val, in rows]
+
+
+def test_numpy_2d_for_same_lengths():
+    """Test arrays of the same length make 2-D masked array"""
+    chunks = [[([1, None, 3],), (None,)], [([4, 5, 6],)]]
+    res = mock_cursor([INTS], chunks).fetch_numpy()["i"]
+
+    assert res.shape == (3, 3)
+    assert res.dtype == np.int32
+    assert res.tolist() == [[1, None, 3], [None, None, None], [4, 5, 6]]
+
+
+def test_numpy_objects_for_different_lengths():
+    """Test arrays of different lengths stay lists, also across chunks"""
+    assert mock_cursor([INTS], [ROWS]).fetch_numpy()["i"].tolist() == [val for val, in ROWS]
+
+    chunks = [[([1, 2],)], [([3, 4, 5],), (None,)]]
+    assert mock_cursor([INTS], chunks).fetch_numpy()["i"].tolist() == [[1, 2], [3, 4, 5], None]
+
+
+def test_split_memory():
+    """Test splitting arrays takes memory proportional to items, not to
+    multiple copies of buffer as wide as int64"""
+    rows = 100000
+    array = bytes(16) + np.arange(10, dtype=np.int32).tobytes()  # 10 not null items
+    data = array * rows
+    lengths = np.full(rows, len(array), dtype=np.int32).tobytes()
+
+    tracemalloc.start()
+    try:
+        offsets, item_mask, items = split_fixed_arrays(memoryview(lengths), memoryview(data), 4)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert np.diff(offsets).tolist() == [10] * rows and not item_mask.any()
+    assert items.view(np.int32).reshape(rows, 10)[-1].tolist() == list(range(10))
+    assert peak < 3 * len(data)
@@ -0,0 +1,75 @@
+"""Test size of result chunks requested on statement prepare"""
+import json
+
+import pytest
+
+from pysqream.cursor import Cursor
+from tests.test_cursor.mock_fetch import ClientMock, ConnectionMock, column
+
+
+COLUMNS = [column("i", ["ftInt", 4, 0], nullable=True), column("l", ["ftLong", 8, 0])]
+# 4 + 1 bytes of nullable INT and 8 bytes of BIGINT
+ROW_WIDTH = 13
+STATEMENT = "SELECT * FROM mock"
+
+
+@pytest.fixture(name="cursor")
+def mock_cursor():
+    """Cursor with mock connection, not executed yet"""
+    client = ClientMock(COLUMNS, [])
+    return Cursor(ConnectionMock(client), [])
+
+
+def execute(cur: Cursor) -> int:
+    """Utility to execute statement, fetch its result and get sent chunk size"""
+    cur.client.chunks.append(ClientMock(COLUMNS, [[(i, i) for i in range(10)]]).chunks[0])
+    cur.execute(STATEMENT)
+    cur.fetchall()
+    prepare = [json.loads(cmd) for cmd in cur.client.sent if "prepareStatement" in cmd][-1]
+    return prepare["chunkSize"]
+
+
+def test_chunk_size_is_chosen_by_sqream_by_default(cursor):
+    """Test chunk size is not requested without fetch options"""
+    assert execute(cursor) == 0
+    assert execute(cursor) == 0
+
+
+def test_fixed_rows(cursor):
+    """Test fixed amount of rows is requested from the first execution"""
+    cursor.fetch_chunk_rows = 500
+    cursor.fetch_chunk_bytes = 100
+    assert execute(cursor) == 500
+
+
+def test_fixed_bytes_uses_measured_row_width(cursor):
+    """Test chunk size in bytes is turned into rows by measured row width"""
+    cursor.fetch_chunk_bytes = 1300
+    assert execute(cursor) == 0
+    assert cursor.decode_plans.row_width(STATEMENT) == ROW_WIDTH
+    assert execute(cursor) == 100
+
+
+def test_fixed_bytes_is_at_least_one_row(cursor):
+    """Test too small chunk in bytes still holds a row"""
+    cursor.fetch_chunk_bytes = 1
+    execute(cursor)
+    assert execute(cursor) == 1
+
+
+def test_memory_budget_is_shared_with_prefetch(cursor):
+    """Test adaptive chunk size counts chunks received ahead"""
+    cursor.fetch_memory_budget = 3900
+    execute(cursor)
+    assert execute(cursor) == 300
+
+    cursor.prefetch_depth = 2
+    assert execute(cursor) == 100
+    cursor.close_stmt()
+
+
+def test_estimated_row_width_before_fetch(cursor):
+    """Test row width is estimated by columns if result was not fetched"""
+    cursor.execute(STATEMENT)
+    cursor.close_stmt()
+    assert cursor.decode_plans.row_width(STATEMENT) == ROW_WIDTH
@@ -20,6 +20,17 @@ class ConnectionMock:
     ping_loop = None
     connection_id = None
     version = 'Mock1'
+    prefetch_depth = 0
+    prefetch_max_bytes = 0
+    max_buffered_bytes = 0
+    lazy_rows = False
+    converters = {}
+    dictionary_encode = False
+    row_factory = None
+    decode_workers = 0
+    fetch_chunk_rows = 0
+    fetch_chunk_bytes = 0
+    fetch_memory_budget = 0
 
 
 def test_raise_on_error_from_sqream(monkeypatch):
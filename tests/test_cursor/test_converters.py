@@ -0,0 +1,117 @@
+"""Test conversion of fetched columns by SQream type"""
+from datetime import date, datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from pysqream.converters import resolve_converter
+from pysqream.cursor import Cursor
+from pysqream.utils import ProgrammingError
+from tests.test_cursor.mock_fetch import ClientMock, ConnectionMock, column
+
+
+COLUMNS = [
+    column("d", ["ftDate", 4, 0], nullable=True),
+    column("dt", ["ftDateTime", 8, 0]),
+    column("n", ["ftNumeric", 16, 2], nullable=True),
+    column("t", ["ftBlob", 0, 0], tvc=True),
+    column("v", ["ftVarchar", 5, 0]),
+]
+ROWS = [
+    (date(1970, 1, 2), datetime(1970, 1, 1, 0, 0, 1, 500000), Decimal("12.34"), "abc", "xy"),
+    (None, datetime(2020, 5, 17, 10, 30), None, "", "hello"),
+]
+
+
+def fetch(converters: dict) -> list:
+    """Utility to fetch ROWS by cursor with given converters"""
+    cur = Cursor(ConnectionMock(ClientMock(COLUMNS, [ROWS])), [])
+    cur.converters = converters
+    cur.execute("SELECT * FROM mock")
+    return cur.fetchall()
+
+
+def test_default_conversion():
+    """Test values are converted by default without converters"""
+    assert fetch({}) == ROWS
+    assert fetch({"ftDate": "date", "ftNumeric": "decimal", "ftBlob": "str"}) == ROWS
+
+
+def test_epoch_converters():
+    """Test dates as days and datetimes as milliseconds since epoch"""
+    rows = fetch({"ftDate": "epoch", "ftDateTime": "epoch"})
+
+    assert [row[0] for row in rows] == [1, None]
+    assert [row[1] for row in rows] == [1500, 1589711400000]
+
+
+def test_datetime64_converters():
+    """Test dates and datetimes as numpy datetime64"""
+    rows = fetch({"ftDate": "datetime64", "ftDateTime": "datetime64"})
+
+    assert rows[0][0] == np.datetime64("1970-01-02")
+    assert rows[1][0] is None
+    assert rows[1][1] == np.datetime64("2020-05-17T10:30:00.000")
+
+
+def test_numeric_converters():
+    """Test NUMERIC as float and as unscaled int"""
+    assert [row[2] for row in fetch({"ftNumeric": "float"})] == [12.34, None]
+    assert [row[2] for row in fetch({"ftNumeric": "raw"})] == [1234, None]
+
+
+def test_text_as_bytes():
+    """Test TEXT and VARCHAR values as bytes"""
+    rows = fetch({"ftBlob": "bytes", "ftVarchar": "bytes"})
+
+    assert [row[3] for row in rows] == [b"abc", b""]
+    assert [row[4] for row in rows] == [b"xy", b"hello"]
+
+
+def test_callable_gets_whole_column():
+    """Test callable converts raw values of the whole column"""
+    calls = []
+
+    def day_numbers(values):
+        calls.append(values)
+        return values * 2
+
+    rows = fetch({"ftDate": day_numbers})
+
+    assert len(calls) == 1 and isinstance(calls[0], np.ndarray) and calls[0].dtype == np.int32
+    assert rows[0][0] == 719469 * 2
+    assert rows[1][0] is None
+
+
+def test_converters_invalidate_cached_plan():
+    """Test changed converters apply to the next execution of statement"""
+    client = ClientMock(COLUMNS, [ROWS])
+    cur = Cursor(ConnectionMock(client), [])
+    cur.execute("SELECT * FROM mock")
+    assert cur.fetchall() == ROWS
+
+    client.chunks = ClientMock(COLUMNS, [ROWS]).chunks
+    cur.converters["ftNumeric"] = "float"
+    cur.execute("SELECT * FROM mock")
+    assert cur.fetchone()[2] == 12.34
+    cur.close_stmt()
+
+
+def test_arrow_keeps_sqream_types():
+    """Test converters do not change Arrow result"""
+    cur = Cursor(ConnectionMock(ClientMock(COLUMNS, [ROWS])), [])
+    cur.converters = {"ftDate": "epoch"}
+    cur.execute("SELECT * FROM mock")
+
+    assert cur.fetch_arrow_table().column("d").to_pylist() == [date(1970, 1, 2), None]
+
+
+def test_unknown_converter():
+    """Test unknown converter names and types are rejected"""
+    with pytest.raises(ProgrammingError):
+        resolve_converter("ftDate", "julian")
+    with pytest.raises(ProgrammingError):
+        resolve_converter("ftInt", "raw")
+    with pytest.raises(ProgrammingError):
+        fetch({"ftNumeric": "int"})
@@ -0,0 +1,57 @@
+"""Test decode plan resolved once per statement"""
+from pysqream.decode_plan import DecodePlanCache, build_decode_plan
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0], nullable=True),
+    column("t", ["ftBlob", 0, 0], tvc=True),
+    column("n", ["ftNumeric", 16, 6]),
+    column("a", ["ftArray", "ftLong", 8, 0], nullable=True),
+]
+
+
+def test_plan_layout():
+    """Test layout of buffers and extractors resolved by plan"""
+    plan = build_decode_plan(COLUMNS, 'ascii')
+
+    assert [col.kind for col in plan] == ["datatype", "nvarchar", "numeric", "array"]
+    assert [col.lengths for col in plan] == [None, "true_nvarchar", None, "array_lengths"]
+    assert [col.cast for col in plan] == ["i", None, None, None]
+    assert [col.as_bytes for col in plan] == [False, True, True, False]
+    assert [(col.size, col.scale) for col in plan] == [(4, 0), (0, 0), (16, 6), (8, 0)]
+
+
+def test_plan_reused_on_reexecution():
+    """Test re-execution of the same statement reuses plan"""
+    cur = mock_cursor(COLUMNS[:1], [[(1,)], [(2,)]])
+    plan = cur.decode_plan
+    assert cur.fetchone() == (1,)
+
+    cur.execute("SELECT * FROM mock")
+    assert cur.decode_plan is plan
+    assert cur.fetchone() == (2,)
+
+    cur.execute("SELECT i FROM mock")
+    assert cur.decode_plan is not plan
+
+
+def test_plan_rebuilt_if_columns_changed():
+    """Test plan is not reused for the same statement with other columns"""
+    cache = DecodePlanCache(size=2)
+    plan = cache.get("SELECT * FROM t", COLUMNS, 'ascii')
+
+    assert cache.get("SELECT * FROM t", COLUMNS, 'ascii') is plan
+    assert cache.get("SELECT * FROM t", COLUMNS[:2], 'ascii') is not plan
+
+
+def test_plan_cache_evicts_oldest():
+    """Test cache keeps only `size` recently used plans"""
+    cache = DecodePlanCache(size=2)
+    plan = cache.get("SELECT 1", COLUMNS, 'ascii')
+    cache.get("SELECT 2", COLUMNS, 'ascii')
+    cache.get("SELECT 1", COLUMNS, 'ascii')
+    cache.get("SELECT 3", COLUMNS, 'ascii')
+
+    assert len(cache) == 2
+    assert cache.get("SELECT 1", COLUMNS, 'ascii') is plan
@@ -0,0 +1,63 @@
+"""Test concurrent decoding of columns by thread pool"""
+import threading
+from datetime import date
+
+from pysqream.cursor import Cursor
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0]),
+    column("t", ["ftBlob", 0, 0], nullable=True, tvc=True),
+    column("d", ["ftDate", 4, 0], nullable=True),
+]
+CHUNKS = [[(1, "a", date(2020, 1, 1)), (2, None, None)], [(3, "c", date(1999, 12, 31))]]
+
+
+def parallel_cursor(workers: int = 3) -> Cursor:
+    """Cursor decoding columns with thread pool"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.decode_workers = workers
+    return cur
+
+
+def test_parallel_decode_keeps_result():
+    """Test rows decoded in parallel are the same and in order"""
+    assert parallel_cursor().fetchall() == [row for chunk in CHUNKS for row in chunk]
+
+
+def test_parallel_decode_columnar():
+    """Test numpy and arrow fetches with thread pool"""
+    assert parallel_cursor().fetch_numpy()["t"].tolist() == ["a", None, "c"]
+    assert parallel_cursor().fetch_arrow_table().column("d").to_pylist() == [date(2020, 1, 1), None,
+                                                                              date(1999, 12, 31)]
+
+
+def test_parallel_decode_uses_pool(monkeypatch):
+    """Test columns are decoded by threads of the pool"""
+    threads = set()
+    extract_column = Cursor._extract_column
+
+    def record_thread(self, idx, raw_col_data):
+        threads.add(threading.current_thread().name)
+        return extract_column(self, idx, raw_col_data)
+
+    monkeypatch.setattr(Cursor, "_extract_column", record_thread)
+    cur = parallel_cursor()
+    cur.fetchall()
+
+    assert threads and all(name.startswith("pysqream-decode") for name in threads)
+    cur.close()
+    assert cur.decode_executor is None
+
+
+def test_pool_recreated_for_other_amount_of_workers():
+    """Test changing decode_workers replaces the pool"""
+    cur = parallel_cursor()
+    pool = cur._get_decode_executor()  # pylint: disable=protected-access
+    assert cur._get_decode_executor() is pool  # pylint: disable=protected-access
+
+    cur.decode_workers = 2
+    assert cur._get_decode_executor() is not pool  # pylint: disable=protected-access
+    assert cur.fetchall() == [row for chunk in CHUNKS for row in chunk]
+    cur.close()
@@ -0,0 +1,61 @@
+"""Test dictionary encoded TEXT and VARCHAR columns"""
+import pyarrow as pa
+import pytest
+
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("status", ["ftBlob", 0, 0], nullable=True, tvc=True),
+    column("country", ["ftVarchar", 8, 0]),
+    column("comment", ["ftBlob", 0, 0], tvc=True),
+]
+CHUNKS = [
+    [("open", "IL", "first"), ("closed", "US", "second"), (None, "IL", "third")],
+    [("open", "US", "fourth"), ("open", "IL", "fifth")],
+]
+ROWS = [row for chunk in CHUNKS for row in chunk]
+
+
+def cursor(dictionary_encode):
+    """Utility to create cursor with given dictionary_encode option"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.dictionary_encode = dictionary_encode
+    return cur
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_rows_share_strings(monkeypatch, arrow):
+    """Test equal values of chosen columns are the same objects across chunks"""
+    monkeypatch.setattr("pysqream.cursor.ARROW", arrow)
+    rows = cursor(True).fetchall()
+
+    assert rows == ROWS
+    assert rows[0][0] is rows[3][0] is rows[4][0]
+    assert rows[0][1] is rows[2][1] is rows[4][1]
+
+
+def test_columns_by_name():
+    """Test only columns chosen by name are dictionary encoded"""
+    table = cursor({"status"}).fetch_arrow_table()
+
+    assert pa.types.is_dictionary(table.schema.field("status").type)
+    assert table.schema.field("country").type == pa.string()
+    assert table.column("status").to_pylist() == [row[0] for row in ROWS]
+
+
+def test_arrow_dictionary_arrays():
+    """Test Arrow record batches hold dictionary arrays"""
+    batches = list(cursor(True).fetch_record_batches())
+
+    assert all(isinstance(batch.column(1), pa.DictionaryArray) for batch in batches)
+    assert batches[0].column(1).dictionary.to_pylist() == ["IL", "US"]
+
+
+def test_pandas_categorical():
+    """Test DataFrame gets categorical columns"""
+    df = cursor(["status", "country"]).fetch_df()
+
+    assert df["status"].dtype == "category"
+    assert df["country"].tolist() == [row[1] for row in ROWS]
+    assert df["comment"].dtype != "category"
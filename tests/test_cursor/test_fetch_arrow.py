@@ -0,0 +1,73 @@
+"""Test fetching results as Arrow record batches and tables"""
+from datetime import datetime
+from decimal import Decimal
+
+import pyarrow as pa
+import pytest
+
+from pysqream.utils import ProgrammingError
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftLong", 8, 0]),
+    column("b", ["ftBool", 1, 0], nullable=True),
+    column("n", ["ftNumeric", 16, 4], nullable=True),
+    column("t", ["ftBlob", 0, 0], nullable=True, tvc=True),
+    column("v", ["ftVarchar", 5, 0]),
+    column("dt", ["ftDateTime", 8, 0], nullable=True),
+]
+
+CHUNKS = [
+    [(1, True, Decimal("1.2345"), "one", "ab", datetime(2020, 1, 1, 10, 30)),
+     (2, None, None, None, "cd", None)],
+    [(3, False, Decimal("-3.5"), "три", "efg", datetime(1999, 12, 31, 23, 59, 59, 999000))],
+]
+
+
+def test_fetch_record_batches_per_chunk():
+    """Test every chunk turns into a record batch"""
+    batches = list(mock_cursor(COLUMNS, CHUNKS).fetch_record_batches())
+
+    assert [batch.num_rows for batch in batches] == [2, 1]
+    assert batches[0].schema.field("n").type == pa.decimal128(38, 4)
+    assert batches[0].schema.field("i").nullable is False
+
+
+def test_fetch_arrow_table():
+    """Test values of all types of table"""
+    table = mock_cursor(COLUMNS, CHUNKS).fetch_arrow_table()
+
+    assert table.to_pydict() == {
+        "i": [1, 2, 3],
+        "b": [True, None, False],
+        "n": [Decimal("1.2345"), None, Decimal("-3.5000")],
+        "t": ["one", None, "три"],
+        "v": ["ab", "cd", "efg"],
+        "dt": [datetime(2020, 1, 1, 10, 30), None, datetime(1999, 12, 31, 23, 59, 59, 999000)],
+    }
+
+
+def test_fetch_arrow_table_empty_result():
+    """Test empty result keeps schema of statement"""
+    table = mock_cursor([column("d", ["ftDate", 4, 0])], []).fetch_arrow_table()
+
+    assert table.num_rows == 0
+    assert table.schema.field("d").type == pa.date32()
+
+
+def test_arrow_c_stream():
+    """Test cursor could be consumed through Arrow PyCapsule Interface"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    reader = pa.RecordBatchReader.from_stream(cur)
+
+    assert reader.read_all().column("i").to_pylist() == [1, 2, 3]
+
+
+def test_arrow_fetch_after_fetchone_raises():
+    """Test continuing partial fetch of rows by arrow fetch raises"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.fetchone()
+
+    with pytest.raises(ProgrammingError):
+        cur.fetch_arrow_table()
@@ -0,0 +1,72 @@
+"""Test fetching results as pandas DataFrame"""
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+
+from pysqream import read_sql
+from tests.test_cursor.mock_fetch import ClientMock, ConnectionMock, column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0]),
+    column("ni", ["ftLong", 8, 0], nullable=True),
+    column("b", ["ftBool", 1, 0], nullable=True),
+    column("t", ["ftBlob", 0, 0], nullable=True, tvc=True),
+    column("d", ["ftDate", 4, 0], nullable=True),
+    column("dt", ["ftDateTime", 8, 0]),
+]
+
+CHUNKS = [
+    [(1, 10, True, "one", date(2020, 1, 1), datetime(2020, 1, 1, 10, 30)),
+     (2, None, None, None, None, datetime(2021, 5, 6, 7, 8, 9, 123000))],
+    [(3, 30, False, "three", date(1999, 12, 31), datetime(1999, 12, 31))],
+]
+
+
+def test_fetch_df_dtypes():
+    """Test nullable columns get extension dtypes and others numpy ones"""
+    df = mock_cursor(COLUMNS, CHUNKS).fetch_df()
+
+    assert df["i"].dtype == np.int32
+    assert df["ni"].dtype == pd.Int64Dtype()
+    assert df["b"].dtype == pd.BooleanDtype()
+    assert df["t"].dtype == pd.StringDtype("pyarrow")
+    assert df["d"].dtype == np.dtype("datetime64[ms]")
+    assert df["dt"].dtype == np.dtype("datetime64[ms]")
+
+
+def test_fetch_df_values():
+    """Test values and nulls of DataFrame"""
+    df = mock_cursor(COLUMNS, CHUNKS).fetch_df()
+
+    assert df["ni"].tolist() == [10, pd.NA, 30]
+    assert df["t"].tolist() == ["one", pd.NA, "three"]
+    assert pd.isna(df["d"][1])
+    assert df["d"][2] == pd.Timestamp(1999, 12, 31)
+    assert df["dt"][1] == pd.Timestamp(2021, 5, 6, 7, 8, 9, 123000)
+
+
+def test_read_sql():
+    """Test read_sql returns whole result as one DataFrame"""
+    df = read_sql(ConnectionMock(ClientMock(COLUMNS, CHUNKS)), "SELECT * FROM mock")
+
+    assert df["i"].tolist() == [1, 2, 3]
+
+
+def test_read_sql_chunksize():
+    """Test read_sql with chunksize returns DataFrames of chunksize rows"""
+    chunks = list(read_sql(ConnectionMock(ClientMock(COLUMNS, CHUNKS)), "SELECT * FROM mock", chunksize=2))
+
+    assert [df["i"].tolist() for df in chunks] == [[1, 2], [3]]
+
+
+def test_read_sql_chunksize_closes_cursor():
+    """Test cursor is opened on first iteration and closed with generator"""
+    conn = ConnectionMock(ClientMock(COLUMNS, CHUNKS))
+    chunks = read_sql(conn, "SELECT * FROM mock", chunksize=1)
+    assert conn.cur_closed is False
+
+    assert next(chunks)["i"].tolist() == [1]
+    chunks.close()
+    assert conn.cur_closed is True
@@ -0,0 +1,88 @@
+"""Test fetching rows into preallocated buffers"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from pysqream.utils import DataError, NotSupportedError, ProgrammingError
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0]),
+    column("d", ["ftDouble", 8, 0], nullable=True),
+    column("dt", ["ftDate", 4, 0]),
+    column("t", ["ftBlob", 0, 0], tvc=True),
+]
+CHUNKS = [
+    [(1, 1.5, date(2020, 1, 1), "a"), (2, None, date(2021, 2, 3), "b")],
+    [(3, 3.5, date(1999, 12, 31), "c")],
+    [(4, 4.5, date(2024, 2, 29), "d"), (5, None, date(1955, 11, 5), "e")],
+]
+
+
+def test_fill_matrix_in_portions():
+    """Test rows are written into columns of matrix across chunks"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    matrix = np.zeros((3, 2))
+    nulls = np.zeros((3, 2), dtype=np.bool_)
+
+    assert cur.fetch_into([matrix[:, 0], matrix[:, 1], None, None], [None, nulls[:, 1], None, None]) == 3
+    assert matrix.tolist() == [[1, 1.5], [2, 0], [3, 3.5]]
+    assert nulls[:, 1].tolist() == [False, True, False]
+
+    assert cur.fetch_into([matrix[:, 0], matrix[:, 1], None, None], [None, nulls[:, 1], None, None]) == 2
+    assert matrix[:2].tolist() == [[4, 4.5], [5, 0]]
+    assert nulls[:2, 1].tolist() == [False, True]
+
+    assert cur.fetch_into([matrix[:, 0], None, None, None]) == 0
+
+
+def test_buffers_by_name():
+    """Test buffers given by column name, including raw buffers"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    ints = bytearray(4 * 5)
+    dates = np.empty(5, dtype="datetime64[D]")
+
+    assert cur.fetch_into({"i": ints, "dt": dates}) == 5
+    assert np.frombuffer(ints, dtype=np.int32).tolist() == [1, 2, 3, 4, 5]
+    assert dates.tolist() == [row[2] for chunk in CHUNKS for row in chunk]
+
+
+def test_rest_by_fetchmany_numpy():
+    """Test rows which did not fit are fetched as numpy columns"""
+    cur = mock_cursor(COLUMNS[:3], [[row[:3] for row in chunk] for chunk in CHUNKS])
+    ints, doubles, nulls, dates = np.empty(1, np.int64), np.empty(1), np.empty(1, np.bool_), np.empty(1, "M8[D]")
+
+    assert cur.fetch_into([ints, doubles, dates], [None, nulls, None]) == 1
+    assert cur.fetchmany_numpy(10)["i"].tolist() == [2, 3, 4, 5]
+
+
+def test_rest_without_skipped_columns():
+    """Test rows left with skipped columns are fetched only by fetch_into()"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    ints = np.empty(1, np.int64)
+
+    assert cur.fetch_into([ints, None, None, None]) == 1
+    with pytest.raises(ProgrammingError):
+        cur.fetch_numpy()
+    with pytest.raises(ProgrammingError):
+        cur.fetchall()
+
+    rest = np.empty(10, np.int64)
+    assert cur.fetch_into({"i": rest}) == 4
+    assert rest[:4].tolist() == [2, 3, 4, 5]
+
+
+def test_invalid_buffers():
+    """Test unsupported types, unsafe casts and missing masks"""
+    with pytest.raises(NotSupportedError):
+        mock_cursor(COLUMNS, CHUNKS).fetch_into({"t": np.empty(5, dtype=object)})
+    with pytest.raises(ProgrammingError):
+        mock_cursor(COLUMNS, CHUNKS).fetch_into({"d": np.empty(5, dtype=np.float32)})
+    with pytest.raises(ProgrammingError):
+        mock_cursor(COLUMNS, CHUNKS).fetch_into({"i": bytes(20)})
+    with pytest.raises(ProgrammingError):
+        mock_cursor(COLUMNS, CHUNKS).fetch_into([np.empty(5, dtype=np.int32)])
+    with pytest.raises(DataError):
+        mock_cursor(COLUMNS, CHUNKS).fetch_into({"d": np.empty(5)})
@@ -0,0 +1,87 @@
+"""Test fetching results as columns of numpy arrays"""
+from datetime import date
+
+import numpy as np
+import pytest
+
+from pysqream.columnar import ColumnBuilder
+from pysqream.utils import ProgrammingError
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0]),
+    column("d", ["ftDouble", 8, 0], nullable=True),
+    column("t", ["ftBlob", 0, 0], nullable=True, tvc=True),
+    column("dt", ["ftDate", 4, 0]),
+]
+
+CHUNKS = [
+    [(1, 1.5, "one", date(2020, 1, 1)), (2, None, None, date(2021, 2, 3))],
+    [(3, 3.5, "three", date(1999, 12, 31))],
+    [(4, None, "", date(2024, 2, 29)), (5, 5.5, "five", date(1955, 11, 5))],
+]
+
+
+def test_fetch_numpy_all_chunks():
+    """Test all chunks are concatenated with proper dtypes and masks"""
+    res = mock_cursor(COLUMNS, CHUNKS).fetch_numpy()
+
+    assert list(res) == ["i", "d", "t", "dt"]
+    assert res["i"].dtype == np.int32
+    assert res["i"].tolist() == [1, 2, 3, 4, 5]
+
+    assert isinstance(res["d"], np.ma.MaskedArray)
+    assert res["d"].dtype == np.float64
+    assert res["d"].tolist() == [1.5, None, 3.5, None, 5.5]
+
+    assert res["t"].dtype == object
+    assert res["t"].tolist() == ["one", None, "three", "", "five"]
+
+    assert res["dt"].tolist() == [date(2020, 1, 1), date(2021, 2, 3), date(1999, 12, 31),
+                                  date(2024, 2, 29), date(1955, 11, 5)]
+
+
+def test_fetchmany_numpy_across_chunks():
+    """Test fetchmany_numpy splits chunks and keeps rest for next call"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+
+    assert cur.fetchmany_numpy(1)["i"].tolist() == [1]
+    assert cur.fetchmany_numpy(3)["i"].tolist() == [2, 3, 4]
+    assert cur.fetchmany_numpy(3)["d"].tolist() == [5.5]
+    assert cur.fetchmany_numpy(3)["i"].tolist() == []
+
+
+def test_fetch_numpy_empty_result():
+    """Test empty result has columns of proper dtypes"""
+    res = mock_cursor(COLUMNS, []).fetch_numpy()
+
+    assert res["i"].dtype == np.int32
+    assert len(res["i"]) == 0
+    assert isinstance(res["d"], np.ma.MaskedArray)
+
+
+def test_fetch_numpy_single_chunk_without_copy():
+    """Test column of one chunk result uses received buffer"""
+    res = mock_cursor(COLUMNS, CHUNKS[:1]).fetch_numpy()
+
+    assert not res["i"].flags.owndata
+
+
+def test_mix_rows_and_numpy_fetch_raises():
+    """Test continuing partial fetch of rows by numpy fetch raises"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.fetchone()
+
+    with pytest.raises(ProgrammingError):
+        cur.fetch_numpy()
+
+
+def test_column_builder_grows_geometrically():
+    """Test capacity of builder doubles instead of growing per append"""
+    builder = ColumnBuilder(np.int64, nullable=False)
+    for start in range(0, 100, 10):
+        builder.append(np.arange(start, start + 10))
+
+    assert builder.build().tolist() == list(range(100))
+    assert len(builder._values) == 160  # pylint: disable=protected-access
@@ -0,0 +1,48 @@
+"""Test iteration over cursor fetches data chunk by chunk"""
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [column("i", ["ftInt", 4, 0]), column("t", ["ftBlob", 0, 0], nullable=True, tvc=True)]
+CHUNKS = [[(1, "a"), (2, None)], [(3, "c")], [(4, "d"), (5, "e")]]
+
+
+def fetches_sent(cur) -> int:
+    """Count of fetch requests sent to (mock) SQream"""
+    return sum('"fetch"' in cmd for cmd in cur.client.sent)
+
+
+def test_iter_all_rows():
+    """Test iteration returns rows of all chunks"""
+    assert list(mock_cursor(COLUMNS, CHUNKS)) == [(1, "a"), (2, None), (3, "c"), (4, "d"), (5, "e")]
+
+
+def test_iter_fetches_lazily():
+    """Test the first row is returned after fetch of the first chunk only"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    rows = iter(cur)
+
+    assert next(rows) == (1, "a")
+    assert fetches_sent(cur) == 1
+    assert next(rows) == (2, None)
+    assert next(rows) == (3, "c")
+    assert fetches_sent(cur) == 2
+
+
+def test_iter_continues_fetchone():
+    """Test iteration starts from rows left by fetchone"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+
+    assert cur.fetchone() == (1, "a")
+    assert [row[0] for row in cur] == [2, 3, 4, 5]
+
+
+def test_iter_close_early_closes_statement():
+    """Test closing iteration before its end closes the statement"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    rows = iter(cur)
+    next(rows)
+    rows.close()
+
+    assert not cur.open_statement
+    assert '{"closeStatement": "closeStatement"}' in cur.client.sent
+    assert cur.fetchall() == []
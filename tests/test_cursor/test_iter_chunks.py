@@ -0,0 +1,116 @@
+"""Test iteration over chunks with lazily decoded columns"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from pysqream.cursor import Cursor
+from pysqream.utils import ProgrammingError
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0]),
+    column("n", ["ftNumeric", 16, 2], nullable=True),
+    column("d", ["ftDate", 4, 0]),
+    column("t", ["ftBlob", 0, 0], nullable=True, tvc=True),
+]
+CHUNKS = [
+    [(1, Decimal("1.50"), date(2020, 1, 1), "a"), (2, None, date(2021, 2, 3), None)],
+    [(3, Decimal("-7.25"), date(1999, 12, 31), "ccc")],
+]
+
+
+def test_chunks_hold_all_rows():
+    """Test chunks follow fetched chunks of result"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    chunks = list(cur.iter_chunks())
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert [chunk.rows() for chunk in chunks] == CHUNKS
+    assert chunks[1].row(0) == CHUNKS[1][0]
+    assert not cur.open_statement
+
+
+def test_only_accessed_columns_are_decoded(monkeypatch):
+    """Test columns are decoded on access by index or name"""
+    decoded = []
+    extract_numeric = Cursor._extract_numeric
+
+    def record_numeric(self, col_plan, raw_col_data):
+        decoded.append(col_plan.name)
+        return extract_numeric(self, col_plan, raw_col_data)
+
+    monkeypatch.setattr(Cursor, "_extract_numeric", record_numeric)
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    chunk = next(cur.iter_chunks())
+
+    assert list(chunk.column(0)) == [1, 2]
+    assert chunk["t"] == ["a", None]
+    assert not chunk.is_decoded("n") and not chunk.is_decoded(2)
+    assert not decoded
+
+    assert chunk["n"] == [Decimal("1.50"), None]
+    assert chunk["n"] == [Decimal("1.50"), None]
+    assert decoded == ["n"]
+    cur.close_stmt()
+
+
+def test_column_shared_between_threads(monkeypatch):
+    """Test column accessed by threads at once is decoded once"""
+    decoded = []
+    started = threading.Barrier(4)
+    extract_numeric = Cursor._extract_numeric
+
+    def slow_numeric(self, col_plan, raw_col_data):
+        decoded.append(col_plan.name)
+        time.sleep(0.05)
+        return extract_numeric(self, col_plan, raw_col_data)
+
+    monkeypatch.setattr(Cursor, "_extract_numeric", slow_numeric)
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    chunk = next(cur.iter_chunks())
+
+    def read():
+        started.wait()
+        return chunk["n"]
+
+    with ThreadPoolExecutor(4) as pool:
+        results = [future.result() for future in [pool.submit(read) for _ in range(4)]]
+
+    assert results == [[Decimal("1.50"), None]] * 4
+    assert decoded == ["n"]
+    cur.close_stmt()
+
+
+def test_chunk_is_readable_after_next_statement():
+    """Test chunk decodes by plan of its own statement"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    chunk = next(cur.iter_chunks())
+    cur.client.columns = [column("x", ["ftDate", 4, 0], nullable=True)]
+    cur.execute("SELECT x FROM other")
+
+    assert chunk["d"] == [date(2020, 1, 1), date(2021, 2, 3)]
+    assert chunk.rows() == CHUNKS[0]
+
+
+def test_closing_iteration_closes_statement():
+    """Test statement is closed if iteration stops before the end"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    chunks = cur.iter_chunks()
+    next(chunks)
+    chunks.close()
+
+    assert not cur.open_statement
+
+
+def test_iter_chunks_after_fetchone():
+    """Test chunks could not follow partially fetched rows"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.fetchone()
+
+    with pytest.raises(ProgrammingError):
+        next(cur.iter_chunks())
@@ -0,0 +1,65 @@
+"""Test iteration over raw chunks of result"""
+import zlib
+
+import numpy as np
+
+from pysqream.casting import sq_texts_to_str
+from tests.test_cursor.mock_fetch import column, encode_chunk, encode_column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0], nullable=True),
+    column("t", ["ftBlob", 0, 0], tvc=True),
+    column("v", ["ftVarchar", 4, 0]),
+]
+CHUNKS = [[(1, "a", "x"), (None, "bb", "yy")], [(3, "", "zzz")]]
+
+
+def test_buffers_as_received():
+    """Test chunks hold the same buffers SQream sent"""
+    chunks = list(mock_cursor(COLUMNS, CHUNKS).iter_raw_chunks())
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    for chunk, rows in zip(chunks, CHUNKS):
+        _, sent = encode_chunk(COLUMNS, rows)
+        received = []
+        for col in chunk.columns:
+            received.extend(buf for buf in (col.nulls, col.lengths, col.data) if buf is not None)
+        assert [bytes(buf) for buf in received] == sent
+
+
+def test_custom_decoding():
+    """Test columns could be decoded by consumer"""
+    chunk = next(mock_cursor(COLUMNS, CHUNKS).iter_raw_chunks())
+    ints, texts, varchars = chunk.columns
+
+    assert ints.type_tup == ["ftInt", 4, 0]
+    assert np.frombuffer(ints.data, dtype=np.int32)[0] == 1
+    assert bytes(ints.nulls) == b"\x00\x01"
+    assert texts.lengths.format == "i" and varchars.lengths is None and varchars.nulls is None
+    assert sq_texts_to_str(texts.lengths, bytes(texts.data)) == ["a", "bb"]
+    assert isinstance(varchars.data, memoryview)
+
+
+def test_checksum_of_result():
+    """Test result could be processed without decoding"""
+    checksum = 0
+    for chunk in mock_cursor(COLUMNS, CHUNKS).iter_raw_chunks():
+        for col in chunk.columns:
+            checksum = zlib.crc32(col.data, checksum)
+
+    expected = 0
+    for rows in CHUNKS:
+        for col, values in zip(COLUMNS, zip(*rows)):
+            expected = zlib.crc32(encode_column(col, list(values))[-1], expected)
+    assert checksum == expected
+
+
+def test_break_closes_statement():
+    """Test leaving iteration early closes the statement"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    for _ in cur.iter_raw_chunks():
+        break
+
+    assert cur.more_to_fetch is False
+    assert cur.fetchall() == []
@@ -0,0 +1,81 @@
+"""Test rows returned as views of fetched chunks"""
+import sys
+from datetime import date
+
+import pytest
+
+from pysqream.chunk import Row
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("i", ["ftInt", 4, 0], nullable=True),
+    column("d", ["ftDate", 4, 0]),
+    column("t", ["ftBlob", 0, 0], tvc=True),
+]
+CHUNKS = [
+    [(1, date(2020, 1, 1), "a"), (None, date(2021, 2, 3), "bb")],
+    [(3, date(1999, 12, 31), "ccc")],
+]
+ROWS = [row for chunk in CHUNKS for row in chunk]
+
+
+def lazy_cursor():
+    """Utility to create cursor returning Row views"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.lazy_rows = True
+    return cur
+
+
+def test_rows_equal_tuples():
+    """Test views compare as tuples of their values"""
+    rows = lazy_cursor().fetchall()
+
+    assert all(isinstance(row, Row) for row in rows)
+    assert rows == ROWS
+    assert rows[2] > rows[0] > (0, date(2030, 1, 1), "")
+    assert sorted(rows, key=lambda row: row["d"]) == sorted(ROWS, key=lambda row: row[1])
+    assert len({rows[0], ROWS[0]}) == 1
+
+
+def test_row_behaves_as_tuple():
+    """Test indexing, slices, length and unpacking of view"""
+    row = lazy_cursor().fetchone()
+    i, d, t = row
+
+    assert (i, d, t) == ROWS[0]
+    assert len(row) == 3
+    assert row[-1] == "a"
+    assert row[:2] == (1, date(2020, 1, 1))
+    assert repr(row) == repr(ROWS[0])
+    with pytest.raises(IndexError):
+        row[3]  # pylint: disable=pointless-statement
+
+
+def test_row_by_column_name():
+    """Test values are accessible by column name"""
+    row = lazy_cursor().fetchmany(2)[1]
+
+    assert row["i"] is None
+    assert row["t"] == "bb"
+
+
+def test_columns_are_decoded_on_access():
+    """Test views decode only accessed columns of their chunk"""
+    row = lazy_cursor().fetchone()
+
+    assert row["t"] == "a"
+    assert row.chunk.is_decoded("t")
+    assert not row.chunk.is_decoded("d")
+
+
+def test_iteration_over_views():
+    """Test iteration over cursor yields views"""
+    assert list(lazy_cursor()) == ROWS
+
+
+def test_view_is_smaller_than_tuple():
+    """Test view takes less memory than tuple of its values"""
+    row = lazy_cursor().fetchone()
+
+    assert sys.getsizeof(row) < sys.getsizeof(ROWS[0]) + sum(map(sys.getsizeof, ROWS[0]))
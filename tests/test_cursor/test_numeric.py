@@ -0,0 +1,93 @@
+"""Test vectorized decoding of NUMERIC columns"""
+from decimal import Decimal
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from pysqream.casting import (sq_numeric_to_decimal,
+                              sq_numerics_to_decimals,
+                              sq_numerics_to_float,
+                              sq_numerics_to_int64,
+                              sq_numerics_to_ints)
+from pysqream.utils import DataError
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+SMALL = [0, 1, -1, 123456789, -987654321, 2 ** 63 - 1, -2 ** 63]
+BIG = SMALL + [2 ** 63, -2 ** 63 - 1, 10 ** 37 + 7, -10 ** 38 + 1]
+
+
+def pack(values: list) -> bytes:
+    """Utility to pack values as SQream sends NUMERIC column"""
+    return b''.join(val.to_bytes(16, 'little', signed=True) for val in values)
+
+
+@pytest.mark.parametrize("values", [SMALL, BIG])
+@pytest.mark.parametrize("scale", [0, 2, 10, 38])
+def test_decimals_match_scalar_conversion(values, scale):
+    """Test bulk conversion gives the same Decimals as per value one"""
+    data = pack(values)
+    expected = [sq_numeric_to_decimal(data[idx:idx + 16], scale) for idx in range(0, len(data), 16)]
+
+    result = sq_numerics_to_decimals(data, scale)
+
+    assert result == expected
+    assert [val.as_tuple() for val in result] == [val.as_tuple() for val in expected]
+
+
+def test_ints_and_int64():
+    """Test unscaled values are taken from int64 only when they fit it"""
+    assert sq_numerics_to_int64(pack(SMALL)).tolist() == SMALL
+    assert sq_numerics_to_int64(pack(BIG)) is None
+    assert sq_numerics_to_ints(pack(SMALL)) == SMALL
+    assert sq_numerics_to_ints(pack(BIG)) == BIG
+
+
+def test_float():
+    """Test float values keep precision of small values"""
+    assert sq_numerics_to_float(pack(BIG), 3).tolist() == [val / 1000 for val in BIG]
+
+
+def test_rows_with_nulls():
+    """Test row path returns Decimals and nulls"""
+    rows = [(Decimal("1.25"),), (None,), (Decimal("-99999999999999999999999.99"),)]
+    cur = mock_cursor([column("n", ["ftNumeric", 16, 2], nullable=True)], [rows])
+
+    assert cur.fetchall() == rows
+
+
+NUMERIC_ROWS = [(Decimal("1.25"),), (None,), (Decimal("-3.50"),)]
+
+
+def numeric_cursor(converter: str, rows: list = None):
+    """Utility to create cursor of nullable NUMERIC(_, 2) column with given converter"""
+    cur = mock_cursor([column("n", ["ftNumeric", 16, 2], nullable=True)], [rows or NUMERIC_ROWS])
+    cur.converters = {"ftNumeric": converter}
+    cur.execute("SELECT * FROM mock")
+    return cur
+
+
+@pytest.mark.parametrize("converter, dtype, values", [("float", np.float64, [1.25, None, -3.5]),
+                                                      ("int64", np.int64, [125, None, -350])])
+def test_converted_numpy_and_arrow(converter, dtype, values):
+    """Test converted NUMERIC keeps numpy dtype in every fetch"""
+    result = numeric_cursor(converter).fetch_numpy()["n"]
+    assert result.dtype == dtype
+    assert result.tolist() == values
+
+    assert [val for val, in numeric_cursor(converter).fetchall()] == values
+
+    array = numeric_cursor(converter).fetch_arrow_table().column("n")
+    assert array.type == pa.from_numpy_dtype(dtype)
+    assert array.to_pylist() == values
+
+    buf, nulls = np.zeros(3, dtype=dtype), np.zeros(3, dtype=np.bool_)
+    assert numeric_cursor(converter).fetch_into([buf], [nulls]) == 3
+    assert nulls.tolist() == [False, True, False]
+
+
+def test_int64_precision_over_18():
+    """Test int64 converter fails on values which do not fit int64"""
+    with pytest.raises(DataError):
+        numeric_cursor("int64", [(Decimal(10 ** 17),), (Decimal(10 ** 19),)]).fetch_numpy()
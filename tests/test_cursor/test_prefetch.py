@@ -0,0 +1,72 @@
+"""Test background prefetch of result chunks"""
+import time
+
+import pytest
+
+from tests.test_cursor.mock_fetch import ClientMock, column, mock_cursor
+
+
+COLUMNS = [column("i", ["ftInt", 4, 0])]
+CHUNKS = [[(1,), (2,)], [(3,)], [(4,), (5,)], [(6,)]]
+
+
+@pytest.fixture(name="cursor")
+def prefetching_cursor():
+    """Cursor with prefetch of 2 chunks"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.prefetch_depth = 2
+    cur.prefetch_max_bytes = 1024
+    yield cur
+    cur.close_stmt()
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """Utility to wait for background thread"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_prefetch_fetches_all_rows(cursor):
+    """Test prefetch does not change result"""
+    assert cursor.fetchall() == [(i,) for i in range(1, 7)]
+    assert not cursor.open_statement
+
+
+def test_prefetch_receives_ahead(cursor):
+    """Test next chunks are received while the current is consumed"""
+    assert cursor.fetchone() == (1,)
+    assert wait_for(lambda: len(cursor.prefetcher.chunks) == 2)
+    assert cursor.fetchmany(4) == [(2,), (3,), (4,), (5,)]
+
+
+def test_prefetch_respects_max_bytes(cursor):
+    """Test nothing more is requested while buffered chunks exceed bound"""
+    cursor.prefetch_max_bytes = 1
+    assert cursor.fetchone() == (1,)
+    assert wait_for(lambda: len(cursor.prefetcher.chunks) == 1)
+    time.sleep(0.05)
+    assert len(cursor.prefetcher.chunks) == 1
+
+
+def test_close_stops_prefetch(cursor):
+    """Test statement is closed after background receive is stopped"""
+    cursor.fetchone()
+    prefetcher = cursor.prefetcher
+    cursor.close_stmt()
+
+    assert not prefetcher.is_alive()
+    assert cursor.client.sent[-1] == '{"closeStatement": "closeStatement"}'
+
+
+def test_prefetch_error_raised_on_fetch(cursor, monkeypatch):
+    """Test error of background receive is raised by fetch"""
+    def fail(*_):
+        raise ConnectionRefusedError("mock connection interrupted")
+
+    monkeypatch.setattr(ClientMock, "receive", fail)
+    with pytest.raises(ConnectionRefusedError):
+        cursor.fetchall()
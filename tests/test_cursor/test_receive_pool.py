@@ -0,0 +1,74 @@
+"""Test pooled buffers for receiving chunks of result"""
+import numpy as np
+
+from pysqream.receive_pool import ReceiveBufferPool
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+def test_released_buffer_is_reused():
+    """Test buffer is reused once its views are released"""
+    pool = ReceiveBufferPool(2)
+    first = pool.acquire(100)
+    base = first.obj
+    del first
+
+    second = pool.acquire(80)
+    assert second.obj is base
+    assert len(second) == 80
+
+
+def test_referenced_buffer_is_not_reused():
+    """Test buffer is not handed out while its data is referenced"""
+    pool = ReceiveBufferPool(2)
+    view = pool.acquire(16)
+    wrapped = np.frombuffer(view[:8], dtype=np.int64)
+    del view
+
+    other = pool.acquire(16)
+    assert other.obj is not wrapped.base.obj
+    assert len(pool.buffers) == 2
+
+
+def test_pool_does_not_grow_over_limit():
+    """Test buffers above max_buffers are allocated without pooling"""
+    pool = ReceiveBufferPool(1)
+    views = [pool.acquire(8) for _ in range(3)]
+
+    assert len({id(view.obj) for view in views}) == 3
+    assert len(pool.buffers) == 1
+
+
+def test_small_buffer_is_replaced():
+    """Test free buffer which is too small is replaced by a bigger one"""
+    pool = ReceiveBufferPool(1)
+    pool.acquire(8).release()
+    view = pool.acquire(32)
+
+    assert len(pool.buffers) == 1
+    assert view.obj is pool.buffers[0]
+    assert len(pool.buffers[0]) == 32
+
+
+def test_fetch_reuses_chunk_buffer():
+    """Test chunks decoded to rows are received into the same buffer"""
+    columns = [column("i", ["ftInt", 4, 0], nullable=True), column("t", ["ftBlob", 0, 0], nullable=True, tvc=True)]
+    cur = mock_cursor(columns, [[(1, "a"), (None, "bc")], [(3, "d")], [(4, None)]])
+
+    assert cur.fetchmany(2) == [(1, "a"), (None, "bc")]
+    assert cur.fetchall() == [(3, "d"), (4, None)]
+    assert len(cur.receive_pool.buffers) == 1
+
+
+def test_pool_follows_prefetch_depth():
+    """Test pool is resized when prefetch_depth of cursor is changed"""
+    cur = mock_cursor([column("i", ["ftInt", 4, 0])], [[(1,)], [(2,)], [(3,)]])
+    assert cur.receive_pool.max_buffers == 2
+
+    cur.prefetch_depth = 4
+    assert cur.fetchall() == [(1,), (2,), (3,)]
+    assert cur.receive_pool.max_buffers == 6
+
+    pool = ReceiveBufferPool(3)
+    views = [pool.acquire(8) for _ in range(3)]
+    pool.resize(1)
+    assert len(pool.buffers) == 1 and bytes(views[2]) == bytes(8)
@@ -0,0 +1,52 @@
+"""Test buffer of parsed rows used by fetchone / fetchmany"""
+from pysqream.row_buffer import RowBuffer
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+def make_buffer(*chunks) -> RowBuffer:
+    """Utility to create buffer with given chunks of rows"""
+    buffer = RowBuffer()
+    for chunk in chunks:
+        buffer.append(list(chunk))
+    return buffer
+
+
+def test_take_across_chunks():
+    """Test take returns rows in order crossing bounds of chunks"""
+    buffer = make_buffer(range(0, 3), range(3, 5), range(5, 10))
+
+    assert buffer.take(1) == [0]
+    assert buffer.take(4) == [1, 2, 3, 4]
+    assert len(buffer) == 5
+    assert buffer.take(2) == [5, 6]
+    assert buffer.take(-1) == [7, 8, 9]
+    assert len(buffer) == 0
+    assert buffer.take(3) == []
+
+
+def test_take_more_than_available():
+    """Test take of more rows than buffered returns all of them"""
+    buffer = make_buffer(range(3))
+
+    assert buffer.take(10) == [0, 1, 2]
+    assert not buffer
+
+
+def test_iter_drains_buffer():
+    """Test iteration returns rest of rows and empties buffer"""
+    buffer = make_buffer(range(0, 3), range(3, 5))
+    buffer.take(2)
+
+    assert list(buffer) == [2, 3, 4]
+    assert len(buffer) == 0
+
+
+def test_fetchone_and_fetchmany_across_chunks():
+    """Test fetch methods of cursor with chunked result"""
+    cur = mock_cursor([column("i", ["ftInt", 4, 0])], [[(1,), (2,), (3,)], [(4,)], [(5,), (6,)]])
+
+    assert cur.fetchone() == (1,)
+    assert cur.fetchmany(3) == [(2,), (3,), (4,)]
+    assert cur.fetchone() == (5,)
+    assert cur.fetchall() == [(6,)]
+    assert cur.fetchone() is None
@@ -0,0 +1,111 @@
+"""Test rows made by row factory instead of tuples"""
+from dataclasses import dataclass, field
+from datetime import date
+
+import pytest
+
+from pysqream.utils import ProgrammingError
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [
+    column("id", ["ftInt", 4, 0]),
+    column("name", ["ftBlob", 0, 0], tvc=True),
+    column("day", ["ftDate", 4, 0], nullable=True),
+]
+CHUNKS = [[(1, "a", date(2020, 1, 1)), (2, "b", None)], [(3, "c", date(2021, 5, 6))]]
+ROWS = [row for chunk in CHUNKS for row in chunk]
+
+
+@dataclass
+class Item:
+    """Dataclass with fields in order of columns"""
+    id: int
+    name: str
+    day: date
+
+
+@dataclass
+class Other:
+    """Dataclass with fields in other order and a default"""
+    day: date
+    name: str
+    id: int
+    tags: list = field(default_factory=list)
+
+
+def cursor(row_factory):
+    """Utility to create cursor with given row_factory option"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.row_factory = row_factory
+    return cur
+
+
+def test_namedtuple():
+    """Test rows are namedtuples with fields of columns"""
+    rows = cursor('namedtuple').fetchall()
+
+    assert rows == ROWS
+    assert [row.name for row in rows] == ["a", "b", "c"]
+    assert type(rows[0]) is type(rows[2])
+
+
+def test_dict():
+    """Test rows are dicts by column name, in fetchone, fetchmany and iteration"""
+    cur = cursor('dict')
+    expected = [dict(zip(["id", "name", "day"], row)) for row in ROWS]
+
+    assert cur.fetchone() == expected[0]
+    assert cur.fetchmany(2) == expected[1:]
+    assert list(cursor('dict')) == expected
+
+
+@pytest.mark.parametrize("cls", [Item, Other])
+def test_dataclass(cls):
+    """Test rows are instances of dataclass filled by columns of the same name"""
+    rows = cursor(cls).fetchall()
+
+    assert rows == [cls(id=row[0], name=row[1], day=row[2]) for row in ROWS]
+
+
+def test_callable():
+    """Test rows are made by callable from values of row"""
+    assert list(cursor(lambda *values: list(values))) == [list(row) for row in ROWS]
+
+
+def test_precedence_over_lazy_rows():
+    """Test row factory is used even if lazy rows are set"""
+    cur = cursor('dict')
+    cur.lazy_rows = True
+
+    assert cur.fetchall()[1] == {"id": 2, "name": "b", "day": None}
+
+
+def test_invalid_factory():
+    """Test unknown factory and dataclass which does not fit columns"""
+    @dataclass
+    class Missing:
+        """Dataclass without field of column"""
+        id: int
+        name: str
+
+    with pytest.raises(ProgrammingError):
+        cursor('set').fetchall()
+    with pytest.raises(ProgrammingError):
+        cursor(Missing).fetchall()
+
+
+def test_hostile_column_names():
+    """Test names of columns are used only as data"""
+    names = ["a); import os; (", "b'\"", "שם", "__class__"]
+    columns = [column(name, ["ftInt", 4, 0]) for name in names]
+    chunks = [[(1, 2, 3, 4)]]
+
+    cur = mock_cursor(columns, chunks)
+    cur.row_factory = 'dict'
+    assert cur.fetchall() == [dict(zip(names, (1, 2, 3, 4)))]
+
+    cur = mock_cursor(columns, chunks)
+    cur.row_factory = 'namedtuple'
+    row = cur.fetchone()
+    assert row == (1, 2, 3, 4) and row._fields == ("_0", "_1", "שם", "_3")
@@ -0,0 +1,129 @@
+"""Test spill of prefetched chunks to disk"""
+import gc
+import mmap
+import warnings
+
+import pytest
+
+from pysqream.spill import SpillFile, SpilledChunk
+from tests.test_cursor.mock_fetch import column, mock_cursor
+from tests.test_cursor.test_prefetch import wait_for
+
+
+COLUMNS = [column("i", ["ftInt", 4, 0], nullable=True), column("t", ["ftBlob", 0, 0], tvc=True)]
+CHUNKS = [[(i, str(i)) for i in range(start, start + 3)] for start in range(0, 15, 3)]
+ROWS = [row for chunk in CHUNKS for row in chunk]
+
+
+@pytest.fixture(name="cursor")
+def spilling_cursor():
+    """Cursor which prefetches whole result and keeps in memory one chunk"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.prefetch_depth = 10
+    cur.prefetch_max_bytes = 1024
+    cur.max_buffered_bytes = 30
+    yield cur
+    cur.close_stmt()
+
+
+def test_spill_file_round_trip():
+    """Test chunks are mapped back as they were written"""
+    spill_file = SpillFile()
+    first = spill_file.write([memoryview(b'abc'), memoryview(b'')])
+    second = spill_file.write([memoryview(b'de'), memoryview(b'fgh')])
+
+    assert second.offset % mmap.ALLOCATIONGRANULARITY == 0
+    assert [bytes(buf) for buf in first.load()] == [b'abc', b'']
+    loaded = second.load()
+    spill_file.close()
+    assert [bytes(buf) for buf in loaded] == [b'de', b'fgh']
+
+
+def test_loaded_chunk_is_writable():
+    """Test mapped buffers could be changed without touching the file"""
+    spill_file = SpillFile()
+    chunk = spill_file.write([memoryview(b'abc')])
+    buf = chunk.load()[0]
+    buf[0] = ord('x')
+
+    assert bytes(buf) == b'xbc'
+    assert bytes(chunk.load()[0]) == b'abc'
+    spill_file.close()
+
+
+def test_chunks_over_budget_are_spilled(cursor):
+    """Test prefetched chunks above budget are kept on disk"""
+    assert cursor.fetchone() == ROWS[0]
+    assert wait_for(lambda: cursor.prefetcher.finished)
+
+    spilled = [isinstance(columns, SpilledChunk) for _, columns, _ in cursor.prefetcher.chunks]
+    assert any(spilled)
+    assert cursor.prefetcher.buffered_bytes <= cursor.max_buffered_bytes
+
+    assert cursor.fetchall() == ROWS[1:]
+    assert not cursor.open_statement
+    assert cursor.prefetcher is None
+
+
+def test_spilled_chunks_fetch_numpy(cursor):
+    """Test columnar fetch over spilled chunks"""
+    result = cursor.fetch_numpy()
+
+    assert result["i"].tolist() == [row[0] for row in ROWS]
+    assert result["t"].tolist() == [row[1] for row in ROWS]
+
+
+def test_no_spill_without_budget():
+    """Test chunks stay in memory by default"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.prefetch_depth = 10
+    cur.prefetch_max_bytes = 1024
+    cur.fetchone()
+    assert wait_for(lambda: cur.prefetcher.finished)
+
+    assert not any(isinstance(columns, SpilledChunk) for _, columns, _ in cur.prefetcher.chunks)
+    assert cur.prefetcher.spill_file is None
+    cur.close_stmt()
+
+
+def test_lazy_chunks_over_budget_are_spilled():
+    """Test chunks kept by lazy rows without prefetch are spilled above
+    budget and are counted only while their rows exist"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.lazy_rows = True
+    cur.max_buffered_bytes = 30
+
+    rows = cur.fetchmany(9)
+    spilled = [isinstance(row.chunk._raw_columns[0]['data_column'].obj, mmap.mmap)  # pylint: disable=protected-access
+               for row in rows[::3]]
+    assert spilled == [False, True, True]
+    assert rows == ROWS[:9]
+    assert cur.spill_file is not None
+    assert 0 < cur.held_bytes <= cur.max_buffered_bytes
+
+    del rows
+    gc.collect()
+    assert cur.held_bytes == 0
+
+    chunks = list(cur.iter_chunks())
+    assert [list(chunk.column(0)) for chunk in chunks] == [[row[0] for row in chunk] for chunk in CHUNKS[3:]]
+    assert cur.spill_file is None
+
+
+def test_warning_for_tuple_rows_without_prefetch():
+    """Test budget which could not bound fetch of tuples is reported"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.max_buffered_bytes = 30
+
+    with pytest.warns(UserWarning, match="max_buffered_bytes"):
+        assert cur.fetchall() == ROWS
+
+
+def test_no_warning_for_columnar_fetch():
+    """Test budget without prefetch is not reported by columnar fetch"""
+    cur = mock_cursor(COLUMNS, CHUNKS)
+    cur.max_buffered_bytes = 30
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert cur.fetch_numpy()["i"].tolist() == [row[0] for row in ROWS]
@@ -0,0 +1,58 @@
+"""Test vectorized decoding of DATE and DATETIME columns"""
+from datetime import date, datetime
+
+import numpy as np
+
+from pysqream.casting import (date_to_int,
+                              datetime_to_long,
+                              sq_date_to_py_date,
+                              sq_datetime_to_py_datetime,
+                              sq_dates_to_numpy,
+                              sq_datetimes_to_numpy)
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+COLUMNS = [column("d", ["ftDate", 4, 0], nullable=True), column("dt", ["ftDateTime", 8, 0])]
+ROWS = [
+    (date(1900, 1, 1), datetime(1900, 1, 1)),
+    (None, datetime(2000, 2, 29, 23, 59, 59, 999000)),
+    (date(9999, 12, 31), datetime(1970, 1, 1, 0, 0, 0, 1000)),
+]
+
+
+def test_dates_match_scalar_conversion():
+    """Test numpy conversion of dates agrees with sq_date_to_py_date"""
+    days = np.arange(date_to_int(date(1900, 1, 1)), date_to_int(date(9999, 12, 31)) + 1, 97, dtype=np.int32)
+
+    assert sq_dates_to_numpy(days).tolist() == [sq_date_to_py_date(day) for day in days.tolist()]
+
+
+def test_datetimes_match_scalar_conversion():
+    """Test numpy conversion of datetimes agrees with sq_datetime_to_py_datetime"""
+    values = np.array([datetime_to_long(dt) for _, dt in ROWS] + [datetime_to_long(datetime(2024, 7, 1, 12, 0, 5))],
+                      dtype=np.int64)
+
+    assert sq_datetimes_to_numpy(values).tolist() == [sq_datetime_to_py_datetime(val) for val in values.tolist()]
+
+
+def test_rows_with_nulls():
+    """Test row path keeps python dates and nulls"""
+    assert mock_cursor(COLUMNS, [ROWS]).fetchall() == ROWS
+
+
+def test_numpy_datetime64():
+    """Test columnar result holds datetime64 columns"""
+    res = mock_cursor(COLUMNS, [ROWS[:2], ROWS[2:]]).fetch_numpy()
+
+    assert res["d"].dtype == np.dtype("datetime64[D]")
+    assert res["d"].mask.tolist() == [False, True, False]
+    assert res["dt"].dtype == np.dtype("datetime64[ms]")
+    assert res["dt"].tolist() == [dt for _, dt in ROWS]
+
+
+def test_arrow_temporal():
+    """Test Arrow result is built from datetime64 columns"""
+    table = mock_cursor(COLUMNS, [ROWS]).fetch_arrow_table()
+
+    assert table.column("d").to_pylist() == [d for d, _ in ROWS]
+    assert table.column("dt").to_pylist() == [dt for _, dt in ROWS]
@@ -0,0 +1,67 @@
+"""Test memoized conversion of DATE and DATETIME values"""
+from datetime import date, datetime
+
+import numpy as np
+
+from pysqream.casting import date_to_int, datetime_to_long, sq_date_to_py_date, sq_datetime_to_py_datetime
+from pysqream.temporal_cache import TemporalCache
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+def days(*dates) -> np.ndarray:
+    """Utility to get SQream day numbers of dates"""
+    return np.array([date_to_int(dat) for dat in dates], dtype=np.int32)
+
+
+def test_dates_table_grows_across_columns():
+    """Test table of dates is extended and keeps its objects"""
+    cache = TemporalCache(1000)
+    first = cache.convert('ftDate', days(date(2020, 1, 1), date(2020, 1, 3), date(2020, 1, 1)))
+    assert first == [date(2020, 1, 1), date(2020, 1, 3), date(2020, 1, 1)]
+    assert first[0] is first[2]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    second = cache.convert('ftDate', days(date(2020, 1, 2), date(2019, 12, 31), date(2020, 1, 3)))
+    assert second == [date(2020, 1, 2), date(2019, 12, 31), date(2020, 1, 3)]
+    assert second[2] is first[1]
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_dates_out_of_table_size():
+    """Test dates far from each other are converted without table"""
+    values = np.arange(date_to_int(date(1900, 1, 1)), date_to_int(date(9999, 1, 1)), 999, dtype=np.int32)
+    cache = TemporalCache(1000)
+
+    assert cache.convert('ftDate', values) == [sq_date_to_py_date(day) for day in values.tolist()]
+    assert cache.hit_rate == 0
+
+
+def test_repeated_datetimes():
+    """Test datetimes which repeat are taken from LRU"""
+    values = np.array([datetime_to_long(datetime(2024, 1, 1, hour)) for hour in range(4)] * 100, dtype=np.int64)
+    cache = TemporalCache(2)
+
+    assert cache.convert('ftDateTime', values) == [sq_datetime_to_py_datetime(val) for val in values.tolist()]
+    assert cache.convert('ftDateTime', values[-8:]) == [datetime(2024, 1, 1, hour) for hour in range(4)] * 2
+    assert (cache.hits, cache.misses) == (396 + 6, 4 + 2)
+    assert len(cache._datetimes) == 2  # pylint: disable=protected-access
+
+
+def test_nulls():
+    """Test values of nulls are not converted"""
+    values = np.array([date_to_int(date(2000, 5, 5)), -10 ** 9, date_to_int(date(2000, 5, 6))], dtype=np.int32)
+    cache = TemporalCache(10)
+
+    assert cache.convert('ftDate', values, np.array([False, True, False])) == [date(2000, 5, 5), None, date(2000, 5, 6)]
+
+
+def test_cursor_rows_share_dates():
+    """Test rows of following chunks share dates converted once"""
+    rows = [(date(2020, 1, 1 + i % 3), datetime(2020, 1, 1, i % 2)) for i in range(30)]
+    columns = [column("d", ["ftDate", 4, 0]), column("dt", ["ftDateTime", 8, 0], nullable=True)]
+    cur = mock_cursor(columns, [rows[:15], rows[15:]])
+
+    fetched = cur.fetchall()
+    assert fetched == rows
+    assert fetched[0][0] is fetched[15][0]
+    assert cur.temporal_cache.hit_rate > 0.5
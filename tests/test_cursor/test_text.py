@@ -0,0 +1,73 @@
+"""Test offset based decoding of TEXT columns"""
+import mmap
+import struct
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from pysqream.casting import lengths_to_pairs, sq_texts_to_str, text_offsets
+from pysqream.columnar import strings_to_arrow
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+VALUES = ["", "abc", "שלום", "", "x" * 300, "emoji \U0001f600"]
+ROWS = [("a",), (None,), ("",), ("été",)]
+COLUMNS = [column("t", ["ftBlob", 0, 0], nullable=True, tvc=True)]
+
+
+def encode(values: list) -> tuple:
+    """Utility to encode values as SQream sends TEXT column"""
+    encoded = [val.encode('utf8') for val in values]
+    return memoryview(struct.pack(f'{len(encoded)}i', *map(len, encoded))).cast('i'), b''.join(encoded)
+
+
+def test_offsets_match_pairs():
+    """Test offsets agree with pairs generated from lengths"""
+    lengths, _ = encode(VALUES)
+    offsets = text_offsets(lengths).tolist()
+
+    assert list(zip(offsets, offsets[1:])) == list(lengths_to_pairs(lengths))
+
+
+def test_bulk_decoding():
+    """Test values decoded by offsets and by Arrow array"""
+    lengths, data = encode(VALUES)
+
+    assert sq_texts_to_str(lengths, data) == VALUES
+    assert strings_to_arrow(lengths, data).to_pylist() == VALUES
+
+
+@pytest.mark.parametrize("arrow", [True, False])
+def test_rows_with_nulls(monkeypatch, arrow):
+    """Test row path with and without pyarrow"""
+    monkeypatch.setattr("pysqream.cursor.ARROW", arrow)
+
+    assert mock_cursor(COLUMNS, [ROWS]).fetchall() == ROWS
+
+
+def test_invalid_utf8():
+    """Test invalid data is reported as by decoding values one by one"""
+    lengths, _ = encode(["ab"])
+
+    with pytest.raises(UnicodeDecodeError):
+        strings_to_arrow(lengths, b"\xff\xfe").to_pylist()
+    with pytest.raises(UnicodeDecodeError):
+        sq_texts_to_str(lengths, b"\xff\xfe")
+
+
+def test_offsets_beyond_2gib(tmp_path):
+    """Test offsets of data of 2 GiB and more do not wrap around and make
+    LargeStringArray. Data is a sparse file, values are not read"""
+    lengths = memoryview(struct.pack('3i', 2 ** 30, 2 ** 30 - 1, 1)).cast('i')
+    path = tmp_path / "data"
+    with open(path, "wb") as file:
+        file.truncate(2 ** 31)
+
+    assert text_offsets(lengths).tolist() == [0, 2 ** 30, 2 ** 31 - 1, 2 ** 31]
+    with open(path, "rb") as file:
+        data = memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+    assert strings_to_arrow(lengths[:2], data[:2 ** 31 - 1]).type == pa.string()
+    array = strings_to_arrow(lengths, data)
+    assert array.type == pa.large_string()
+    assert np.frombuffer(array.buffers()[1], dtype=np.int64).tolist() == [0, 2 ** 30, 2 ** 31 - 1, 2 ** 31]
@@ -0,0 +1,45 @@
+"""Test vectorized decoding of fixed size VARCHAR columns"""
+import numpy as np
+import pytest
+
+from pysqream.casting import sq_varchars_to_str
+from pysqream.columnar import varchars_to_arrow
+from tests.test_cursor.mock_fetch import column, mock_cursor
+
+
+SIZE = 6
+VALUES = [b"abc   ", b"      ", b"hello!", b"a b\t\n ", b"x\x00y\x00\x00\x00", b"\x00\x00\x00\x00\x00\x00", b" lead "]
+NON_ASCII = [b"caf\xe9  ", b"\xa0\xa0ab\xa0 "]
+
+
+def per_value(data: bytes, encoding: str) -> list:
+    """Utility to decode values one by one as cursor did before"""
+    return [data[idx:idx + SIZE].decode(encoding, "ignore").replace('\x00', '').rstrip()
+            for idx in range(0, len(data), SIZE)]
+
+
+@pytest.mark.parametrize("values, encoding", [(VALUES, "ascii"), (VALUES, "utf8"), (VALUES + NON_ASCII, "latin-1"),
+                                              (VALUES + NON_ASCII, "ascii"), (VALUES, "utf-16-le")])
+def test_matches_per_value_decoding(values, encoding):
+    """Test bulk decoding and Arrow array give the same strings"""
+    data = b''.join(values)
+    expected = per_value(data, encoding)
+
+    assert sq_varchars_to_str(data, SIZE, encoding) == expected
+    assert varchars_to_arrow(data, SIZE, encoding).to_pylist() == expected
+
+
+def test_arrow_with_nulls():
+    """Test Arrow array keeps nulls given by mask"""
+    mask = np.array([False, True] + [False] * (len(VALUES) - 2))
+
+    assert varchars_to_arrow(b''.join(VALUES), SIZE, "ascii", mask).to_pylist()[:3] == ["abc", None, "hello!"]
+
+
+def test_rows_and_arrow_from_cursor():
+    """Test row and Arrow results of nullable VARCHAR column"""
+    rows = [("ab",), (None,), ("",), ("abcde",)]
+    columns = [column("v", ["ftVarchar", 5, 0], nullable=True)]
+
+    assert mock_cursor(columns, [rows]).fetchall() == rows
+    assert mock_cursor(columns, [rows]).fetch_arrow_table().column("v").to_pylist() == [val for val, in rows]